@@ -10,7 +10,7 @@ from alembic import context
 
 from app.config import get_settings
 from app.db.base import Base
-from app.db.models import User, Item  # noqa: F401 - ensure models are registered
+from app.db.models import User, Item, OutboxEvent  # noqa: F401 - ensure models are registered
 
 config = context.config
 if config.config_file_name is not None:
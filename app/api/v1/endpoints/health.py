@@ -1,11 +1,15 @@
 """
 Health checks - for load balancers, Kubernetes, and monitoring.
-Challenge: Fast liveness; optional dependency checks for readiness.
+Challenge: Fast liveness; readiness that reflects dependencies without adding load.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 
 from app.config import get_settings
+from app.core.circuit_breaker import OPEN, breaker_states
+from app.core.readiness import check_dependencies
+from app.core.resources import resources
 
 router = APIRouter()
 settings = get_settings()
@@ -19,5 +23,30 @@ async def health():
 
 @router.get("/ready")
 async def ready():
-    """Readiness: can accept traffic? (DB/Redis could be checked here.)"""
-    return {"status": "ready"}
+    """
+    Readiness: can accept traffic? 503 until client pools are warmed, again once shutdown begins,
+    and while a required dependency (settings.readiness_required) fails its ping.
+    Dependency pings run concurrently with tight timeouts; the result is cached for a few seconds.
+    A failing optional dependency or an open circuit means degraded, not unready (cache and search
+    fall back, so pulling every replica out of rotation would only make it worse).
+    """
+    if not resources.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "not_ready", "resources": resources.states()},
+        )
+    deps = await check_dependencies()
+    circuits = breaker_states()
+    body = {
+        "status": "ready" if deps["ready"] else "not_ready",
+        "degraded": deps["degraded"]
+        or any(state == OPEN for state in circuits.values()),
+        "checks": deps["checks"],
+        "circuits": circuits,
+        "resources": resources.states(),
+    }
+    if not deps["ready"]:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body
+        )
+    return body
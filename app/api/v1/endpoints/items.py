@@ -10,8 +10,19 @@ from app.db.session import DbSession
 from app.db.repositories.item_repository import ItemRepository
 from app.db.repositories.user_repository import UserRepository
 from app.services.item_service import ItemService
-from app.schemas.item import ItemCreate, ItemUpdate, ItemWithOwnerResponse
+from app.schemas.item import (
+    ItemBulkCreateRequest,
+    ItemBulkDeleteRequest,
+    ItemBulkDeleteResponse,
+    ItemBulkUpdateRequest,
+    ItemCreate,
+    ItemPage,
+    ItemUpdate,
+    ItemWithOwnerResponse,
+)
 from app.core.dependencies import CurrentUserId
+from app.core.pagination import decode_cursor
+from app.core.responses import JSONBytesResponse, OrjsonResponse, json_array
 from app.config import get_settings
 
 router = APIRouter()
@@ -23,25 +34,115 @@ def _get_item_service(session: DbSession) -> ItemService:
     return ItemService(ItemRepository(session), UserRepository(session))
 
 
-@router.get("", response_model=list[ItemWithOwnerResponse])
+@router.get("", response_model=list[ItemWithOwnerResponse] | ItemPage)
 async def list_items(
     session: DbSession,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=settings.max_page_size),
+    after: str | None = Query(
+        None,
+        description="Cursor mode: pass empty for the first page, then next_cursor from the previous page.",
+    ),
 ):
-    """List items with pagination. REST: GET /items?skip=0&limit=20."""
+    """
+    List items with pagination. REST: GET /items?skip=0&limit=20 (list, legacy offset mode).
+    Cursor mode: GET /items?after=&limit=20 returns {items, next_cursor}; deep pages cost the same as page one.
+    """
     svc = _get_item_service(session)
-    return await svc.list_items(skip=skip, limit=limit)
+    # Service returns plain dicts; responding directly skips response_model re-validation
+    if after is None:
+        return OrjsonResponse(await svc.list_items(skip=skip, limit=limit))
+    try:
+        after_id = decode_cursor(after) if after else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return OrjsonResponse(await svc.list_items_page(after_id=after_id, limit=limit))
+
+
+@router.get("/batch", response_model=list[ItemWithOwnerResponse])
+async def get_items_batch(
+    session: DbSession,
+    ids: str = Query(..., description="Comma-separated item ids, e.g. 1,2,3"),
+):
+    """
+    Get many items in one call (carts, wishlists). Returns found items in request order;
+    unknown ids are skipped. Costs ~3 round trips (Redis MGET, one DB query, one pipelined SETEX).
+    """
+    try:
+        requested = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="ids must be integers")
+    unique_ids = list(dict.fromkeys(requested))
+    if not unique_ids:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="ids is required")
+    if len(unique_ids) > settings.max_page_size:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.max_page_size} ids per request",
+        )
+    svc = _get_item_service(session)
+    return JSONBytesResponse(json_array(await svc.get_many_json_by_ids(unique_ids)))
+
+
+def _check_bulk_size(count: int) -> None:
+    if count > settings.bulk_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.bulk_max_items} items per request",
+        )
+
+
+def _owner_scope(user_id: int) -> int | None:
+    """Owner whose items the caller may change in bulk: their own, or any (None) for admin_user_ids."""
+    return None if user_id in settings.admin_user_ids else user_id
+
+
+@router.post("/bulk", response_model=list[ItemWithOwnerResponse], status_code=status.HTTP_201_CREATED)
+async def bulk_create_items(session: DbSession, data: ItemBulkCreateRequest, user_id: CurrentUserId):
+    """Create many items in one request (importers). Batched INSERT and batched indexing."""
+    _check_bulk_size(len(data.items))
+    svc = _get_item_service(session)
+    try:
+        return await svc.bulk_create(data.items)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
+@router.put("/bulk", response_model=list[ItemWithOwnerResponse])
+async def bulk_update_items(session: DbSession, data: ItemBulkUpdateRequest, user_id: CurrentUserId):
+    """Update many items by id in one request. Unknown ids and other owners' items (unless the
+    caller is in admin_user_ids) are skipped."""
+    _check_bulk_size(len(data.items))
+    svc = _get_item_service(session)
+    return await svc.bulk_update(data.items, owner_id=_owner_scope(user_id))
+
+
+@router.post("/bulk/delete", response_model=ItemBulkDeleteResponse)
+async def bulk_delete_items(session: DbSession, data: ItemBulkDeleteRequest, user_id: CurrentUserId):
+    """
+    Delete many items by ids, or every item of an owner. Only the caller's own items are
+    deleted (any owner's for admin_user_ids); other ids are skipped. Search index cleanup
+    happens asynchronously through the outbox relay.
+    """
+    svc = _get_item_service(session)
+    owner_scope = _owner_scope(user_id)
+    if data.owner_id is not None:
+        if owner_scope not in (None, data.owner_id):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to delete this owner's items")
+        return ItemBulkDeleteResponse(deleted=await svc.delete_owner_items(data.owner_id))
+    _check_bulk_size(len(data.ids))
+    deleted = await svc.bulk_delete(data.ids, owner_id=owner_scope)
+    return ItemBulkDeleteResponse(deleted=len(deleted))
 
 
 @router.get("/{item_id}", response_model=ItemWithOwnerResponse)
 async def get_item(session: DbSession, item_id: int):
-    """Get single item. Uses Redis cache for performance."""
+    """Get single item. Uses Redis cache for performance; cached JSON bytes are sent as is."""
     svc = _get_item_service(session)
-    item = await svc.get_by_id(item_id)
-    if not item:
+    body = await svc.get_json_by_id(item_id)
+    if not body:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
-    return item
+    return JSONBytesResponse(body)
 
 
 @router.post("", response_model=ItemWithOwnerResponse, status_code=status.HTTP_201_CREATED)
@@ -64,7 +165,7 @@ async def update_item(session: DbSession, item_id: int, data: ItemUpdate, user_i
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_item(session: DbSession, item_id: int, user_id: CurrentUserId):
-    """Delete item. Removes from DB, cache, and search index."""
+    """Delete item. Removes from DB and cache; search index follows via the outbox relay."""
     svc = _get_item_service(session)
     ok = await svc.delete(item_id)
     if not ok:
@@ -1,23 +1,91 @@
 """
 Search endpoint - Elasticsearch full-text search (job requirement).
 Challenge: Expose search API, pagination, graceful fallback if ES down.
+Design: Offset mode for shallow, cached pages; cursor mode (PIT + search_after) for deep scrolling;
+/suggest answers typeahead from an edge n-gram subfield instead of the fuzzy full-text query.
+Results are plain JSON from ES (or the PostgreSQL fallback) and are rendered with orjson directly.
 """
 
-from fastapi import APIRouter, Query
+from elasticsearch import NotFoundError
+from fastapi import APIRouter, HTTPException, Query, status
 
-from app.search.elasticsearch_client import search_items
+from app.core.pagination import decode_token, encode_token
+from app.core.responses import OrjsonResponse
+from app.search.elasticsearch_client import search_items_after, suggest_items
+from app.search.search_cache import search_items_cached
 from app.config import get_settings
 
 router = APIRouter()
 settings = get_settings()
 
 
+def _decode_search_cursor(cursor: str) -> tuple[str, list]:
+    """Return (pit_id, search_after) from an opaque search cursor. Raises ValueError."""
+    data = decode_token(cursor)
+    pit_id, search_after = data.get("pit"), data.get("sa")
+    if (
+        not isinstance(pit_id, str)
+        or not isinstance(search_after, list)
+        or not search_after
+    ):
+        raise ValueError("Invalid cursor")
+    return pit_id, search_after
+
+
 @router.get("/items")
 async def search_items_endpoint(
     q: str = Query(..., min_length=1),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    facets: bool = Query(
+        False, description="Include price histogram and top owners (offset mode)."
+    ),
+    after: str | None = Query(
+        None,
+        description="Cursor mode: pass empty for the first page, then next_cursor from the previous page.",
+    ),
+):
+    """
+    Full-text search on items (title, description) via Elasticsearch. Popular queries served from cache.
+    total is the real hit count (exact up to search_track_total_hits, see total_relation); facets=true
+    adds aggregations computed by the same ES request.
+    Cursor mode: GET /search/items?q=...&after= returns next_cursor; pages come from one consistent
+    snapshot and are not limited by the 10k from+size window.
+    """
+    if after is None:
+        result = await search_items_cached(
+            query=q, skip=skip, limit=limit, facets=facets
+        )
+        return OrjsonResponse({"query": q, **result, "count": len(result["results"])})
+    try:
+        pit_id, search_after = _decode_search_cursor(after) if after else (None, None)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    try:
+        hits, pit_id, search_after = await search_items_after(
+            q, limit, pit_id, search_after
+        )
+    except NotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor expired"
+        )
+    except Exception:
+        # Unlike offset mode, an empty page here would silently end the client's scroll
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Search unavailable"
+        )
+    next_cursor = encode_token({"pit": pit_id, "sa": search_after}) if pit_id else None
+    return OrjsonResponse(
+        {"query": q, "results": hits, "count": len(hits), "next_cursor": next_cursor}
+    )
+
+
+@router.get("/suggest")
+async def suggest_items_endpoint(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
 ):
-    """Full-text search on items (title, description) via Elasticsearch."""
-    hits = await search_items(query=q, skip=skip, limit=limit)
-    return {"query": q, "results": hits, "count": len(hits)}
+    """Search-as-you-type: ids and titles whose title words start with q. Cheap enough for every keystroke."""
+    return OrjsonResponse({"query": q, "suggestions": await suggest_items(q, limit)})
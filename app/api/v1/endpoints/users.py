@@ -9,12 +9,26 @@ from app.db.session import DbSession
 from app.db.repositories.user_repository import UserRepository
 from pydantic import BaseModel, Field
 from app.schemas.user import UserCreate, UserResponse
-from app.core.security import hash_password, create_access_token, verify_password
+from app.core.security import (
+    PasswordHashBusy,
+    create_access_token,
+    hash_password_async,
+    verify_password_async,
+)
 from app.core.dependencies import CurrentUserId
 
 router = APIRouter()
 
 
+def _hash_busy() -> HTTPException:
+    """503 when the password hashing pool is saturated (load shedding during login storms)."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 class LoginRequest(BaseModel):
     email: str
     password: str = Field(..., min_length=1, max_length=72)
@@ -31,9 +45,13 @@ async def register(session: DbSession, data: UserCreate):
             detail="Email already registered",
         )
     from app.db.models.user import User
+    try:
+        hashed_password = await hash_password_async(data.password)
+    except PasswordHashBusy:
+        raise _hash_busy()
     user = User(
         email=data.email,
-        hashed_password=hash_password(data.password),
+        hashed_password=hashed_password,
         full_name=data.full_name,
     )
     user = await repo.add(user)
@@ -45,7 +63,11 @@ async def login(session: DbSession, data: LoginRequest):
     """Authenticate and return JWT."""
     repo = UserRepository(session)
     user = await repo.get_by_email(data.email)
-    if not user or not verify_password(data.password, user.hashed_password):
+    try:
+        valid = user is not None and await verify_password_async(data.password, user.hashed_password)
+    except PasswordHashBusy:
+        raise _hash_busy()
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
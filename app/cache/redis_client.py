@@ -1,60 +1,495 @@
 """
 Redis client - caching and related use cases (job requirement).
 Challenge: Connection pooling, fail gracefully when Redis is down.
-Design: Single client instance, dependency injection for testability.
+Design: Single client instance, dependency injection for testability. Every call goes through
+the "redis" circuit breaker with a short socket timeout, so a dead Redis costs microseconds.
 """
 
+import asyncio
 import json
+import logging
+import math
+import os
+import random
+import struct
+import time
+import uuid
+import zlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
-from redis.asyncio import Redis
+from redis import Redis as SyncRedis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.client import NEVER_DECODE
 
 from app.config import get_settings
+from app.core.circuit_breaker import register_breaker
+from app.core.metrics import CACHE_COALESCED_REQUESTS, CACHE_EARLY_REFRESHES, CACHE_STALE_SERVED, timed
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+REDIS_BREAKER = register_breaker(
+    "redis", settings.redis_breaker_failure_threshold, settings.redis_breaker_reset_seconds
+)
+
 # Shared async Redis client (connection pool managed by redis-py)
 _redis: Redis | None = None
 
+# Sync client for Celery workers (per process; pid check guards against fork inheritance)
+_sync_redis: SyncRedis | None = None
+_sync_redis_pid: int | None = None
+
 
 async def get_redis() -> Redis:
     """Get Redis connection. Used as FastAPI dependency."""
     global _redis
     if _redis is None:
-        _redis = Redis.from_url(
+        # Bounded pool (this worker's share); waiting for a free connection is bounded like a call
+        pool = BlockingConnectionPool.from_url(
             settings.redis_url,
+            max_connections=settings.pool_share(settings.redis_max_connections),
+            timeout=settings.redis_socket_timeout_seconds,
             encoding="utf-8",
             decode_responses=True,
+            # Cache is an optimization: a slow Redis must not cost more than the DB it fronts
+            socket_timeout=settings.redis_socket_timeout_seconds,
+            socket_connect_timeout=settings.redis_socket_timeout_seconds,
         )
+        _redis = Redis.from_pool(pool)
     return _redis
 
 
+async def warm_up_redis(connections: int) -> None:
+    """Concurrent PINGs make the pool open (and keep) that many connections."""
+    client = await get_redis()
+    await asyncio.gather(*(client.ping() for _ in range(connections)))
+
+
+async def close_redis() -> None:
+    """Close the shared client and its pool (shutdown). A later get_redis() starts a new one."""
+    global _redis
+    if _redis is not None:
+        client, _redis = _redis, None
+        await client.aclose()
+
+
+async def ping_redis() -> None:
+    """Readiness: PING on the shared pool (bypasses the breaker so recovery is seen at once)."""
+    await (await get_redis()).ping()
+
+
+def get_sync_redis() -> SyncRedis:
+    """Sync Redis client for Celery workers (no event loop in fork)."""
+    global _sync_redis, _sync_redis_pid
+    if _sync_redis is None or _sync_redis_pid != os.getpid():
+        _sync_redis = SyncRedis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+        _sync_redis_pid = os.getpid()
+    return _sync_redis
+
+
+async def run_redis(op: Callable[[Redis], Awaitable[Any]]) -> Any:
+    """Run op(client) through the Redis breaker. Raises CircuitOpenError while Redis is known down."""
+
+    async def attempt() -> Any:
+        return await op(await get_redis())
+
+    return await REDIS_BREAKER.call(attempt)
+
+
+@timed("redis")
 async def cache_get(key: str) -> str | None:
     """Get value from cache. Returns None if miss or error (graceful degradation)."""
     try:
-        client = await get_redis()
-        return await client.get(key)
+        return await run_redis(lambda client: client.get(key))
     except Exception:
         return None
 
 
-async def cache_set(key: str, value: str | dict[str, Any], ttl_seconds: int = 300) -> bool:
-    """Set value in cache with TTL. Dict is JSON-serialized."""
+@timed("redis")
+async def cache_get_bytes(key: str) -> bytes | None:
+    """Like cache_get, but returns the raw bytes (no UTF-8 decode; for binary values)."""
     try:
-        client = await get_redis()
-        if isinstance(value, dict):
-            value = json.dumps(value)
-        await client.setex(key, ttl_seconds, value)
+        return await run_redis(lambda client: client.execute_command("GET", key, **{NEVER_DECODE: True}))
+    except Exception:
+        return None
+
+
+@timed("redis")
+async def cache_set(key: str, value: str | bytes | dict[str, Any], ttl_seconds: int = 300) -> bool:
+    """Set value in cache with TTL. Dict is JSON-serialized; bytes are stored as-is."""
+    if isinstance(value, dict):
+        value = json.dumps(value)
+    try:
+        await run_redis(lambda client: client.setex(key, ttl_seconds, value))
         return True
     except Exception:
         return False
 
 
+@timed("redis")
 async def cache_delete(key: str) -> bool:
     """Invalidate cache key (e.g. after item update)."""
     try:
-        client = await get_redis()
-        await client.delete(key)
+        await run_redis(lambda client: client.delete(key))
         return True
     except Exception:
         return False
+
+
+@timed("redis")
+async def cache_delete_many(keys: list[str]) -> bool:
+    """Invalidate many keys with a single DEL (bulk updates/deletes)."""
+    if not keys:
+        return True
+    try:
+        await run_redis(lambda client: client.delete(*keys))
+        return True
+    except Exception:
+        return False
+
+
+@timed("redis")
+async def cache_invalidate(keys: list[str], channel: str, message: str) -> bool:
+    """DEL keys and PUBLISH the invalidation to other replicas in one pipelined round trip."""
+
+    async def invalidate(client: Redis) -> None:
+        async with client.pipeline(transaction=False) as pipe:
+            if keys:
+                pipe.delete(*keys)
+            pipe.publish(channel, message)
+            await pipe.execute()
+
+    try:
+        await run_redis(invalidate)
+        return True
+    except Exception:
+        return False
+
+
+# --- Stampede protection: single-flight loads, early refresh, stale-while-revalidate ---
+#
+# Entries are stored as an envelope {"v": value, "t": soft_expiry_epoch, "d": load_seconds}.
+# The Redis key lives ttl + stale_ttl seconds. Past "t" the value is stale but still served
+# to everyone except the one caller that holds the refresh lock and reloads it in-band.
+# Before "t", a caller may refresh early with probability growing as expiry nears
+# (XFetch: now - d * beta * ln(rand) >= t), so hot keys rarely expire at all.
+#
+# Callers that cache ready-made bytes (e.g. a response body) pass a BinaryCodec instead: the entry
+# is a fixed header plus the body, read without UTF-8 decoding, so a hit is a header unpack and a
+# slice - no JSON parse, and the caller gets back exactly the bytes it stored.
+
+_LOCK_PREFIX = "lock:"
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# In-process single flight: key -> future of the load already running in this worker
+_inflight: dict[str, asyncio.Future] = {}
+
+
+# Binary entry header: format, flags, payload schema, soft expiry (epoch), load seconds
+_BINARY_HEADER = struct.Struct(">BBHdf")
+_BINARY_FORMAT = 1
+_FLAG_ZLIB = 0x01
+
+
+@dataclass(frozen=True)
+class BinaryCodec:
+    """
+    Envelope for bytes values. schema is the caller's payload version: bump it when the bytes
+    change shape and older entries read as misses. Bodies of at least compress_min_bytes are
+    zlib-compressed (0 = never).
+    """
+
+    schema: int
+    compress_min_bytes: int = 0
+
+    def encode(self, body: bytes, soft_expiry: float, load_seconds: float) -> bytes:
+        flags = 0
+        if self.compress_min_bytes and len(body) >= self.compress_min_bytes:
+            body = zlib.compress(body, 1)
+            flags |= _FLAG_ZLIB
+        return _BINARY_HEADER.pack(_BINARY_FORMAT, flags, self.schema, soft_expiry, load_seconds) + body
+
+    def decode(self, raw: bytes) -> dict[str, Any] | None:
+        """Envelope dict like the JSON entries ({"v": body, "t", "d"}), or None if not ours."""
+        if len(raw) < _BINARY_HEADER.size:
+            return None
+        fmt, flags, schema, soft_expiry, load_seconds = _BINARY_HEADER.unpack_from(raw)
+        if fmt != _BINARY_FORMAT or schema != self.schema:
+            return None
+        body = raw[_BINARY_HEADER.size :]
+        if flags & _FLAG_ZLIB:
+            try:
+                body = zlib.decompress(body)
+            except zlib.error:
+                return None
+        return {"v": body, "t": soft_expiry, "d": load_seconds}
+
+
+def _decode_entry(raw: str | bytes | None, codec: BinaryCodec | None) -> dict[str, Any] | None:
+    """Envelope from a stored value. Values in another format (e.g. written by older code) count as a miss."""
+    if not raw:
+        return None
+    if codec is not None:
+        return codec.decode(raw) if isinstance(raw, bytes) else None
+    try:
+        entry = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict) or "v" not in entry or "t" not in entry:
+        return None
+    return entry
+
+
+def _encode_entry(
+    value: Any, soft_expiry: float, load_seconds: float, codec: BinaryCodec | None
+) -> str | bytes:
+    if codec is not None:
+        return codec.encode(value, soft_expiry, load_seconds)
+    return json.dumps({"v": value, "t": soft_expiry, "d": load_seconds})
+
+
+async def _cache_get_entry(key: str, codec: BinaryCodec | None = None) -> dict[str, Any] | None:
+    raw = await (cache_get(key) if codec is None else cache_get_bytes(key))
+    return _decode_entry(raw, codec)
+
+
+async def _cache_set_entry(
+    key: str,
+    value: Any,
+    ttl_seconds: int,
+    stale_ttl_seconds: int,
+    load_seconds: float,
+    codec: BinaryCodec | None = None,
+) -> None:
+    entry = _encode_entry(value, time.time() + ttl_seconds, load_seconds, codec)
+    await cache_set(key, entry, ttl_seconds + stale_ttl_seconds)
+
+
+def _should_refresh_early(entry: dict[str, Any], now: float, beta: float) -> bool:
+    """XFetch: refresh before soft expiry with probability rising as expiry approaches."""
+    delta = max(float(entry.get("d") or 0.0), 0.001)
+    return now - delta * beta * math.log(1.0 - random.random()) >= entry["t"]
+
+
+async def _acquire_lock(key: str, ttl_ms: int) -> str | None:
+    """Try to take the cross-worker load lock. Returns token, "" if Redis is down, None if held."""
+    token = uuid.uuid4().hex
+    try:
+        acquired = await run_redis(lambda client: client.set(_LOCK_PREFIX + key, token, nx=True, px=ttl_ms))
+    except Exception:
+        return ""  # Redis down: no coordination possible, caller loads directly
+    return token if acquired else None
+
+
+async def _release_lock(key: str, token: str) -> None:
+    if not token:
+        return
+    try:
+        await run_redis(lambda client: client.eval(_RELEASE_LOCK_SCRIPT, 1, _LOCK_PREFIX + key, token))
+    except Exception:
+        pass  # Lock expires on its own (px)
+
+
+async def _single_flight(key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """Run fn once per key per worker; concurrent callers await the same result."""
+    fut = _inflight.get(key)
+    if fut is not None:
+        CACHE_COALESCED_REQUESTS.labels(scope="local").inc()
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            if not fut.cancelled():
+                raise  # this caller was cancelled, not the leader
+        return await fn()  # leader was cancelled; load ourselves
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await fn()
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved when nobody is waiting
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _load_and_store(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl_seconds: int,
+    stale_ttl_seconds: int,
+    codec: BinaryCodec | None = None,
+) -> Any:
+    start = time.perf_counter()
+    value = await loader()
+    if value is not None:
+        await _cache_set_entry(key, value, ttl_seconds, stale_ttl_seconds, time.perf_counter() - start, codec)
+    return value
+
+
+async def cache_get_or_load(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl_seconds: int = 300,
+    *,
+    stale_ttl_seconds: int = 60,
+    lock_ttl_ms: int = 5000,
+    lock_wait_seconds: float = 1.0,
+    beta: float = 1.0,
+    codec: BinaryCodec | None = None,
+) -> Any:
+    """
+    Cache-aside read with stampede protection. loader returns a JSON-serializable value
+    (bytes with codec), or None (not cached). At most one caller per key across all workers runs loader:
+    in-process callers share one future, other workers wait on a Redis lock and re-read.
+    Stale entries are served while the lock holder refreshes them.
+    """
+    entry = await _cache_get_entry(key, codec)
+    if entry is not None:
+        now = time.time()
+        stale = now >= entry["t"]
+        if not stale and not _should_refresh_early(entry, now, beta):
+            return entry["v"]
+        # Refresh needed: exactly one caller reloads, everyone else keeps the cached value
+        if key not in _inflight:
+            token = await _acquire_lock(key, lock_ttl_ms)
+            if token is not None:
+                if not stale:
+                    CACHE_EARLY_REFRESHES.inc()
+                try:
+                    return await _single_flight(
+                        key, lambda: _load_and_store(key, loader, ttl_seconds, stale_ttl_seconds, codec)
+                    )
+                except Exception as e:
+                    # Source down: the cached value beats an error (that is what stale_ttl is for)
+                    logger.warning("refresh of %s failed, serving cached value: %s", key, e)
+                finally:
+                    await _release_lock(key, token)
+        if stale:
+            CACHE_STALE_SERVED.inc()
+        return entry["v"]
+
+    async def load_on_miss() -> Any:
+        token = await _acquire_lock(key, lock_ttl_ms)
+        if token is None:
+            # Another worker is loading: wait for its result instead of hitting the DB too
+            deadline = time.monotonic() + lock_wait_seconds
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+                waited = await _cache_get_entry(key, codec)
+                if waited is not None:
+                    CACHE_COALESCED_REQUESTS.labels(scope="redis").inc()
+                    return waited["v"]
+        try:
+            return await _load_and_store(key, loader, ttl_seconds, stale_ttl_seconds, codec)
+        finally:
+            if token:
+                await _release_lock(key, token)
+
+    return await _single_flight(key, load_on_miss)
+
+
+@timed("redis")
+async def cache_get_many(keys: list[str], codec: BinaryCodec | None = None) -> list[Any | None]:
+    """
+    Batch read of cache_get_or_load entries with one MGET. Returns values in key order;
+    misses, stale entries and errors are None (caller reloads them).
+    """
+    if not keys:
+        return []
+    options = {} if codec is None else {NEVER_DECODE: True}
+    try:
+        raws = await run_redis(lambda client: client.execute_command("MGET", *keys, **options))
+    except Exception:
+        return [None] * len(keys)
+    now = time.time()
+    values: list[Any | None] = []
+    for raw in raws:
+        entry = _decode_entry(raw, codec)
+        fresh = entry is not None and now < entry["t"]
+        values.append(entry["v"] if fresh else None)
+    return values
+
+
+@timed("redis")
+async def cache_set_many(
+    values: dict[str, Any],
+    ttl_seconds: int = 300,
+    *,
+    stale_ttl_seconds: int = 60,
+    load_seconds: float = 0.0,
+    codec: BinaryCodec | None = None,
+) -> bool:
+    """Backfill many cache_get_or_load entries with one pipelined round trip of SETEX."""
+    if not values:
+        return True
+    soft_expiry = time.time() + ttl_seconds
+
+    async def write(client: Redis) -> None:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                entry = _encode_entry(value, soft_expiry, load_seconds, codec)
+                pipe.setex(key, ttl_seconds + stale_ttl_seconds, entry)
+            await pipe.execute()
+
+    try:
+        await run_redis(write)
+        return True
+    except Exception:
+        return False
+
+
+@timed("redis")
+async def cache_publish(channel: str, message: str) -> bool:
+    """Publish invalidation message to other API replicas (pub/sub). False if Redis is down."""
+    try:
+        await run_redis(lambda client: client.publish(channel, message))
+        return True
+    except Exception:
+        return False
+
+
+async def listen_for_invalidations(
+    handlers: dict[str, Callable[[str], Any]],
+    retry_seconds: float = 5.0,
+) -> None:
+    """
+    Consume pub/sub messages forever, dispatching each to handlers[channel].
+    Reconnects when Redis drops; messages missed meanwhile are bounded by local cache TTLs.
+    Run as a background task from the app lifespan; cancel to stop.
+    """
+    # Own connection without the request-path socket timeout: listen() blocks between messages
+    client = Redis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+    try:
+        while True:
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                try:
+                    await pubsub.subscribe(*handlers)
+                    async for message in pubsub.listen():
+                        handler = handlers.get(message["channel"])
+                        if handler is not None:
+                            handler(message["data"])
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("invalidation listener error (retry in %ss): %s", retry_seconds, e)
+                await asyncio.sleep(retry_seconds)
+    finally:
+        await client.aclose()
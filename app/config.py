@@ -44,10 +44,114 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 30
 
+    # Password hashing pool (bcrypt off the event loop). Calls beyond workers + max_queue get 503.
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 64
+
+    # In-process principal cache (skips DB on authenticated requests)
+    principal_cache_ttl_seconds: float = 30.0
+    principal_cache_max_size: int = 10_000
+
+    # Item detail L1 cache (in-process, in front of Redis); kept coherent via pub/sub
+    item_l1_cache_ttl_seconds: float = 30.0
+    item_l1_cache_max_size: int = 10_000
+    # Item detail in Redis: the response body as stored bytes (a hit is returned unchanged, no
+    # JSON parse) or the legacy JSON envelope; bodies of at least this many bytes are zlib-compressed
+    # (0 = never)
+    item_cache_binary: bool = True
+    item_cache_compress_min_bytes: int = 0
+
+    # Bulk item API: max items per request; docs per Celery indexing message
+    bulk_max_items: int = 5_000
+    # Users allowed to bulk-delete another owner's items (moderation); everyone else only their own
+    admin_user_ids: list[int] = []
+    index_batch_size: int = 500
+
+    # Outbox relay: events per poll, idle poll interval, and target ("elasticsearch" _bulk or "celery").
+    # An event whose document the target keeps rejecting is parked (dead-lettered) after this many
+    # attempts; an unreachable target does not count as an attempt
+    outbox_batch_size: int = 500
+    outbox_poll_interval_seconds: float = 0.5
+    outbox_relay_target: str = "elasticsearch"
+    outbox_max_attempts: int = 10
+
+    # Search engine: "elasticsearch" (fails over to PostgreSQL full-text) or "postgres" (no ES needed)
+    search_engine: str = "elasticsearch"
+
+    # Circuit breakers: consecutive failures before failing fast, seconds until a half-open probe,
+    # and per-call timeouts on the request path (workers keep the longer defaults)
+    redis_breaker_failure_threshold: int = 5
+    redis_breaker_reset_seconds: float = 5.0
+    redis_socket_timeout_seconds: float = 0.25
+    elasticsearch_breaker_failure_threshold: int = 5
+    elasticsearch_breaker_reset_seconds: float = 15.0
+    elasticsearch_request_timeout_seconds: float = 2.0
+    broker_breaker_failure_threshold: int = 3
+    broker_breaker_reset_seconds: float = 15.0
+    broker_connect_timeout_seconds: float = 1.0
+
+    # Search totals and facets: exact hit count up to this bound, then "gte"; histogram bucket width in cents
+    search_track_total_hits: int = 10_000
+    search_price_histogram_interval: int = 1_000
+    search_top_owners_size: int = 10
+
+    # Search cursor mode: how long an Elasticsearch point-in-time survives between pages
+    search_pit_keep_alive: str = "2m"
+
+    # Search result cache: Redis TTL and in-process L1 (keys embed the index generation)
+    search_cache_ttl_seconds: int = 300
+    search_l1_cache_ttl_seconds: float = 30.0
+    search_l1_cache_max_size: int = 5_000
+
+    # Production server (python -m app.server): worker processes (0 = one per CPU) and per-container
+    # connection budgets. Each worker opens budget // web_concurrency (at least 1; a 0 budget stays
+    # off), so the server caps workers at the smallest nonzero budget: keep
+    # (db_pool_size + db_max_overflow) x replicas below PostgreSQL max_connections
+    web_concurrency: int = 0
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    redis_max_connections: int = 64
+    elasticsearch_max_connections: int = 32
+    # Proxies trusted for X-Forwarded-For/-Proto (comma-separated IPs/CIDRs, "*" trusts any client)
+    forwarded_allow_ips: str = "127.0.0.1"
+
+    # Startup warm-up: connections opened and pinged per pool (capped at the worker's share) before
+    # readiness; the whole warm-up is bounded so a dead dependency cannot block startup
+    warmup_connections: int = 10
+    warmup_timeout_seconds: float = 10.0
+
+    # Readiness probe: per-dependency ping timeout, how long the aggregate is reused, and which
+    # dependencies make the replica unready when down (others have fallbacks and only mark it degraded)
+    readiness_check_timeout_seconds: float = 0.5
+    readiness_cache_seconds: float = 2.0
+    readiness_required: list[str] = ["postgres"]
+
     # Pagination
     default_page_size: int = 20
     max_page_size: int = 100
 
+    def pool_share(self, total: int) -> int:
+        """One process's share of a per-container connection budget (at least 1; 0 stays 0)."""
+        if total <= 0:
+            return 0
+        return max(1, total // max(1, self.web_concurrency))
+
+    def max_workers(self) -> int:
+        """Most worker processes whose pool shares still add up to within every connection budget.
+        Zero budgets (e.g. DB_MAX_OVERFLOW=0 turns overflow off) take no share and set no cap.
+        """
+        budgets = [
+            budget
+            for budget in (
+                self.db_pool_size,
+                self.db_max_overflow,
+                self.redis_max_connections,
+                self.elasticsearch_max_connections,
+            )
+            if budget > 0
+        ]
+        return max(1, min(budgets, default=1))
+
 
 @lru_cache
 def get_settings() -> Settings:
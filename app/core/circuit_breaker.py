@@ -0,0 +1,174 @@
+"""
+Circuit breakers - stop calling a dependency that is known to be down.
+Challenge: A dead Redis, Elasticsearch or broker made every request wait out its timeout
+(seconds) before the error was swallowed.
+Design: One breaker per dependency, registered by the module that owns the client.
+closed -> open after N consecutive failures; open rejects instantly (CircuitOpenError);
+after reset_seconds one half-open probe is let through, and its outcome closes or
+re-opens the circuit. State is exported to Prometheus and /health/ready.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from app.core.metrics import CIRCUIT_BREAKER_REJECTED, CIRCUIT_BREAKER_STATE
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+    def __init__(self, name: str):
+        super().__init__(f"circuit '{name}' is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker. Thread-safe; use call()/call_sync() or allow() + record_*."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        ignore: tuple[type[BaseException], ...] = (),
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        # Errors that are the caller's fault (e.g. 404), not a sign the dependency is down
+        self.ignore = ignore
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        CIRCUIT_BREAKER_STATE.labels(dependency=name).set(0)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == OPEN
+                and time.monotonic() - self._opened_at >= self.reset_seconds
+            ):
+                return HALF_OPEN
+            return self._state
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        CIRCUIT_BREAKER_STATE.labels(dependency=self.name).set(_STATE_VALUES[state])
+
+    def allow(self) -> bool:
+        """True if the call may go to the dependency (closed, or this caller is the half-open probe)."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if (
+                self._state == OPEN
+                and time.monotonic() - self._opened_at >= self.reset_seconds
+            ):
+                self._set_state(HALF_OPEN)
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+        CIRCUIT_BREAKER_REJECTED.labels(dependency=self.name).inc()
+        return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                self._set_state(CLOSED)
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        "circuit %s opened after %d failure(s)",
+                        self.name,
+                        self._failures,
+                    )
+                self._set_state(OPEN)
+                self._opened_at = time.monotonic()
+
+    def _record(self, error: BaseException | None) -> None:
+        if error is None or isinstance(error, self.ignore):
+            self.record_success()
+        else:
+            self.record_failure()
+
+    async def call(
+        self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Await fn(*args, **kwargs) through the breaker. Raises CircuitOpenError when open."""
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            self._record(e)
+            raise
+        except BaseException:
+            # Cancelled mid-call: no verdict on the dependency, but free the half-open probe slot
+            with self._lock:
+                self._probing = False
+            raise
+        self._record(None)
+        return result
+
+    def call_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Sync variant of call() (Celery publish, worker-side clients)."""
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self._record(e)
+            raise
+        self._record(None)
+        return result
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def register_breaker(
+    name: str,
+    failure_threshold: int,
+    reset_seconds: float,
+    ignore: tuple[type[BaseException], ...] = (),
+) -> CircuitBreaker:
+    """Create (or return the existing) breaker for a dependency."""
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name, failure_threshold, reset_seconds, ignore)
+    return _breakers[name]
+
+
+def breaker_states() -> dict[str, str]:
+    """{dependency: closed | half_open | open} for every registered breaker."""
+    return {name: breaker.state for name, breaker in _breakers.items()}
+
+
+def reset_breakers() -> None:
+    for breaker in _breakers.values():
+        breaker.reset()
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import DbSession
 from app.db.repositories.user_repository import UserRepository
 from app.core.security import decode_access_token
+from app.core.principal_cache import cache_principal, get_cached_principal
 
 security = HTTPBearer(auto_error=False)
 
@@ -20,7 +21,7 @@ async def get_current_user_id(
     session: DbSession,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
 ) -> int:
-    """Resolve JWT to user id. Raises 401 if missing or invalid."""
+    """Resolve JWT to user id. Raises 401 if missing or invalid. Cached principals skip the DB."""
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -33,10 +34,15 @@ async def get_current_user_id(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
+    sub, exp = payload["sub"], payload.get("exp")
+    cached_id = get_cached_principal(sub, exp)
+    if cached_id is not None:
+        return cached_id
     repo = UserRepository(session)
-    user = await repo.get_by_id(int(payload["sub"]))
+    user = await repo.get_auth_principal(int(sub))
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
+    cache_principal(sub, exp, user.id)
     return user.id
 
 
@@ -0,0 +1,162 @@
+"""
+Application Prometheus metrics (monitoring & observability).
+Challenge: One place for metric names so dashboards and code stay in sync.
+Design: Module-level collectors on the default registry, exported by the /metrics app in main.py.
+Under several workers (multiprocess mode) each Gauge says how worker values combine; "live" modes
+drop a worker's samples once main.py marks its process dead at shutdown.
+"""
+
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from typing import ParamSpec, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Latency buckets from sub-millisecond cache hits up to slow dependency timeouts
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+# HTTP: per-route RED metrics (app/core/middleware.py). route is the template, e.g. /api/v1/items/{item_id}
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# Dependencies: where request time goes (Postgres, Redis, Elasticsearch), see timed()
+DEPENDENCY_CALL_DURATION = Histogram(
+    "dependency_call_duration_seconds",
+    "Latency of instrumented repository, cache, search and session calls (errors included)",
+    ["dependency", "operation"],  # postgres | redis | elasticsearch ; function name
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def timed(dependency: str, operation: str | None = None):
+    """Decorator: observe an async function's wall time in DEPENDENCY_CALL_DURATION."""
+
+    def decorator(fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        child = DEPENDENCY_CALL_DURATION.labels(
+            dependency=dependency, operation=operation or fn.__name__
+        )
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+# Auth: in-process principal cache (app/core/principal_cache.py)
+PRINCIPAL_CACHE_REQUESTS = Counter(
+    "principal_cache_requests_total",
+    "Authenticated principal lookups by cache result",
+    ["result"],  # hit | miss
+)
+
+# Auth: bcrypt offload pool (app/core/security.py)
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "Password hash/verify calls running or waiting in the pool",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hash/verify calls waiting for a free pool worker",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hash/verify calls rejected because the pool queue was full",
+)
+
+# Cache: stampede protection (app/cache/redis_client.py cache_get_or_load)
+CACHE_COALESCED_REQUESTS = Counter(
+    "cache_coalesced_requests_total",
+    "Cache misses served by another caller's load instead of hitting the DB",
+    ["scope"],  # local (same worker) | redis (other worker held the lock)
+)
+CACHE_STALE_SERVED = Counter(
+    "cache_stale_served_total",
+    "Stale cache entries served while another caller revalidates",
+)
+CACHE_EARLY_REFRESHES = Counter(
+    "cache_early_refreshes_total",
+    "Cache entries refreshed before expiry (probabilistic early refresh)",
+)
+
+# Cache: item detail two-tier cache (app/services/item_service.py)
+ITEM_CACHE_REQUESTS = Counter(
+    "item_cache_requests_total",
+    "Item detail cache lookups per tier (hit ratio = hit / (hit + miss))",
+    ["tier", "result"],  # tier: l1 (in-process) | l2 (Redis); result: hit | miss
+)
+
+# Search: query result cache (app/search/search_cache.py)
+SEARCH_CACHE_REQUESTS = Counter(
+    "search_cache_requests_total",
+    "Search result cache lookups per tier (hit ratio = hit / (hit + miss))",
+    ["tier", "result"],  # tier: l1 (in-process) | l2 (Redis); result: hit | miss
+)
+
+# Resilience: per-dependency circuit breakers (app/core/circuit_breaker.py)
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit state per dependency: 0 closed, 1 half-open, 2 open",
+    ["dependency"],  # redis | elasticsearch | broker
+    multiprocess_mode="liveall",  # breakers are per worker: one series per pid
+)
+CIRCUIT_BREAKER_REJECTED = Counter(
+    "circuit_breaker_rejected_total",
+    "Calls failed fast because the dependency's circuit was open",
+    ["dependency"],
+)
+
+# Readiness: last dependency check per dependency (app/core/readiness.py)
+READINESS_CHECK_LATENCY = Gauge(
+    "readiness_check_latency_seconds",
+    "Latency of the last readiness ping per dependency (the timeout when it timed out)",
+    ["dependency"],  # postgres | redis | elasticsearch | broker
+    multiprocess_mode="liveall",
+)
+READINESS_CHECK_UP = Gauge(
+    "readiness_check_up",
+    "Whether the last readiness ping per dependency succeeded (1) or failed (0)",
+    ["dependency"],
+    multiprocess_mode="liveall",
+)
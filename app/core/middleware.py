@@ -0,0 +1,62 @@
+"""
+HTTP metrics middleware - per-route latency, status counts and in-flight requests.
+Challenge: /metrics had no request-level data, so slow endpoints were invisible.
+Design: Pure ASGI middleware (no BaseHTTPMiddleware task/stream overhead). Routes are labeled
+by their template (/api/v1/items/{item_id}), read from the scope after routing, so label
+cardinality stays bounded; unmatched paths share one label.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path:
+        return path
+    # Mounted sub-apps (/metrics, /static) set no route; label them by mount point
+    root_path = scope.get("root_path") or ""
+    app_root = scope.get("app_root_path") or ""
+    return root_path[len(app_root) :] or UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        status_code = 500  # unless a response starts
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            route = _route_template(scope)
+            HTTP_REQUEST_DURATION.labels(method=method, route=route).observe(elapsed)
+            HTTP_REQUESTS.labels(
+                method=method, route=route, status=str(status_code)
+            ).inc()
@@ -0,0 +1,40 @@
+"""
+Keyset (cursor) pagination helpers.
+Challenge: Deep OFFSET pages make PostgreSQL scan and discard every earlier row.
+Design: Opaque cursor wraps the last seen primary key; next page is `WHERE id > :last_id`.
+"""
+
+import base64
+import json
+from typing import Any
+
+
+def encode_token(data: dict[str, Any]) -> str:
+    """Opaque URL-safe token for pagination state."""
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_token(token: str) -> dict[str, Any]:
+    """Inverse of encode_token. Raises ValueError on malformed token."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(data, dict):
+        raise ValueError("Invalid cursor")
+    return data
+
+
+def encode_cursor(last_id: int) -> str:
+    """Build opaque cursor from the last id of a page (clients must not parse it)."""
+    return encode_token({"id": last_id})
+
+
+def decode_cursor(cursor: str) -> int:
+    """Return last seen id from cursor. Raises ValueError on malformed token."""
+    last_id = decode_token(cursor).get("id")
+    if not isinstance(last_id, int) or isinstance(last_id, bool) or last_id < 0:
+        raise ValueError("Invalid cursor")
+    return last_id
@@ -0,0 +1,59 @@
+"""
+In-process cache of authenticated principals (hot auth path without a DB round trip).
+Challenge: Every authenticated request otherwise queries Postgres for (id, is_active).
+Design: Bounded TTL/LRU keyed by token (sub, exp); deactivation evicts locally and on
+all replicas via Redis pub/sub. Short TTL bounds staleness if a message is missed.
+"""
+
+from typing import Any
+
+from app.cache.local_cache import TTLCache
+from app.cache.redis_client import cache_publish
+from app.config import get_settings
+from app.core.metrics import PRINCIPAL_CACHE_REQUESTS
+
+settings = get_settings()
+
+PRINCIPAL_INVALIDATION_CHANNEL = "auth:invalidate"
+
+_cache = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+
+def get_cached_principal(sub: str, exp: Any) -> int | None:
+    """Return cached active user id for token (sub, exp), or None on miss."""
+    user_id = _cache.get((sub, exp))
+    PRINCIPAL_CACHE_REQUESTS.labels(result="miss" if user_id is None else "hit").inc()
+    return user_id
+
+
+def cache_principal(sub: str, exp: Any, user_id: int) -> None:
+    """Remember an active principal. Only active users are cached."""
+    _cache.set((sub, exp), user_id)
+
+
+def evict_user(user_id: int) -> int:
+    """Drop all cached tokens of a user in this process. Returns entries removed."""
+    sub = str(user_id)
+    return _cache.delete_where(lambda key: key[0] == sub)
+
+
+async def invalidate_user(user_id: int) -> None:
+    """Call after deactivating a user: evicts here and publishes to other replicas."""
+    evict_user(user_id)
+    await cache_publish(PRINCIPAL_INVALIDATION_CHANNEL, str(user_id))
+
+
+def handle_invalidation_message(data: str) -> None:
+    """Pub/sub handler for PRINCIPAL_INVALIDATION_CHANNEL."""
+    try:
+        evict_user(int(data))
+    except ValueError:
+        pass
+
+
+def clear() -> None:
+    """Drop every cached principal (tests, or after losing pub/sub)."""
+    _cache.clear()
@@ -0,0 +1,88 @@
+"""
+Readiness probe - can this replica serve traffic right now?
+Challenge: /health/ready always said "ready", so load balancers kept routing to pods whose
+Postgres pool was dead; probing every dependency on every probe would add load of its own.
+Design: The app registers one ping per dependency at startup. Pings run concurrently, each
+under a tight timeout, and the aggregate is cached for readiness_cache_seconds (concurrent
+probes share one round). A failed required dependency (no fallback, e.g. Postgres) makes the
+replica unready; any other failure only marks it degraded. Latency and up/down are exported
+as gauges.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.config import get_settings
+from app.core.metrics import READINESS_CHECK_LATENCY, READINESS_CHECK_UP
+
+settings = get_settings()
+
+_checks: dict[str, Callable[[], Awaitable[Any]]] = {}
+_last: tuple[float, dict[str, Any]] | None = None
+_lock = asyncio.Lock()
+
+
+def register_check(name: str, ping: Callable[[], Awaitable[Any]]) -> None:
+    """Register the readiness ping for a dependency (raises or times out when it is unusable)."""
+    _checks[name] = ping
+
+
+async def _run_check(name: str, ping: Callable[[], Awaitable[Any]]) -> dict[str, Any]:
+    start = time.perf_counter()
+    error = None
+    try:
+        await asyncio.wait_for(ping(), settings.readiness_check_timeout_seconds)
+    except asyncio.TimeoutError:
+        error = f"timed out after {settings.readiness_check_timeout_seconds}s"
+    except Exception as e:
+        error = str(e) or type(e).__name__
+    latency = time.perf_counter() - start
+    READINESS_CHECK_LATENCY.labels(dependency=name).set(latency)
+    READINESS_CHECK_UP.labels(dependency=name).set(0 if error else 1)
+    result: dict[str, Any] = {
+        "ok": error is None,
+        "latency_ms": round(latency * 1000, 2),
+    }
+    if error:
+        result["error"] = error
+    return result
+
+
+async def _run_checks() -> dict[str, Any]:
+    names = list(_checks)
+    results = await asyncio.gather(*(_run_check(name, _checks[name]) for name in names))
+    checks = dict(zip(names, results))
+    failed = {name for name, result in checks.items() if not result["ok"]}
+    return {
+        "ready": not failed & set(settings.readiness_required),
+        "degraded": bool(failed),
+        "checks": checks,
+    }
+
+
+async def check_dependencies() -> dict[str, Any]:
+    """Aggregate {ready, degraded, checks}; at most one round of pings per readiness_cache_seconds."""
+    global _last
+    if (
+        _last is not None
+        and time.monotonic() - _last[0] < settings.readiness_cache_seconds
+    ):
+        return _last[1]
+    async with _lock:
+        # Probes that queued behind the lock reuse the round that just finished
+        if (
+            _last is not None
+            and time.monotonic() - _last[0] < settings.readiness_cache_seconds
+        ):
+            return _last[1]
+        result = await _run_checks()
+        _last = (time.monotonic(), result)
+    return result
+
+
+def clear_readiness_cache() -> None:
+    """Forget the cached result (tests)."""
+    global _last
+    _last = None
@@ -0,0 +1,85 @@
+"""
+Managed resources - warm client pools before serving, close them on shutdown.
+Challenge: Clients were created lazily on first use, so the first requests after a deploy paid
+for TCP/TLS/auth setup, and nothing disposed the DB engine or closed Redis/ES on shutdown.
+Design: The app registers a warm_up/close pair per pool; the lifespan warms all of them
+concurrently (bounded by a timeout, so a dead dependency cannot block startup) and closes them
+in reverse order. The registry reports ready only between warm-up and shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+COLD = "cold"
+WARM = "warm"
+FAILED = "failed"
+CLOSED = "closed"
+
+
+@dataclass
+class Resource:
+    name: str
+    warm_up: Callable[[], Awaitable[None]]
+    close: Callable[[], Awaitable[None]]
+    state: str = COLD
+
+
+class ResourceRegistry:
+    """Named pools with startup warm-up and shutdown close. ready is True only after start()."""
+
+    def __init__(self):
+        self._resources: dict[str, Resource] = {}
+        self.ready = False
+
+    def register(
+        self,
+        name: str,
+        warm_up: Callable[[], Awaitable[None]],
+        close: Callable[[], Awaitable[None]],
+    ) -> None:
+        self._resources[name] = Resource(name, warm_up, close)
+
+    def states(self) -> dict[str, str]:
+        return {name: resource.state for name, resource in self._resources.items()}
+
+    async def _warm(self, resource: Resource, timeout: float) -> None:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(resource.warm_up(), timeout)
+        except Exception as e:
+            # Serve anyway: breakers and fallbacks cover a dependency that is down at startup
+            resource.state = FAILED
+            logger.warning(
+                "warm-up of %s failed: %s", resource.name, e or type(e).__name__
+            )
+            return
+        resource.state = WARM
+        logger.info(
+            "warmed %s in %.0f ms", resource.name, (time.perf_counter() - start) * 1000
+        )
+
+    async def start(self, timeout: float) -> None:
+        """Warm every resource concurrently, then report ready (failures are logged, not fatal)."""
+        await asyncio.gather(
+            *(self._warm(resource, timeout) for resource in self._resources.values())
+        )
+        self.ready = True
+
+    async def stop(self) -> None:
+        """Report not ready, then close resources in reverse registration order."""
+        self.ready = False
+        for resource in reversed(list(self._resources.values())):
+            try:
+                await resource.close()
+            except Exception as e:
+                logger.warning("closing %s failed: %s", resource.name, e)
+            resource.state = CLOSED
+
+
+# Process-wide registry used by the app lifespan and /health/ready
+resources = ResourceRegistry()
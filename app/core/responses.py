@@ -0,0 +1,39 @@
+"""
+Fast JSON responses (orjson).
+Challenge: Item responses were validated twice (the service builds the model, then FastAPI
+re-validates it for response_model) and rendered with the stdlib json module.
+Design: OrjsonResponse is the app's default response class and renders in Pydantic's format
+(UTC as "Z"). Hot read paths build plain dicts or reuse cached JSON bytes and return a response
+themselves, which FastAPI sends without response_model validation; response_model stays on the
+route for the OpenAPI schema.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize like OrjsonResponse (datetimes as ISO 8601, UTC as "Z")."""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class JSONBytesResponse(Response):
+    """Already-serialized JSON body (e.g. from the item cache), sent unchanged."""
+
+    media_type = "application/json"
+
+
+def json_array(items: list[bytes]) -> bytes:
+    """JSON array from already-serialized elements, without parsing them."""
+    return b"[" + b",".join(items) + b"]"
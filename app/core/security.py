@@ -1,19 +1,42 @@
 """
 Security: password hashing and JWT (best practices for APIs).
 Challenge: Secure auth, no plain-text passwords, token validation.
+bcrypt is CPU-bound (~200 ms); async handlers must use the *_async variants, which run
+on a bounded thread pool (bcrypt releases the GIL) instead of blocking the event loop.
 """
 
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import get_settings
+from app.core.metrics import (
+    PASSWORD_HASH_PENDING,
+    PASSWORD_HASH_QUEUE_DEPTH,
+    PASSWORD_HASH_REJECTED,
+)
 
 settings = get_settings()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+# Dedicated pool: logins must not starve the default executor used by other blocking calls
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
+_hash_pending = 0  # running + queued; only touched from the event loop thread
+
+
+class PasswordHashBusy(Exception):
+    """Hashing pool queue is full. Callers should answer 503 instead of queueing unboundedly."""
+
 
 def hash_password(password: str) -> str:
     """One-way hash for storage. Never store plain passwords."""
@@ -25,6 +48,43 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+def _update_hash_gauges() -> None:
+    PASSWORD_HASH_PENDING.set(_hash_pending)
+    PASSWORD_HASH_QUEUE_DEPTH.set(
+        max(0, _hash_pending - settings.password_hash_workers)
+    )
+
+
+async def _run_in_hash_pool(fn: Callable[..., T], *args: Any) -> T:
+    """Run fn on the hashing pool. Raises PasswordHashBusy when workers + queue are saturated."""
+    global _hash_pending
+    if (
+        _hash_pending
+        >= settings.password_hash_workers + settings.password_hash_max_queue
+    ):
+        PASSWORD_HASH_REJECTED.inc()
+        raise PasswordHashBusy()
+    _hash_pending += 1
+    _update_hash_gauges()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            _hash_executor, fn, *args
+        )
+    finally:
+        _hash_pending -= 1
+        _update_hash_gauges()
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password without blocking the event loop."""
+    return await _run_in_hash_pool(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """verify_password without blocking the event loop."""
+    return await _run_in_hash_pool(verify_password, plain, hashed)
+
+
 def create_access_token(subject: str | int, extra: dict[str, Any] | None = None) -> str:
     """Create JWT for authenticated user. Subject typically user id."""
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_expire_minutes)
@@ -1,6 +1,7 @@
 # ORM models - single place for table definitions
 
 from app.db.models.item import Item
+from app.db.models.outbox import OutboxEvent
 from app.db.models.user import User
 
-__all__ = ["User", "Item"]
+__all__ = ["User", "Item", "OutboxEvent"]
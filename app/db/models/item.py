@@ -29,6 +29,9 @@ class Item(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    # items.search_vector (generated tsvector + GIN, migration 002) is PostgreSQL-only and never
+    # written by the app, so it is deliberately not mapped; see ItemRepository.full_text_search.
+
     owner: Mapped["User"] = relationship("User", back_populates="items")
 
     def __repr__(self) -> str:
@@ -0,0 +1,38 @@
+"""
+Outbox model - side effects recorded in the same transaction as the data change.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+# Topic for "item changed, bring its search document in line with the row"
+SEARCH_ITEM_TOPIC = "search.item"
+# Topic for "every item of this owner (entity_id) was deleted": one delete_by_query, not one event per item
+SEARCH_OWNER_DELETED_TOPIC = "search.owner_deleted"
+
+
+class OutboxEvent(Base):
+    """
+    One pending event. Rows commit (or roll back) with the write that caused them;
+    the outbox relay publishes and deletes them. Events carry only the entity id:
+    the relay reads the current row, so repeated events collapse and a missing row means delete.
+    The event id doubles as the search document version. attempts counts rejected publishes;
+    events at outbox_max_attempts are dead letters (kept, no longer polled).
+    """
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    topic: Mapped[str] = mapped_column(String(64), nullable=False)
+    entity_id: Mapped[int] = mapped_column(nullable=False)
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxEvent(id={self.id}, topic={self.topic}, entity_id={self.entity_id}, attempts={self.attempts})>"
@@ -29,8 +29,9 @@ class User(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    # Relationship: one user has many items (for demo)
-    items: Mapped[list["Item"]] = relationship("Item", back_populates="owner", lazy="selectin")
+    # Relationship: one user has many items. Never loaded implicitly: a seller with 200k items
+    # would otherwise pull them all on every user fetch (auth, login). Use selectinload(User.items).
+    items: Mapped[list["Item"]] = relationship("Item", back_populates="owner", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email})>"
@@ -1,6 +1,7 @@
 # Repository pattern: abstract data access (SOLID - Dependency Inversion)
 
 from app.db.repositories.item_repository import ItemRepository
+from app.db.repositories.outbox_repository import OutboxRepository
 from app.db.repositories.user_repository import UserRepository
 
-__all__ = ["UserRepository", "ItemRepository"]
+__all__ = ["UserRepository", "ItemRepository", "OutboxRepository"]
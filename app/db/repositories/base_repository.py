@@ -9,6 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import Base
+from app.core.metrics import timed
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -20,23 +21,31 @@ class BaseRepository(Generic[ModelType]):
         self.session = session
         self.model = model
 
+    @timed("postgres")
     async def get_by_id(self, id: int) -> ModelType | None:
         """Fetch single entity by primary key. Used for detail endpoints."""
         result = await self.session.execute(select(self.model).where(self.model.id == id))
         return result.scalar_one_or_none()
 
+    @timed("postgres")
     async def get_many(
         self,
         *,
         skip: int = 0,
         limit: int = 20,
+        after_id: int | None = None,
     ) -> list[ModelType]:
-        """Paginated list. Avoids loading full table (performance)."""
-        result = await self.session.execute(
-            select(self.model).offset(skip).limit(limit).order_by(self.model.id)
-        )
+        """Paginated list. Avoids loading full table (performance).
+        With after_id uses keyset pagination (id > after_id): cost does not grow with page depth."""
+        stmt = select(self.model).order_by(self.model.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        else:
+            stmt = stmt.offset(skip)
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    @timed("postgres")
     async def add(self, entity: ModelType) -> ModelType:
         """Persist new entity. Caller commits session."""
         self.session.add(entity)
@@ -44,6 +53,7 @@ class BaseRepository(Generic[ModelType]):
         await self.session.refresh(entity)
         return entity
 
+    @timed("postgres")
     async def delete(self, entity: ModelType) -> None:
         """Remove entity from DB."""
         await self.session.delete(entity)
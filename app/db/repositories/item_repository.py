@@ -3,11 +3,18 @@ Item repository - item data access and query optimization (SOLID: Single Respons
 Challenge: Database query performance; avoid N+1, use indexes.
 """
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, literal_column, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import selectinload
 
 from app.db.models.item import Item
 from app.db.repositories.base_repository import BaseRepository
+from app.core.metrics import timed
+
+
+# Generated column + GIN index from migration 002 (PostgreSQL only, not mapped on the model)
+SEARCH_VECTOR = literal_column("items.search_vector")
+TEXT_SEARCH_CONFIG = "english"
 
 
 class ItemRepository(BaseRepository[Item]):
@@ -16,6 +23,7 @@ class ItemRepository(BaseRepository[Item]):
     def __init__(self, session):
         super().__init__(session, Item)
 
+    @timed("postgres")
     async def get_by_id_with_owner(self, id: int) -> Item | None:
         """Fetch item with owner in one query (solves N+1 problem)."""
         result = await self.session.execute(
@@ -23,13 +31,132 @@ class ItemRepository(BaseRepository[Item]):
         )
         return result.scalar_one_or_none()
 
-    async def get_many_with_owner(self, skip: int = 0, limit: int = 20) -> list[Item]:
-        """Paginated items with owner loaded in one extra query (eager loading)."""
-        result = await self.session.execute(
+    @timed("postgres")
+    async def get_many_with_owner(
+        self, skip: int = 0, limit: int = 20, after_id: int | None = None
+    ) -> list[Item]:
+        """Paginated items with owner loaded in one extra query (eager loading).
+        after_id switches to keyset pagination on the primary key index (no OFFSET scan).
+        """
+        stmt = (
             select(Item)
             .options(selectinload(Item.owner))
-            .offset(skip)
+            .order_by(Item.id)
             .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Item.id > after_id)
+        else:
+            stmt = stmt.offset(skip)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    @timed("postgres")
+    async def get_many_by_ids_with_owner(
+        self, ids: list[int], *, refresh: bool = False
+    ) -> list[Item]:
+        """Fetch items by id in one WHERE id IN (...) query, owner eager-loaded. Order not guaranteed.
+        refresh=True overwrites objects already in the session (e.g. after a bulk UPDATE).
+        """
+        if not ids:
+            return []
+        stmt = select(Item).where(Item.id.in_(ids)).options(selectinload(Item.owner))
+        if refresh:
+            stmt = stmt.execution_options(populate_existing=True)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    @timed("postgres")
+    async def add_many(self, rows: list[dict]) -> list[Item]:
+        """
+        Insert many items with multi-row INSERT ... RETURNING (batched by the driver). Owner not loaded.
+        Returned items are in the order of rows (insertmanyvalues does not guarantee it otherwise).
+        """
+        if not rows:
+            return []
+        stmt = insert(Item).returning(Item, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, rows)
+        return list(result.all())
+
+    @timed("postgres")
+    async def update_many(self, rows: list[dict], owner_id: int | None = None) -> None:
+        """Bulk UPDATE by primary key; each row is {"id": ..., <changed columns>}. Ids must exist.
+        With owner_id, rows of other owners are not changed.
+        """
+        if not rows:
+            return
+        stmt = update(Item)
+        if owner_id is not None:
+            # Extra criteria rule out syncing loaded objects; callers reload with refresh=True
+            stmt = stmt.where(Item.owner_id == owner_id).execution_options(
+                synchronize_session=None
+            )
+        await self.session.execute(stmt, rows)
+
+    @timed("postgres")
+    async def delete_many(
+        self, ids: list[int], owner_id: int | None = None
+    ) -> list[int]:
+        """DELETE ... WHERE id IN (...) RETURNING id: one statement, returns ids actually deleted.
+        With owner_id, items of other owners are left alone.
+        """
+        if not ids:
+            return []
+        stmt = delete(Item).where(Item.id.in_(ids))
+        if owner_id is not None:
+            stmt = stmt.where(Item.owner_id == owner_id)
+        result = await self.session.execute(stmt.returning(Item.id))
+        return list(result.scalars().all())
+
+    @timed("postgres")
+    async def delete_by_owner(self, owner_id: int, limit: int) -> list[int]:
+        """Delete up to limit items of one owner, lowest ids first (uses ix_items_owner_id); returns deleted ids."""
+        chunk = (
+            select(Item.id)
+            .where(Item.owner_id == owner_id)
             .order_by(Item.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(
+            delete(Item).where(Item.id.in_(chunk)).returning(Item.id)
         )
         return list(result.scalars().all())
+
+    @timed("postgres")
+    async def existing_ids(
+        self, ids: list[int], owner_id: int | None = None
+    ) -> set[int]:
+        """Subset of ids present in the table (one index query), only owner_id's items when given."""
+        if not ids:
+            return set()
+        stmt = select(Item.id).where(Item.id.in_(ids))
+        if owner_id is not None:
+            stmt = stmt.where(Item.owner_id == owner_id)
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
+    @timed("postgres")
+    async def full_text_search(
+        self, query: str, skip: int = 0, limit: int = 20
+    ) -> tuple[list[Row], int]:
+        """PostgreSQL full-text search (GIN on items.search_vector), best rank first.
+        Returns (rows of plain columns, total matches); total is 0 when skip is past the end.
+        """
+        tsquery = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+        stmt = (
+            select(
+                Item.id,
+                Item.title,
+                Item.description,
+                Item.price_cents,
+                Item.owner_id,
+                Item.created_at,
+                func.count().over().label("total"),
+            )
+            .where(SEARCH_VECTOR.op("@@")(tsquery))
+            .order_by(func.ts_rank_cd(SEARCH_VECTOR, tsquery).desc(), Item.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = list((await self.session.execute(stmt)).all())
+        return rows, (rows[0].total if rows else 0)
@@ -0,0 +1,28 @@
+"""
+Outbox repository - record side effects in the caller's transaction.
+Challenge: Publishing to the broker inside a request adds a round trip and can announce
+rows that later roll back.
+Design: Append-only inserts here; app/queue/outbox_relay.py publishes after commit.
+"""
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.outbox import OutboxEvent
+from app.core.metrics import timed
+
+
+class OutboxRepository:
+    """Writes outbox events with the session of the surrounding unit of work (no commit here)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @timed("postgres")
+    async def add_many(self, topic: str, entity_ids: list[int]) -> None:
+        """One INSERT (executemany) for all ids; committed by the request's get_db."""
+        if entity_ids:
+            await self.session.execute(
+                insert(OutboxEvent),
+                [{"topic": topic, "entity_id": id} for id in entity_ids],
+            )
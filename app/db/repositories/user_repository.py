@@ -3,10 +3,11 @@ User repository - encapsulates all user data access (SOLID: Single Responsibilit
 Challenge: Keep queries in one place for optimization and reuse.
 """
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 
 from app.db.models.user import User
 from app.db.repositories.base_repository import BaseRepository
+from app.core.metrics import timed
 
 
 class UserRepository(BaseRepository[User]):
@@ -15,7 +16,26 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, session):
         super().__init__(session, User)
 
+    @timed("postgres")
     async def get_by_email(self, email: str) -> User | None:
         """Find user by email - used for authentication."""
         result = await self.session.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
+
+    @timed("postgres")
+    async def get_auth_principal(self, id: int) -> Row[tuple[int, bool]] | None:
+        """Fetch only (id, is_active) for auth checks. No ORM entity, no relationships loaded."""
+        result = await self.session.execute(
+            select(User.id, User.is_active).where(User.id == id)
+        )
+        return result.one_or_none()
+
+    @timed("postgres")
+    async def get_emails_by_ids(self, ids: list[int]) -> dict[int, str]:
+        """Map user id -> email for many users in one query (bulk responses)."""
+        if not ids:
+            return {}
+        result = await self.session.execute(
+            select(User.id, User.email).where(User.id.in_(ids))
+        )
+        return {row.id: row.email for row in result}
@@ -4,24 +4,40 @@ Challenge: Connection pooling, scoped sessions, proper cleanup.
 Design: Dependency injection for request-scoped sessions (no connection leaks).
 """
 
-from collections.abc import AsyncGenerator
+import contextlib
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import get_settings
+from app.core.metrics import DEPENDENCY_CALL_DURATION
 from app.db.base import Base
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
+# Per-worker share of the container budget (settings.web_concurrency processes share it).
+# SQLite (benchmarks, local runs) keeps SQLAlchemy's default pool, which takes no sizing.
+_pool_sizing = (
+    {}
+    if settings.database_url.startswith("sqlite")
+    else {
+        "pool_size": settings.pool_share(settings.db_pool_size),
+        "max_overflow": settings.pool_share(settings.db_max_overflow),
+    }
+)
+
 # Async engine with connection pool (scalability)
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,  # Verify connections before use
-    pool_size=10,
-    max_overflow=20,
+    **_pool_sizing,
 )
 
 # Session factory: one session per request
@@ -34,17 +50,62 @@ async_session_maker = async_sessionmaker(
 )
 
 
+async def warm_up_db(connections: int) -> None:
+    """Open and ping connections up front; they stay in the pool for the first requests."""
+    async with contextlib.AsyncExitStack() as stack:
+        for _ in range(connections):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+
+
+async def close_db() -> None:
+    """Close every pooled connection (shutdown)."""
+    await engine.dispose()
+
+
+async def ping_db() -> None:
+    """Readiness: a pooled connection can run a query."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+_commit_duration = DEPENDENCY_CALL_DURATION.labels(
+    dependency="postgres", operation="session_commit"
+)
+
+
+_AFTER_COMMIT = "after_commit"
+
+
+def run_after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """Run callback once get_db has committed the request transaction (dropped on rollback)."""
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+async def _run_after_commit_callbacks(session: AsyncSession) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT, []):
+        try:
+            await callback()
+        except Exception as e:
+            logger.warning("after-commit callback failed: %s", e)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Yield a database session per request. Ensures rollback on error, close on exit."""
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            with _commit_duration.time():
+                await session.commit()
         except Exception:
+            session.info.pop(_AFTER_COMMIT, None)
             await session.rollback()
             raise
         finally:
             await session.close()
+        await _run_after_commit_callbacks(session)
 
 
 # Type alias for FastAPI dependency injection
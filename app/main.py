@@ -3,6 +3,9 @@ FastAPI application entry point.
 Challenge: Mount routes, middleware (Prometheus), startup events (DB/ES init).
 """
 
+import asyncio
+import contextlib
+import os
 from contextlib import asynccontextmanager
 
 from pathlib import Path
@@ -11,23 +14,108 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-from prometheus_client import make_asgi_app
+from prometheus_client import REGISTRY, CollectorRegistry, make_asgi_app, multiprocess
 
 from app.config import get_settings
 from app.api.v1.router import api_router
-from app.search.elasticsearch_client import ensure_items_index
+from app.search.elasticsearch_client import (
+    close_elasticsearch,
+    ensure_items_index,
+    ping_elasticsearch,
+    warm_up_elasticsearch,
+)
+from app.cache.redis_client import (
+    close_redis,
+    listen_for_invalidations,
+    ping_redis,
+    warm_up_redis,
+)
+from app.core import principal_cache
+from app.core.middleware import PrometheusMiddleware
+from app.core.readiness import register_check
+from app.core.responses import OrjsonResponse
+from app.core.resources import resources
+from app.db.session import close_db, ping_db, warm_up_db
+from app.queue.celery_app import ping_broker
+from app.services import item_service
+
+
+def _register_dependencies() -> None:
+    """
+    Client pools warmed before readiness and closed at shutdown (postgres first, closed last),
+    and the pings behind /health/ready.
+    """
+    settings = get_settings()
+
+    def connections(budget: int) -> int:
+        return min(settings.warmup_connections, settings.pool_share(budget))
+
+    resources.register(
+        "postgres", lambda: warm_up_db(connections(settings.db_pool_size)), close_db
+    )
+    resources.register(
+        "redis",
+        lambda: warm_up_redis(connections(settings.redis_max_connections)),
+        close_redis,
+    )
+    resources.register(
+        "elasticsearch",
+        lambda: warm_up_elasticsearch(
+            connections(settings.elasticsearch_max_connections)
+        ),
+        close_elasticsearch,
+    )
+    register_check("postgres", ping_db)
+    register_check("redis", ping_redis)
+    register_check("elasticsearch", ping_elasticsearch)
+    register_check("broker", ping_broker)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Startup: ensure Elasticsearch index when ES is available. Shutdown: cleanup if needed."""
+    """
+    Startup: ensure Elasticsearch index, warm DB/Redis/ES pools, start cache invalidation listener;
+    /health/ready turns ready after warm-up. Shutdown: not ready, stop listener, close the pools.
+    """
     try:
         await ensure_items_index()
     except Exception:
         # Run without Docker: ES may be down; app still works (search returns empty)
         pass
+    _register_dependencies()
+    await resources.start(get_settings().warmup_timeout_seconds)
+    # Redis pub/sub keeps in-process caches coherent across API replicas
+    invalidation_listener = asyncio.create_task(
+        listen_for_invalidations(
+            {
+                principal_cache.PRINCIPAL_INVALIDATION_CHANNEL: principal_cache.handle_invalidation_message,
+                item_service.ITEM_INVALIDATION_CHANNEL: item_service.handle_item_invalidation_message,
+            }
+        )
+    )
     yield
-    # Optional: close Redis/ES clients
+    # In-flight requests are done by now (the server drains them before lifespan shutdown)
+    resources.ready = False
+    invalidation_listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await invalidation_listener
+    await resources.stop()
+    _mark_metrics_process_dead()
+
+
+def _mark_metrics_process_dead() -> None:
+    """Multiprocess mode: drop this worker's live gauge samples so /metrics stops reporting them."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def _metrics_registry() -> CollectorRegistry:
+    """Default registry, or one merging every worker's samples when app/server.py runs several."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
 
 
 def create_app() -> FastAPI:
@@ -37,6 +125,7 @@ def create_app() -> FastAPI:
         description="Interview project: scalable web services with FastAPI, PostgreSQL, Redis, Elasticsearch, Celery, Docker, CI/CD, monitoring.",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=OrjsonResponse,
     )
 
     # CORS for frontend/API consumers
@@ -48,8 +137,11 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Per-route latency/status/in-flight metrics; added last so it is outermost and times everything
+    app.add_middleware(PrometheusMiddleware)
+
     # Prometheus metrics at /metrics (monitoring & observability - job nice-to-have)
-    metrics_app = make_asgi_app()
+    metrics_app = make_asgi_app(_metrics_registry())
     app.mount("/metrics", metrics_app)
 
     app.include_router(api_router, prefix="/api")
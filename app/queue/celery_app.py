@@ -2,14 +2,27 @@
 Celery application - async task queue with RabbitMQ (job requirement: queue management).
 Challenge: Decouple heavy work from HTTP request; retries, visibility.
 Design: Same broker as job description (RabbitMQ); Redis as result backend optional.
+API-side publishes go through enqueue(): short connect timeout, "broker" circuit breaker.
 """
 
-from celery import Celery
+import asyncio
+import logging
+
+from celery import Celery, Task
 
 from app.config import get_settings
+from app.core.circuit_breaker import register_breaker
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+BROKER_BREAKER = register_breaker(
+    "broker",
+    settings.broker_breaker_failure_threshold,
+    settings.broker_breaker_reset_seconds,
+)
+
 celery_app = Celery(
     "interview_app",
     broker=settings.celery_broker_url,
@@ -26,4 +39,35 @@ celery_app.conf.update(
     task_time_limit=300,
     task_soft_time_limit=60,
     worker_prefetch_multiplier=1,  # Fair distribution
+    # Publishing: give up quickly instead of retrying for seconds inside an HTTP request
+    broker_connection_timeout=settings.broker_connect_timeout_seconds,
+    task_publish_retry_policy={
+        "max_retries": 1,
+        "interval_start": 0,
+        "interval_step": 0.2,
+        "interval_max": 0.2,
+    },
 )
+
+
+def enqueue(task: Task, *args) -> bool:
+    """Publish task.delay(*args) through the broker breaker. False (logged) if the broker is down."""
+    try:
+        BROKER_BREAKER.call_sync(task.delay, *args)
+        return True
+    except Exception as e:
+        logger.warning("enqueue %s failed: %s", task.name, e)
+        return False
+
+
+def _connect_broker() -> None:
+    # No retries: one attempt bounded by the connect timeout (a retry would add a 2s back-off sleep)
+    with celery_app.connection_for_write() as conn:
+        conn.ensure_connection(
+            max_retries=0, timeout=settings.broker_connect_timeout_seconds
+        )
+
+
+async def ping_broker() -> None:
+    """Readiness: the broker accepts a connection (kombu is blocking, so off the event loop)."""
+    await asyncio.to_thread(_connect_broker)
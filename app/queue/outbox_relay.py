@@ -0,0 +1,233 @@
+"""
+Outbox relay - publish committed outbox events to the search index.
+Challenge: Indexing must follow only committed writes, without a broker round trip in the
+request and without losing events when the broker or ES is down.
+Design: Poll the oldest events (FOR UPDATE SKIP LOCKED, so several relays can run), read the
+current rows in one IN query, and send index actions for rows that exist and delete actions
+for rows that are gone - straight to ES _bulk, or as batched Celery tasks. Events are deleted
+in the same transaction only for ids that were published; the rest are retried next poll.
+Every action carries the item's newest event id as an external version (events are written
+after the row lock, so ids follow commit order): when two relays race on one item, ES rejects
+whichever write is older, and redelivery after a crash is idempotent.
+An unreachable target raises and the whole poll is retried; documents the target rejects count
+an attempt, and events reaching outbox_max_attempts are parked as dead letters.
+"Owner deleted" events become one delete_by_query each. They wait until every older item event
+is published (so no earlier write can re-index a deleted item) and spare the owner's current rows.
+Sync code (psycopg2 + sync ES client), like the reindex and Celery worker paths.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.models.item import Item
+from app.db.models.outbox import (
+    SEARCH_ITEM_TOPIC,
+    SEARCH_OWNER_DELETED_TOPIC,
+    OutboxEvent,
+)
+from app.queue.celery_app import enqueue
+from app.queue.tasks import index_items_task, remove_items_task, remove_owner_items_task
+from app.search.elasticsearch_client import (
+    bulk_sync,
+    delete_action,
+    delete_owner_items_sync,
+    ensure_items_index_sync,
+    index_action,
+    item_document,
+)
+from app.search.generation import bump_generation_sync
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# (docs to index, ids to delete, item id -> version) -> ids the target rejected.
+# Raises when the target is unreachable (nothing is counted against the events).
+Publisher = Callable[[list[dict], list[int], dict[int, int]], set[int]]
+
+# (owner id, ids of the owner's items that still exist) -> None; raises on failure
+OwnerPublisher = Callable[[int, list[int]], None]
+
+
+def publish_to_elasticsearch(
+    docs: list[dict], deleted_ids: list[int], versions: dict[int, int]
+) -> set[int]:
+    """One _bulk request; waits for refresh so the generation bump follows searchable data."""
+    actions = [index_action(doc, versions[doc["id"]]) for doc in docs]
+    actions += [delete_action(id, versions[id]) for id in deleted_ids]
+    ensure_items_index_sync()
+    failed = bulk_sync(
+        actions, chunk_size=settings.outbox_batch_size, refresh="wait_for"
+    )
+    if len(failed) < len(actions):
+        bump_generation_sync()
+    return {int(a["_id"]) for a in failed}
+
+
+def publish_to_celery(
+    docs: list[dict], deleted_ids: list[int], versions: dict[int, int]
+) -> set[int]:
+    """Batched Celery messages (index_batch_size per message) for the worker's bulk tasks."""
+    size = settings.index_batch_size
+    batches = []
+    for start in range(0, len(docs), size):
+        chunk = docs[start : start + size]
+        batches.append(
+            (index_items_task, chunk, [versions[doc["id"]] for doc in chunk])
+        )
+    for start in range(0, len(deleted_ids), size):
+        chunk = deleted_ids[start : start + size]
+        batches.append((remove_items_task, chunk, [versions[id] for id in chunk]))
+    for task, payload, payload_versions in batches:
+        if not enqueue(task, payload, payload_versions):
+            # Broker down: retry the whole poll (batches already sent are resent, versions make that safe)
+            raise ConnectionError(f"could not enqueue {task.name}")
+    return set()
+
+
+def delete_owner_in_elasticsearch(owner_id: int, keep_ids: list[int]) -> None:
+    """One delete_by_query (waits for refresh, then bumps the search generation)."""
+    if delete_owner_items_sync(owner_id, keep_ids):
+        bump_generation_sync()
+
+
+def delete_owner_via_celery(owner_id: int, keep_ids: list[int]) -> None:
+    if not enqueue(remove_owner_items_task, owner_id, keep_ids):
+        raise ConnectionError(f"could not enqueue {remove_owner_items_task.name}")
+
+
+def relay_batch(
+    engine: Engine, publish: Publisher, batch_size: int, max_attempts: int | None = None
+) -> int:
+    """Publish and delete up to batch_size oldest live events. Returns the number of events handled."""
+    max_attempts = max_attempts or settings.outbox_max_attempts
+    with Session(engine) as session, session.begin():
+        events = session.scalars(
+            select(OutboxEvent)
+            .where(
+                OutboxEvent.topic == SEARCH_ITEM_TOPIC,
+                OutboxEvent.attempts < max_attempts,
+            )
+            .order_by(OutboxEvent.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not events:
+            return 0
+        # Repeated changes collapse; the newest event id is the document version
+        versions = {event.entity_id: event.id for event in events}
+        ids = list(versions)
+        rows = session.execute(
+            select(
+                Item.id,
+                Item.title,
+                Item.description,
+                Item.price_cents,
+                Item.owner_id,
+                Item.created_at,
+            ).where(Item.id.in_(ids))
+        ).all()
+        docs = [item_document(row) for row in rows]
+        found = {doc["id"] for doc in docs}
+        failed = publish(docs, [id for id in ids if id not in found], versions)
+        done = [event.id for event in events if event.entity_id not in failed]
+        if done:
+            session.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(done)))
+        rejected = [event for event in events if event.entity_id in failed]
+        for event in rejected:
+            if event.attempts + 1 >= max_attempts:
+                logger.error(
+                    "outbox event %s (item %s) dead-lettered after %d attempts",
+                    event.id,
+                    event.entity_id,
+                    max_attempts,
+                )
+        if rejected:
+            session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_([event.id for event in rejected]))
+                .values(attempts=OutboxEvent.attempts + 1)
+            )
+        return len(done)
+
+
+def relay_owner_deletions(
+    engine: Engine, publish_owner: OwnerPublisher, batch_size: int
+) -> int:
+    """
+    Publish and delete up to batch_size "owner deleted" events that are older than every live
+    item event. Returns the number handled; a publish error rolls the whole batch back.
+    """
+    with Session(engine) as session, session.begin():
+        oldest_item_event = session.scalar(
+            select(func.min(OutboxEvent.id)).where(
+                OutboxEvent.topic == SEARCH_ITEM_TOPIC,
+                OutboxEvent.attempts < settings.outbox_max_attempts,
+            )
+        )
+        stmt = (
+            select(OutboxEvent)
+            .where(OutboxEvent.topic == SEARCH_OWNER_DELETED_TOPIC)
+            .order_by(OutboxEvent.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        if oldest_item_event is not None:
+            stmt = stmt.where(OutboxEvent.id < oldest_item_event)
+        events = session.scalars(stmt).all()
+        for owner_id in dict.fromkeys(event.entity_id for event in events):
+            keep_ids = list(
+                session.scalars(select(Item.id).where(Item.owner_id == owner_id)).all()
+            )
+            publish_owner(owner_id, keep_ids)
+        if events:
+            session.execute(
+                delete(OutboxEvent).where(
+                    OutboxEvent.id.in_([event.id for event in events])
+                )
+            )
+        return len(events)
+
+
+def retry_dead_letters(engine: Engine) -> int:
+    """Make parked events live again (after fixing what the target rejected). Returns how many."""
+    with Session(engine) as session, session.begin():
+        result = session.execute(
+            update(OutboxEvent)
+            .where(
+                OutboxEvent.topic == SEARCH_ITEM_TOPIC,
+                OutboxEvent.attempts >= settings.outbox_max_attempts,
+            )
+            .values(attempts=0)
+        )
+        return result.rowcount
+
+
+def run(
+    engine: Engine,
+    publish: Publisher,
+    batch_size: int,
+    poll_interval: float,
+    should_stop: Callable[[], bool] = lambda: False,
+    publish_owner: OwnerPublisher | None = None,
+) -> None:
+    """Relay forever: drain full batches back to back, sleep poll_interval when idle or failing."""
+    while not should_stop():
+        try:
+            handled = relay_batch(engine, publish, batch_size)
+        except Exception as e:
+            logger.warning("outbox relay poll failed: %s", e)
+            handled = 0
+        if publish_owner is not None:
+            try:
+                relay_owner_deletions(engine, publish_owner, batch_size)
+            except Exception as e:
+                logger.warning("outbox relay owner deletions failed: %s", e)
+        if handled < batch_size:
+            time.sleep(poll_interval)
@@ -2,25 +2,83 @@
 Celery tasks - event-driven and async processing (job: queue management, event-driven).
 Challenge: Offload indexing, notifications, heavy computation from request path.
 Use sync Elasticsearch in worker; async + event_loop in fork causes "Event loop is closed".
+Indexing is batched: the outbox relay (or a reindex script) publishes batches, each sent with
+one _bulk request; failed documents (only those) are retried as a batch.
+Every successful write waits for ES refresh, then bumps the search generation so cached
+search results are invalidated only once the change is actually searchable.
 """
 
 from app.queue.celery_app import celery_app
-from app.search.elasticsearch_client import ensure_items_index_sync, index_item_sync
+from app.search.elasticsearch_client import (
+    delete_owner_items_sync,
+    index_items_sync,
+    remove_items_sync,
+)
+from app.search.generation import bump_generation_sync
 
+RETRY_COUNTDOWN = 5
 
-@celery_app.task(bind=True, max_retries=3)
-def index_item_task(self, item_doc: dict):
+
+def _versions_of(
+    keys: list, all_keys: list, versions: list[int] | None
+) -> list[int] | None:
+    """Versions of the retried subset (keys) of a batch, in the same order."""
+    if versions is None:
+        return None
+    by_key = dict(zip(all_keys, versions))
+    return [by_key[key] for key in keys]
+
+
+# Indexing tasks are fire-and-forget: no result backend writes, and no Redis round trip on publish
+@celery_app.task(bind=True, max_retries=3, ignore_result=True)
+def index_items_task(self, item_docs: list[dict], versions: list[int] | None = None):
     """
-    Index item in Elasticsearch.
-    Fired after item create/update (event-driven: API publishes, worker consumes).
+    Index a batch of items with _bulk right away (already batched by the publisher).
+    versions (one per doc, from the outbox) make a late retry unable to overwrite newer data.
+    Only failed docs are retried.
     """
     try:
-        ensure_items_index_sync()
-        ok = index_item_sync(item_doc)
-        if not ok:
-            raise Exception("Index failed")
+        failed = index_items_sync(item_docs, refresh="wait_for", versions=versions)
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=RETRY_COUNTDOWN)
+    if len(failed) < len(item_docs):
+        bump_generation_sync()
+    if failed:
+        ids = [doc["id"] for doc in item_docs]
+        retry_versions = _versions_of([doc["id"] for doc in failed], ids, versions)
+        raise self.retry(
+            args=(failed, retry_versions),
+            exc=Exception(f"{len(failed)} docs failed"),
+            countdown=RETRY_COUNTDOWN,
+        )
+
+
+@celery_app.task(bind=True, max_retries=3, ignore_result=True)
+def remove_items_task(self, item_ids: list[int], versions: list[int] | None = None):
+    """Remove a batch of items from the index with one _bulk of deletes; only failed ids are retried."""
+    try:
+        failed = remove_items_sync(item_ids, refresh="wait_for", versions=versions)
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=RETRY_COUNTDOWN)
+    if len(failed) < len(item_ids):
+        bump_generation_sync()
+    if failed:
+        raise self.retry(
+            args=(failed, _versions_of(failed, item_ids, versions)),
+            exc=Exception(f"{len(failed)} deletes failed"),
+            countdown=RETRY_COUNTDOWN,
+        )
+
+
+@celery_app.task(bind=True, max_retries=3, ignore_result=True)
+def remove_owner_items_task(self, owner_id: int, keep_ids: list[int]):
+    """Remove every document of an owner (except keep_ids) with one delete_by_query."""
+    try:
+        deleted = delete_owner_items_sync(owner_id, keep_ids)
     except Exception as exc:
-        raise self.retry(exc=exc, countdown=5)
+        raise self.retry(exc=exc, countdown=RETRY_COUNTDOWN)
+    if deleted:
+        bump_generation_sync()
 
 
 @celery_app.task
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class ItemBase(BaseModel):
@@ -21,6 +21,35 @@ class ItemUpdate(BaseModel):
     price_cents: int | None = None
 
 
+class ItemBulkUpdate(ItemUpdate):
+    id: int
+
+
+class ItemBulkCreateRequest(BaseModel):
+    items: list[ItemCreate] = Field(..., min_length=1)
+
+
+class ItemBulkUpdateRequest(BaseModel):
+    items: list[ItemBulkUpdate] = Field(..., min_length=1)
+
+
+class ItemBulkDeleteRequest(BaseModel):
+    """Delete by explicit ids or every item of one owner (moderation); exactly one of the two."""
+
+    ids: list[int] | None = Field(None, min_length=1)
+    owner_id: int | None = None
+
+    @model_validator(mode="after")
+    def _one_selector(self) -> "ItemBulkDeleteRequest":
+        if (self.ids is None) == (self.owner_id is None):
+            raise ValueError("Provide exactly one of ids or owner_id")
+        return self
+
+
+class ItemBulkDeleteResponse(BaseModel):
+    deleted: int
+
+
 class ItemResponse(ItemBase):
     id: int
     owner_id: int
@@ -32,3 +61,10 @@ class ItemResponse(ItemBase):
 
 class ItemWithOwnerResponse(ItemResponse):
     owner_email: str | None = None  # Populated by service layer
+
+
+class ItemPage(BaseModel):
+    """Cursor-paginated page. next_cursor is None on the last page."""
+
+    items: list[ItemWithOwnerResponse]
+    next_cursor: str | None = None
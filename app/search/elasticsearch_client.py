@@ -2,19 +2,33 @@
 Elasticsearch client - search and analytics (job requirement).
 Challenge: Index management, async operations, graceful degradation when ES is down.
 Sync helpers used by Celery workers (no event loop in fork).
+Request-path calls use a short timeout behind the "elasticsearch" circuit breaker.
 """
 
+import asyncio
 import logging
+import os
 from typing import Any
 
-from elasticsearch import AsyncElasticsearch, Elasticsearch
-
-logger = logging.getLogger(__name__)
+from elasticsearch import AsyncElasticsearch, BadRequestError, Elasticsearch, NotFoundError, helpers
 
 from app.config import get_settings
+from app.core.circuit_breaker import register_breaker
+from app.core.metrics import timed
+from app.search.generation import bump_generation
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# 404s and bad queries are the caller's problem, not a sign that ES is down
+ELASTICSEARCH_BREAKER = register_breaker(
+    "elasticsearch",
+    settings.elasticsearch_breaker_failure_threshold,
+    settings.elasticsearch_breaker_reset_seconds,
+    ignore=(NotFoundError, BadRequestError),
+)
+
 # Index name for items (search use case)
 ITEMS_INDEX = "items"
 
@@ -53,16 +67,50 @@ async def get_elasticsearch() -> AsyncElasticsearch:
     """Get Elasticsearch client. Dependency injection for tests."""
     global _es_client
     if _es_client is None:
-        _es_client = AsyncElasticsearch(**_es_client_options())
+        # API side: fail fast (no retries, short timeout); the breaker and PostgreSQL fallback take over
+        _es_client = AsyncElasticsearch(
+            **{
+                **_es_client_options(),
+                "request_timeout": settings.elasticsearch_request_timeout_seconds,
+                "max_retries": 0,
+                "connections_per_node": settings.pool_share(settings.elasticsearch_max_connections),
+            }
+        )
     return _es_client
 
 
+async def warm_up_elasticsearch(connections: int) -> None:
+    """Concurrent requests make the HTTP pool open (and keep) that many connections."""
+    es = await get_elasticsearch()
+    await asyncio.gather(*(es.info() for _ in range(connections)))
+
+
+async def close_elasticsearch() -> None:
+    """Close the shared client and its connections (shutdown)."""
+    global _es_client
+    if _es_client is not None:
+        es, _es_client = _es_client, None
+        await es.close()
+
+
+async def ping_elasticsearch() -> None:
+    """Readiness: cluster answers on the shared client (bypasses the breaker)."""
+    es = await get_elasticsearch()
+    if not await es.ping():
+        raise ConnectionError("elasticsearch ping failed")
+
+
 def _items_index_mappings() -> dict:
     """Mapping for items index (shared by async and sync create)."""
     return {
         "properties": {
             "id": {"type": "integer"},
-            "title": {"type": "text", "analyzer": "standard"},
+            "title": {
+                "type": "text",
+                "analyzer": "standard",
+                # Typeahead: edge n-grams (+ shingles) built at index time, so prefix lookups are term hits
+                "fields": {"suggest": {"type": "search_as_you_type"}},
+            },
             "description": {"type": "text", "analyzer": "standard"},
             "price_cents": {"type": "integer"},
             "owner_id": {"type": "integer"},
@@ -73,7 +121,7 @@ def _items_index_mappings() -> dict:
 
 async def ensure_items_index() -> None:
     """Create items index with mapping if not exists. Single-node: 0 replicas to avoid unassigned shards."""
-    es = await get_elasticsearch()
+    es = (await get_elasticsearch()).options(request_timeout=30)  # startup only; index creation can be slow
     if not await es.indices.exists(index=ITEMS_INDEX):
         await es.indices.create(
             index=ITEMS_INDEX,
@@ -84,6 +132,7 @@ async def ensure_items_index() -> None:
         )
 
 
+@timed("elasticsearch")
 async def index_item(doc: dict[str, Any]) -> bool:
     """Index a single item for search. ES 8 expects id as str."""
     try:
@@ -91,47 +140,174 @@ async def index_item(doc: dict[str, Any]) -> bool:
         payload = {k: v for k, v in doc.items() if v is not None}
         if doc.get("created_at") is None and "created_at" not in payload:
             payload["created_at"] = "1970-01-01T00:00:00Z"
-        await es.index(index=ITEMS_INDEX, id=str(doc["id"]), document=payload)
+        await ELASTICSEARCH_BREAKER.call(es.index, index=ITEMS_INDEX, id=str(doc["id"]), document=payload)
+        await bump_generation()
         return True
     except Exception:
         return False
 
 
-async def search_items(query: str, skip: int = 0, limit: int = 20) -> list[dict[str, Any]]:
-    """Full-text search on title and description. Returns list of hits."""
+def _items_query(query: str) -> dict:
+    """Full-text query on title (boosted) and description, shared by all search modes."""
+    return {
+        "multi_match": {
+            "query": query,
+            "fields": ["title^2", "description"],
+            "fuzziness": "AUTO",
+        }
+    }
+
+
+def _items_aggregations() -> dict:
+    """Facets computed in the same request as the hits (no second query)."""
+    return {
+        "price": {
+            "histogram": {
+                "field": "price_cents",
+                "interval": settings.search_price_histogram_interval,
+                "min_doc_count": 1,
+            }
+        },
+        "owners": {"terms": {"field": "owner_id", "size": settings.search_top_owners_size}},
+    }
+
+
+def empty_search_result() -> dict[str, Any]:
+    return {"results": [], "total": 0, "total_relation": "eq"}
+
+
+@timed("elasticsearch", "search_items")
+async def search_items_raw(
+    query: str, skip: int = 0, limit: int = 20, facets: bool = False
+) -> dict[str, Any]:
+    """
+    Full-text search on title and description. Raises on ES errors (callers decide fallback/caching).
+    Returns {"results", "total", "total_relation"} plus "facets" when requested. total is exact up to
+    search_track_total_hits; beyond that total_relation is "gte" (counting every match is not free).
+    """
+    es = await get_elasticsearch()
+    kwargs: dict[str, Any] = {"aggs": _items_aggregations()} if facets else {}
+    # Use explicit kwargs for ES 8 client (body merge can differ by version)
+    response = await ELASTICSEARCH_BREAKER.call(
+        es.search,
+        index=ITEMS_INDEX,
+        query=_items_query(query),
+        from_=skip,
+        size=limit,
+        track_total_hits=settings.search_track_total_hits,
+        **kwargs,
+    )
+    # Response may be ObjectApiResponse; support both .body and dict access
+    body = getattr(response, "body", response)
+    hits = body["hits"]["hits"]
+    total = body["hits"].get("total")
+    total_val = total.get("value", len(hits)) if isinstance(total, dict) else len(hits)
+    relation = total.get("relation", "eq") if isinstance(total, dict) else "eq"
+    if total_val == 0:
+        logger.info("search_items: query=%r returned 0 hits (index may be empty or Celery not indexing)", query)
+    result = {"results": [hit["_source"] for hit in hits], "total": total_val, "total_relation": relation}
+    if facets:
+        aggs = body.get("aggregations", {})
+        result["facets"] = {
+            "price": [
+                {"from": int(b["key"]), "count": b["doc_count"]}
+                for b in aggs.get("price", {}).get("buckets", [])
+            ],
+            "owners": [
+                {"owner_id": int(b["key"]), "count": b["doc_count"]}
+                for b in aggs.get("owners", {}).get("buckets", [])
+            ],
+        }
+    return result
+
+
+async def search_items(
+    query: str, skip: int = 0, limit: int = 20, facets: bool = False
+) -> dict[str, Any]:
+    """Full-text search on title and description. Empty result (total 0) if ES is down."""
+    try:
+        return await search_items_raw(query, skip, limit, facets)
+    except Exception as e:
+        logger.warning("search_items failed: query=%r error=%s", query, e)
+        return empty_search_result()
+
+
+@timed("elasticsearch")
+async def suggest_items(prefix: str, limit: int = 10) -> list[dict[str, Any]]:
+    """
+    Typeahead on title.suggest: bool_prefix over the search_as_you_type subfields, no fuzziness,
+    no scoring of description, and only id/title fetched from _source. Returns [] if ES is down.
+    """
     try:
         es = await get_elasticsearch()
-        # Use explicit kwargs for ES 8 client (body merge can differ by version)
-        response = await es.search(
+        response = await ELASTICSEARCH_BREAKER.call(
+            es.search,
             index=ITEMS_INDEX,
             query={
                 "multi_match": {
-                    "query": query,
-                    "fields": ["title^2", "description"],
-                    "fuzziness": "AUTO",
+                    "query": prefix,
+                    "type": "bool_prefix",
+                    "fields": ["title.suggest", "title.suggest._2gram", "title.suggest._3gram"],
                 }
             },
-            from_=skip,
+            source=["id", "title"],
             size=limit,
+            track_total_hits=False,
         )
-        # Response may be ObjectApiResponse; support both .body and dict access
-        body = getattr(response, "body", response)
-        hits = body["hits"]["hits"]
-        total = body["hits"].get("total")
-        total_val = total.get("value", len(hits)) if isinstance(total, dict) else len(hits)
-        if total_val == 0:
-            logger.info("search_items: query=%r returned 0 hits (index may be empty or Celery not indexing)", query)
-        return [hit["_source"] for hit in hits]
     except Exception as e:
-        logger.warning("search_items failed: query=%r error=%s", query, e)
+        logger.warning("suggest_items failed: prefix=%r error=%s", prefix, e)
         return []
+    body = getattr(response, "body", response)
+    return [hit["_source"] for hit in body["hits"]["hits"]]
 
 
+@timed("elasticsearch")
+async def search_items_after(
+    query: str,
+    limit: int = 20,
+    pit_id: str | None = None,
+    search_after: list[Any] | None = None,
+) -> tuple[list[dict[str, Any]], str | None, list[Any] | None]:
+    """
+    Deep pagination: search_after over a point-in-time (consistent snapshot, no 10k window).
+    Every page costs the same as page one. Returns (hits, pit_id, sort values of last hit);
+    pit_id/search_after are None on the last page (PIT closed). Raises on ES errors,
+    elasticsearch.NotFoundError when the PIT expired.
+    """
+    es = await get_elasticsearch()
+    keep_alive = settings.search_pit_keep_alive
+    if pit_id is None:
+        pit = await ELASTICSEARCH_BREAKER.call(es.open_point_in_time, index=ITEMS_INDEX, keep_alive=keep_alive)
+        pit_id = pit["id"]
+    kwargs: dict[str, Any] = {"search_after": search_after} if search_after else {}
+    response = await ELASTICSEARCH_BREAKER.call(
+        es.search,
+        query=_items_query(query),
+        pit={"id": pit_id, "keep_alive": keep_alive},
+        sort=[{"_score": "desc"}, {"_shard_doc": "asc"}],  # _shard_doc: cheap unique tie-breaker
+        size=limit,
+        track_total_hits=False,
+        **kwargs,
+    )
+    body = getattr(response, "body", response)
+    hits = body["hits"]["hits"]
+    pit_id = body.get("pit_id", pit_id)  # ES may hand back a new PIT id
+    if len(hits) < limit:
+        try:
+            await es.close_point_in_time(id=pit_id)
+        except Exception:
+            pass  # expires on its own after keep_alive
+        return [hit["_source"] for hit in hits], None, None
+    return [hit["_source"] for hit in hits], pit_id, hits[-1]["sort"]
+
+
+@timed("elasticsearch")
 async def remove_item_from_index(item_id: int) -> bool:
     """Remove item from search index when deleted."""
     try:
         es = await get_elasticsearch()
-        await es.delete(index=ITEMS_INDEX, id=str(item_id), ignore=404)
+        await ELASTICSEARCH_BREAKER.call(es.delete, index=ITEMS_INDEX, id=str(item_id), ignore=404)
+        await bump_generation()
         return True
     except Exception:
         return False
@@ -139,13 +315,29 @@ async def remove_item_from_index(item_id: int) -> bool:
 
 # --- Sync API for Celery (workers run in sync context; async + new_event_loop fails after fork) ---
 
+# One pooled client per worker process. Created lazily in the child; pid check guards against
+# reusing a client (and its sockets) inherited from the parent across fork.
+_sync_client: Elasticsearch | None = None
+_sync_client_pid: int | None = None
+_index_ensured = False
+
+
 def _sync_es_client() -> Elasticsearch:
-    """New sync client per call (safe in forked Celery worker)."""
-    return Elasticsearch(**_es_client_options())
+    """Per-process sync client with a persistent connection pool (safe in forked Celery worker)."""
+    global _sync_client, _sync_client_pid, _index_ensured
+    pid = os.getpid()
+    if _sync_client is None or _sync_client_pid != pid:
+        _sync_client = Elasticsearch(**_es_client_options())
+        _sync_client_pid = pid
+        _index_ensured = False
+    return _sync_client
 
 
 def ensure_items_index_sync() -> None:
-    """Create items index if not exists. Single-node: 0 replicas. Call from Celery task."""
+    """Create items index if not exists. Single-node: 0 replicas. Checks ES once per worker process."""
+    global _index_ensured
+    if _index_ensured and _sync_client_pid == os.getpid():
+        return
     try:
         es = _sync_es_client()
         if not es.indices.exists(index=ITEMS_INDEX):
@@ -154,22 +346,118 @@ def ensure_items_index_sync() -> None:
                 settings={"index": {"number_of_replicas": 0}},
                 mappings=_items_index_mappings(),
             )
+        _index_ensured = True
     except Exception as e:
         logger.warning("ensure_items_index_sync failed: %s", e)
 
 
-def index_item_sync(doc: dict[str, Any]) -> bool:
-    """Index a single item. Call from Celery task. ES 8 requires id to be str."""
-    try:
-        es = _sync_es_client()
-        # ES 8 client expects document id as string
-        doc_id = str(doc["id"])
-        # Avoid sending null for date field (ES can reject)
-        payload = {k: v for k, v in doc.items() if v is not None}
-        if "created_at" not in payload and doc.get("created_at") is None:
-            payload["created_at"] = "1970-01-01T00:00:00Z"
-        es.index(index=ITEMS_INDEX, id=doc_id, document=payload)
-        return True
-    except Exception as e:
-        logger.warning("index_item_sync failed for doc id=%s: %s", doc.get("id"), e)
-        return False
+def item_document(item: Any) -> dict[str, Any]:
+    """Search document for an Item ORM object or a row with the same columns."""
+    return {
+        "id": item.id,
+        "title": item.title,
+        "description": item.description or "",
+        "price_cents": item.price_cents,
+        "owner_id": item.owner_id,
+        "created_at": item.created_at.isoformat() if item.created_at else None,
+    }
+
+
+def _index_payload(doc: dict[str, Any]) -> dict[str, Any]:
+    """Drop nulls (ES can reject null dates) and default created_at."""
+    payload = {k: v for k, v in doc.items() if v is not None}
+    if "created_at" not in payload:
+        payload["created_at"] = "1970-01-01T00:00:00Z"
+    return payload
+
+
+def _versioned(action: dict[str, Any], version: int | None) -> dict[str, Any]:
+    # external_gte: ES applies the write only if version >= the document's, so a delayed older
+    # write is rejected (409) instead of overwriting a newer one
+    if version is not None:
+        action.update(version=version, version_type="external_gte")
+    return action
+
+
+def index_action(doc: dict[str, Any], version: int | None = None) -> dict[str, Any]:
+    """_bulk index action for an item document. ES 8 requires id to be str."""
+    action = {"_op_type": "index", "_index": ITEMS_INDEX, "_id": str(doc["id"]), "_source": _index_payload(doc)}
+    return _versioned(action, version)
+
+
+def delete_action(item_id: int, version: int | None = None) -> dict[str, Any]:
+    """_bulk delete action; a 404 (already gone) counts as success in bulk_sync."""
+    return _versioned({"_op_type": "delete", "_index": ITEMS_INDEX, "_id": str(item_id)}, version)
+
+
+def bulk_sync(
+    actions: list[dict[str, Any]], chunk_size: int = 500, refresh: str | None = None
+) -> list[dict[str, Any]]:
+    """
+    Send actions through streaming_bulk (429s retried with backoff by the helper).
+    Returns the actions that still failed, so callers retry only those.
+    Connection-level errors propagate (nothing was confirmed; retry everything).
+    refresh="wait_for" returns only once the changes are searchable.
+    """
+    if not actions:
+        return []
+    es = _sync_es_client()
+    # Results are not in input order (429 retries come back later); match failures by (op, _id)
+    by_key = {(a.get("_op_type", "index"), a["_id"]): a for a in actions}
+    failed = []
+    for ok, info in helpers.streaming_bulk(
+        es,
+        actions,
+        chunk_size=chunk_size,
+        max_retries=2,
+        raise_on_error=False,
+        raise_on_exception=False,
+        **({"refresh": refresh} if refresh else {}),
+    ):
+        if ok:
+            continue
+        op_type, result = next(iter(info.items()))
+        # A delete of a missing document is already the desired state
+        if op_type == "delete" and result.get("status") == 404:
+            continue
+        # Versioned write lost to a newer one: the index already holds a later state
+        if result.get("status") == 409:
+            continue
+        logger.warning("bulk %s failed for id=%s: %s", op_type, result.get("_id"), result.get("error"))
+        action = by_key.get((op_type, result.get("_id")))
+        if action is not None:
+            failed.append(action)
+    return failed
+
+
+def index_items_sync(
+    docs: list[dict[str, Any]], refresh: str | None = None, versions: list[int] | None = None
+) -> list[dict[str, Any]]:
+    """Index many items via _bulk (versions: one per doc, see index_action). Returns the docs that failed."""
+    ensure_items_index_sync()
+    actions = [index_action(doc, version) for doc, version in zip(docs, versions or [None] * len(docs))]
+    failed_ids = {a["_id"] for a in bulk_sync(actions, refresh=refresh)}
+    return [doc for doc in docs if str(doc["id"]) in failed_ids]
+
+
+def remove_items_sync(
+    item_ids: list[int], refresh: str | None = None, versions: list[int] | None = None
+) -> list[int]:
+    """Delete many items from the index via _bulk (versions: one per id). Returns the ids that failed."""
+    actions = [delete_action(id, version) for id, version in zip(item_ids, versions or [None] * len(item_ids))]
+    failed_ids = {a["_id"] for a in bulk_sync(actions, refresh=refresh)}
+    return [id for id in item_ids if str(id) in failed_ids]
+
+
+def delete_owner_items_sync(owner_id: int, keep_ids: list[int], refresh: bool = True) -> int:
+    """
+    One delete_by_query for every document of owner_id except keep_ids (items the owner has
+    created since). Returns the number deleted; errors propagate (the caller retries).
+    """
+    query: dict[str, Any] = {"bool": {"filter": [{"term": {"owner_id": owner_id}}]}}
+    if keep_ids:
+        query["bool"]["must_not"] = [{"ids": {"values": [str(id) for id in keep_ids]}}]
+    result = _sync_es_client().delete_by_query(
+        index=ITEMS_INDEX, query=query, conflicts="proceed", refresh=refresh
+    )
+    return result.get("deleted", 0)
@@ -0,0 +1,119 @@
+"""
+Pluggable search engines - Elasticsearch, PostgreSQL full-text, and failover between them.
+Challenge: During an ES incident search silently returned nothing; small deployments
+should not need an ES cluster at all.
+Design: One async search(query, skip, limit, facets) contract returning
+{"results", "total", "total_relation"}. FailoverEngine serves PostgreSQL results when the
+primary fails; the ES client's circuit breaker makes that instant while ES is known down.
+Fallback results are marked "degraded" so the result cache does not keep them.
+"""
+
+import logging
+from typing import Any, Protocol
+
+from app.config import get_settings
+from app.core.circuit_breaker import CircuitOpenError
+from app.db.repositories.item_repository import ItemRepository
+from app.db.session import async_session_maker
+from app.search.elasticsearch_client import search_items_raw
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class SearchEngine(Protocol):
+    name: str
+    # Results may be cached under the ES index generation (only ES writes bump it)
+    cacheable: bool
+
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 20, facets: bool = False
+    ) -> dict[str, Any]: ...
+
+
+class ElasticsearchEngine:
+    """Fuzzy multi_match with totals and facets. Raises on ES errors."""
+
+    name = "elasticsearch"
+    cacheable = True
+
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 20, facets: bool = False
+    ) -> dict[str, Any]:
+        return await search_items_raw(query, skip, limit, facets)
+
+
+class PostgresEngine:
+    """websearch_to_tsquery over the generated items.search_vector column (GIN). No facets, no fuzziness."""
+
+    name = "postgres"
+    cacheable = False  # one indexed query, and always consistent with the DB
+
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 20, facets: bool = False
+    ) -> dict[str, Any]:
+        async with async_session_maker() as session:
+            rows, total = await ItemRepository(session).full_text_search(
+                query, skip, limit
+            )
+        results = [
+            {
+                "id": row.id,
+                "title": row.title,
+                "description": row.description or "",
+                "price_cents": row.price_cents,
+                "owner_id": row.owner_id,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+            }
+            for row in rows
+        ]
+        return {"results": results, "total": total, "total_relation": "eq"}
+
+
+class FailoverEngine:
+    """Fallback answers whenever the primary raises (including CircuitOpenError while it is down)."""
+
+    def __init__(self, primary: SearchEngine, fallback: SearchEngine):
+        self.primary = primary
+        self.fallback = fallback
+        self.name = primary.name
+        self.cacheable = primary.cacheable
+
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 20, facets: bool = False
+    ) -> dict[str, Any]:
+        try:
+            return await self.primary.search(query, skip, limit, facets)
+        except CircuitOpenError:
+            pass  # already logged when the circuit opened
+        except Exception as e:
+            logger.warning(
+                "search engine %s failed, falling back to %s: query=%r error=%s",
+                self.primary.name,
+                self.fallback.name,
+                query,
+                e,
+            )
+        result = await self.fallback.search(query, skip, limit, facets)
+        return {**result, "degraded": True}
+
+
+_engine: SearchEngine | None = None
+
+
+def get_search_engine() -> SearchEngine:
+    """Engine selected by settings.search_engine ("elasticsearch" with PostgreSQL failover, or "postgres")."""
+    global _engine
+    if _engine is None:
+        if settings.search_engine == "postgres":
+            _engine = PostgresEngine()
+        else:
+            _engine = FailoverEngine(ElasticsearchEngine(), PostgresEngine())
+    return _engine
+
+
+def reset_search_engine() -> None:
+    """Drop the engine; rebuilt from settings on next use."""
+    global _engine
+    _engine = None
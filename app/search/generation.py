@@ -0,0 +1,56 @@
+"""
+Search index generation counter - cheap, global invalidation of cached search results.
+Challenge: Cached results must not outlive index changes, but tracking which cached
+queries a document affects is impossible.
+Design: Every index write bumps one Redis counter; result cache keys embed the current
+generation, so a bump orphans all old entries at once (they expire by TTL).
+"""
+
+import logging
+
+from app.cache.local_cache import TTLCache
+from app.cache.redis_client import get_sync_redis, run_redis
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "search:generation"
+
+# API side: remember the generation briefly so cached searches cost one Redis GET, not two.
+# ES itself only makes writes searchable after its 1s refresh interval.
+_generation_l1 = TTLCache(max_size=1, ttl_seconds=1.0)
+
+
+async def current_generation() -> int | None:
+    """Current index generation, or None if Redis is unavailable (caller must not cache)."""
+    generation = _generation_l1.get(GENERATION_KEY)
+    if generation is not None:
+        return generation
+    try:
+        generation = int(
+            await run_redis(lambda client: client.get(GENERATION_KEY)) or 0
+        )
+    except Exception:
+        return None
+    _generation_l1.set(GENERATION_KEY, generation)
+    return generation
+
+
+async def bump_generation() -> None:
+    """Invalidate all cached search results (async callers, e.g. API-side index writes)."""
+    _generation_l1.clear()
+    try:
+        await run_redis(lambda client: client.incr(GENERATION_KEY))
+    except Exception as e:
+        logger.warning("bump_generation failed: %s", e)
+
+
+def bump_generation_sync() -> None:
+    """Invalidate all cached search results (Celery workers, CLI scripts)."""
+    try:
+        get_sync_redis().incr(GENERATION_KEY)
+    except Exception as e:
+        logger.warning("bump_generation_sync failed: %s", e)
+
+
+def clear_local_generation() -> None:
+    _generation_l1.clear()
@@ -0,0 +1,189 @@
+"""
+Zero-downtime reindex: stream items from PostgreSQL straight into a new versioned
+Elasticsearch index, then atomically point the `items` alias at it.
+Challenge: Full reindex without loading the catalog into memory or taking search offline.
+Design: Server-side cursor (yield_per) -> generator of _bulk actions -> streaming_bulk.
+Memory is bounded by the cursor batch and bulk chunk size, not by catalog size.
+Sync code (psycopg2 + sync ES client): runs from a CLI script, like Alembic.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from elasticsearch import Elasticsearch, helpers
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+from app.db.models.item import Item
+from app.search.elasticsearch_client import (
+    ITEMS_INDEX,
+    _items_index_mappings,
+    _sync_es_client,
+    index_action,
+    item_document,
+)
+from app.search.generation import bump_generation_sync
+
+logger = logging.getLogger(__name__)
+
+CATCH_UP_MARGIN = timedelta(minutes=1)
+
+
+@dataclass
+class ReindexStats:
+    index: str
+    indexed: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.indexed / self.seconds if self.seconds else 0.0
+
+
+def sync_engine() -> Engine:
+    """Sync engine for the app database (same URL rewrite as alembic/env.py)."""
+    url = get_settings().database_url.replace(
+        "postgresql+asyncpg", "postgresql+psycopg2"
+    )
+    return create_engine(url)
+
+
+def versioned_index_name(now: datetime | None = None) -> str:
+    """e.g. items_20260101t120000; sortable, one per reindex run."""
+    now = now or datetime.now(timezone.utc)
+    return f"{ITEMS_INDEX}_{now.strftime('%Y%m%dt%H%M%S')}"
+
+
+def stream_item_docs(
+    engine: Engine, batch_size: int, updated_since: datetime | None = None
+) -> Iterator[dict]:
+    """Yield item documents from a server-side cursor; at most batch_size rows held in memory."""
+    stmt = select(
+        Item.id,
+        Item.title,
+        Item.description,
+        Item.price_cents,
+        Item.owner_id,
+        Item.created_at,
+    ).order_by(Item.id)
+    if updated_since is not None:
+        stmt = stmt.where(Item.updated_at >= updated_since)
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, yield_per=batch_size
+        ).execute(stmt)
+        for row in result:
+            yield item_document(row)
+
+
+def create_versioned_index(es: Elasticsearch, name: str) -> None:
+    """New index tuned for bulk load: no refresh, no replicas (restored by finalize_index)."""
+    es.indices.create(
+        index=name,
+        settings={"index": {"number_of_replicas": 0, "refresh_interval": "-1"}},
+        mappings=_items_index_mappings(),
+    )
+
+
+def finalize_index(es: Elasticsearch, name: str) -> None:
+    """Restore normal refresh and make everything searchable before the alias swap."""
+    es.indices.put_settings(index=name, settings={"index": {"refresh_interval": None}})
+    es.indices.refresh(index=name)
+
+
+def swap_alias(es: Elasticsearch, new_index: str) -> list[str]:
+    """
+    Atomically point the ITEMS_INDEX alias at new_index. A legacy concrete index named
+    ITEMS_INDEX is removed in the same request. Returns indices previously behind the alias.
+    """
+    actions: list[dict[str, Any]] = []
+    previous: list[str] = []
+    if es.indices.exists_alias(name=ITEMS_INDEX):
+        previous = list(es.indices.get_alias(name=ITEMS_INDEX).body)
+        actions += [
+            {"remove": {"index": old, "alias": ITEMS_INDEX}} for old in previous
+        ]
+    elif es.indices.exists(index=ITEMS_INDEX):
+        actions.append({"remove_index": {"index": ITEMS_INDEX}})
+    actions.append({"add": {"index": new_index, "alias": ITEMS_INDEX}})
+    es.indices.update_aliases(actions=actions)
+    return previous
+
+
+def bulk_load(
+    es: Elasticsearch,
+    index: str,
+    docs: Iterator[dict],
+    stats: ReindexStats,
+    chunk_size: int,
+    progress: Callable[[ReindexStats], None] | None = None,
+    progress_every: int = 10_000,
+) -> None:
+    """streaming_bulk docs into index, updating stats and reporting progress."""
+    actions = ({**index_action(doc), "_index": index} for doc in docs)
+    start = time.perf_counter() - stats.seconds
+    for ok, info in helpers.streaming_bulk(
+        es, actions, chunk_size=chunk_size, max_retries=3, raise_on_error=False
+    ):
+        if ok:
+            stats.indexed += 1
+        else:
+            stats.failed += 1
+            logger.warning("reindex failed: %s", info)
+        if progress and (stats.indexed + stats.failed) % progress_every == 0:
+            stats.seconds = time.perf_counter() - start
+            progress(stats)
+    stats.seconds = time.perf_counter() - start
+
+
+def reindex(
+    batch_size: int = 2_000,
+    chunk_size: int = 1_000,
+    delete_old: bool = False,
+    progress: Callable[[ReindexStats], None] | None = None,
+) -> ReindexStats:
+    """
+    Full reindex into a new versioned index and alias swap. Rows changed while the
+    load ran are re-streamed after the swap (catch-up pass), so no update is lost.
+    """
+    es = _sync_es_client()
+    engine = sync_engine()
+    started_at = datetime.now(timezone.utc)
+    stats = ReindexStats(index=versioned_index_name(started_at))
+    try:
+        create_versioned_index(es, stats.index)
+        bulk_load(
+            es,
+            stats.index,
+            stream_item_docs(engine, batch_size),
+            stats,
+            chunk_size,
+            progress,
+        )
+        finalize_index(es, stats.index)
+        previous = swap_alias(es, stats.index)
+        bump_generation_sync()
+        # Writers now hit the new index via the alias; re-send rows updated during the load
+        # (margin covers clock skew between this host and the database)
+        since = started_at - CATCH_UP_MARGIN
+        bulk_load(
+            es,
+            stats.index,
+            stream_item_docs(engine, batch_size, since),
+            stats,
+            chunk_size,
+        )
+        es.indices.refresh(index=stats.index)
+        bump_generation_sync()
+        if delete_old:
+            for old in previous:
+                es.indices.delete(index=old)
+    finally:
+        engine.dispose()
+    return stats
@@ -0,0 +1,104 @@
+"""
+Production server entry point: python -m app.server
+Challenge: One uvicorn process uses one core; N processes must not open N times the connections.
+Design: uvicorn supervisor with web_concurrency workers (default one per CPU), uvloop + httptools when
+installed. The resolved worker count is exported as WEB_CONCURRENCY before workers start, so each
+worker's Settings.pool_share() divides the DB/Redis/ES connection budgets by the same number; the
+count is capped at Settings.max_workers() because every worker opens at least one connection per pool.
+With several workers, Prometheus runs in multiprocess mode so /metrics covers all of them.
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import tempfile
+
+import uvicorn
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_workers(requested: int) -> int:
+    """requested, or one worker per CPU available to this process when 0."""
+    if requested > 0:
+        return requested
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:  # not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def clamp_workers(workers: int, limit: int) -> int:
+    """workers, capped (with a warning) at limit so the pools stay within their budgets."""
+    if workers > limit:
+        logger.warning(
+            "%d workers would exceed the connection budgets; starting %d (raise DB_POOL_SIZE/DB_MAX_OVERFLOW)",
+            workers,
+            limit,
+        )
+        return limit
+    return workers
+
+
+def event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def main():
+    settings = get_settings()
+    ap = argparse.ArgumentParser(
+        description="Run the API with multiple worker processes"
+    )
+    ap.add_argument("--host", default="0.0.0.0")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=settings.web_concurrency,
+        help="Worker processes (0 = one per CPU)",
+    )
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    workers = clamp_workers(resolve_workers(args.workers), settings.max_workers())
+    # Workers are fresh interpreters that read settings from the environment
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    if workers > 1:
+        # Each scrape of /metrics lands on one worker: share samples through files so it reports all
+        if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+            os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(
+                prefix="prometheus-"
+            )
+    get_settings.cache_clear()
+    settings = get_settings()
+    logger.info(
+        "starting %d worker(s), loop=%s http=%s; per worker: db pool=%d+%d redis=%d es=%d",
+        workers,
+        event_loop(),
+        http_protocol(),
+        settings.pool_share(settings.db_pool_size),
+        settings.pool_share(settings.db_max_overflow),
+        settings.pool_share(settings.redis_max_connections),
+        settings.pool_share(settings.elasticsearch_max_connections),
+    )
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop=event_loop(),
+        http=http_protocol(),
+        proxy_headers=True,
+        forwarded_allow_ips=settings.forwarded_allow_ips,
+    )
+
+
+if __name__ == "__main__":
+    main()
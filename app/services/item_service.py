@@ -2,36 +2,128 @@
 Item service - business logic for items (SOLID: Single Responsibility).
 Challenge: Orchestrate repository, cache, search, queue; keep controllers thin.
 Design: Service depends on abstractions (repositories); easy to test with mocks.
+Item detail is cached in two tiers: in-process L1 (serialized response JSON, no network hop)
+in front of Redis L2, which by default stores the same response bytes behind a small binary
+header. Update/delete evict L1 on every replica via Redis pub/sub, and again after commit.
 """
 
+from typing import Any
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.db.repositories.item_repository import ItemRepository
 from app.db.repositories.user_repository import UserRepository
-from app.schemas.item import ItemCreate, ItemUpdate, ItemWithOwnerResponse
+from app.schemas.item import ItemBulkUpdate, ItemCreate, ItemUpdate, ItemWithOwnerResponse
 from app.db.models.item import Item
-from app.cache.redis_client import cache_get, cache_set, cache_delete
+from app.db.session import run_after_commit
+from app.cache.local_cache import TTLCache
+from app.cache.redis_client import (
+    BinaryCodec,
+    cache_get_many,
+    cache_get_or_load,
+    cache_invalidate,
+    cache_set_many,
+)
+from app.config import get_settings
+from app.core.metrics import ITEM_CACHE_REQUESTS
 from app.search.elasticsearch_client import ensure_items_index
-from app.queue.tasks import index_item_task
+from app.db.models.outbox import SEARCH_ITEM_TOPIC, SEARCH_OWNER_DELETED_TOPIC
+from app.db.repositories.outbox_repository import OutboxRepository
+from app.core.pagination import encode_cursor
+from app.core.responses import dumps
 
 # Cache key prefix and TTL for item detail (performance optimization)
 CACHE_PREFIX = "item:"
+# Binary entries live under their own prefix: replicas still reading the JSON envelope never see them
+BODY_CACHE_PREFIX = "item:body:"
+# Version of the cached ItemWithOwnerResponse body; bump when its fields change
+ITEM_RESPONSE_SCHEMA = 1
 CACHE_TTL = 300
+CACHE_STALE_TTL = 60  # Serve stale this long past TTL while one request revalidates
+ITEM_INVALIDATION_CHANNEL = "cache:invalidate:item"
 
+settings = get_settings()
 
-def _item_to_doc(item: Item) -> dict:
-    """Convert ORM model to document for Elasticsearch and cache."""
-    return {
-        "id": item.id,
-        "title": item.title,
-        "description": item.description or "",
-        "price_cents": item.price_cents,
-        "owner_id": item.owner_id,
-        "created_at": item.created_at.isoformat() if item.created_at else None,
-    }
+# L1: item id -> ItemWithOwnerResponse JSON bytes, per process
+_item_l1 = TTLCache(
+    max_size=settings.item_l1_cache_max_size,
+    ttl_seconds=settings.item_l1_cache_ttl_seconds,
+)
+
+# L2 format: response bytes (binary mode) or the JSON envelope (None)
+_l2_codec: BinaryCodec | None = (
+    BinaryCodec(ITEM_RESPONSE_SCHEMA, settings.item_cache_compress_min_bytes)
+    if settings.item_cache_binary
+    else None
+)
+
+
+def _l2_key(id: int) -> str:
+    return (CACHE_PREFIX if _l2_codec is None else BODY_CACHE_PREFIX) + str(id)
+
+
+def _to_l2(body: bytes) -> Any:
+    """L2 value for a serialized item: the bytes themselves, or a JSON-safe dict for the envelope."""
+    return body if _l2_codec is not None else orjson.loads(body)
+
+
+def _from_l2(value: Any) -> bytes:
+    return value if _l2_codec is not None else dumps(value)
+
+
+def handle_item_invalidation_message(data: str) -> None:
+    """Pub/sub handler for ITEM_INVALIDATION_CHANNEL: evict comma-separated item ids from this replica's L1."""
+    for part in data.split(","):
+        try:
+            _item_l1.delete(int(part))
+        except ValueError:
+            pass
+
+
+def clear_local_item_cache() -> None:
+    """Drop this process's L1 (tests, or after losing pub/sub)."""
+    _item_l1.clear()
+
+
+async def _invalidate_item_caches(session: AsyncSession, ids: list[int]) -> None:
+    """Evict items now and again once the request transaction commits: a read between the two
+    still sees the old row and may cache it again, and nothing else would evict it before
+    CACHE_TTL + CACHE_STALE_TTL."""
+    if not ids:
+        return
+    ids = list(ids)
+    await _evict_item_caches(ids)
+    run_after_commit(session, lambda: _evict_item_caches(ids))
+
+
+async def _evict_item_caches(ids: list[int]) -> None:
+    """Evict items from L1 here, then L2 (one DEL) and L1 on other replicas (one pub/sub message)
+    in a single pipelined round trip."""
+    for id in ids:
+        _item_l1.delete(id)
+    # Both L2 formats: replicas on the other format may have cached the item too
+    keys = [prefix + str(id) for id in ids for prefix in (CACHE_PREFIX, BODY_CACHE_PREFIX)]
+    await cache_invalidate(keys, ITEM_INVALIDATION_CHANNEL, ",".join(map(str, ids)))
+
+
+def _owner_email(item: Item) -> str | None:
+    return getattr(item.owner, "email", None) if hasattr(item, "owner") else None
 
 
 def _item_to_response(item: Item) -> ItemWithOwnerResponse:
     """Map model to API response with owner email."""
-    data = {
+    return _item_to_response_with_email(item, _owner_email(item))
+
+
+def _item_to_response_with_email(item: Item, owner_email: str | None) -> ItemWithOwnerResponse:
+    """Map model to API response when owner email is already known (bulk paths, owner not loaded)."""
+    return ItemWithOwnerResponse(**_item_to_dict(item, owner_email))
+
+
+def _item_to_dict(item: Item, owner_email: str | None) -> dict[str, Any]:
+    """ItemWithOwnerResponse fields as a plain dict: read paths serialize it with orjson, no model."""
+    return {
         "id": item.id,
         "title": item.title,
         "description": item.description,
@@ -39,20 +131,26 @@ def _item_to_response(item: Item) -> ItemWithOwnerResponse:
         "owner_id": item.owner_id,
         "created_at": item.created_at,
         "updated_at": item.updated_at,
-        "owner_email": getattr(item.owner, "email", None) if hasattr(item, "owner") else None,
+        "owner_email": owner_email,
     }
-    return ItemWithOwnerResponse(**data)
 
 
 class ItemService:
     """Handles all item use cases: CRUD, cache, search indexing."""
 
-    def __init__(self, item_repo: ItemRepository, user_repo: UserRepository):
+    def __init__(
+        self,
+        item_repo: ItemRepository,
+        user_repo: UserRepository,
+        outbox_repo: OutboxRepository | None = None,
+    ):
         self.item_repo = item_repo
         self.user_repo = user_repo
+        # Search indexing is recorded in the same transaction and published by the outbox relay
+        self.outbox_repo = outbox_repo or OutboxRepository(item_repo.session)
 
     async def create(self, data: ItemCreate) -> ItemWithOwnerResponse:
-        """Create item, enqueue indexing (event-driven), return response."""
+        """Create item, record indexing in the outbox (event-driven), return response."""
         item = Item(
             title=data.title,
             description=data.description,
@@ -60,35 +158,143 @@ class ItemService:
             owner_id=data.owner_id,
         )
         item = await self.item_repo.add(item)
-        # Event-driven: send to queue instead of blocking on Elasticsearch
-        index_item_task.delay(_item_to_doc(item))
+        # Event-driven: the relay indexes it after commit (no broker or ES call in the request)
+        await self.outbox_repo.add_many(SEARCH_ITEM_TOPIC, [item.id])
         # Reload with owner loaded to avoid lazy load in async context (MissingGreenlet)
         item = await self.item_repo.get_by_id_with_owner(item.id)
         return _item_to_response(item)
 
+    async def bulk_create(self, items: list[ItemCreate]) -> list[ItemWithOwnerResponse]:
+        """
+        Create many items: one owner lookup, one multi-row INSERT ... RETURNING,
+        and one outbox INSERT. Raises ValueError on unknown owner ids.
+        """
+        owner_ids = list({data.owner_id for data in items})
+        emails = await self.user_repo.get_emails_by_ids(owner_ids)
+        unknown = sorted(set(owner_ids) - emails.keys())
+        if unknown:
+            raise ValueError(f"Unknown owner_id(s): {unknown}")
+        created = await self.item_repo.add_many([data.model_dump() for data in items])
+        await self.outbox_repo.add_many(SEARCH_ITEM_TOPIC, [item.id for item in created])
+        return [_item_to_response_with_email(item, emails[item.owner_id]) for item in created]
+
+    async def bulk_update(
+        self, items: list[ItemBulkUpdate], owner_id: int | None = None
+    ) -> list[ItemWithOwnerResponse]:
+        """
+        Update many items with one bulk UPDATE, reload them in one query, invalidate caches
+        in one round trip each and re-index via the outbox. Unknown ids (and, with owner_id,
+        other owners' items) are skipped.
+        """
+        changes: dict[int, dict] = {}
+        for data in items:
+            changes.setdefault(data.id, {}).update(data.model_dump(exclude_unset=True, exclude_none=True))
+        existing = await self.item_repo.existing_ids(list(changes), owner_id=owner_id)
+        rows = [{**fields, "id": id} for id, fields in changes.items() if id in existing and len(fields) > 1]
+        await self.item_repo.update_many(rows, owner_id=owner_id)
+        ids = [id for id in changes if id in existing]
+        updated = await self.item_repo.get_many_by_ids_with_owner(ids, refresh=True)
+        await _invalidate_item_caches(self.item_repo.session, ids)
+        await self.outbox_repo.add_many(SEARCH_ITEM_TOPIC, [item.id for item in updated])
+        by_id = {item.id: item for item in updated}
+        return [_item_to_response(by_id[id]) for id in ids if id in by_id]
+
     async def get_by_id(self, id: int, use_cache: bool = True) -> ItemWithOwnerResponse | None:
-        """Get item by id. Uses Redis cache to reduce DB load (performance)."""
-        if use_cache:
-            cached = await cache_get(CACHE_PREFIX + str(id))
-            if cached:
-                import json
-                data = json.loads(cached)
-                return ItemWithOwnerResponse(**data)
-        item = await self.item_repo.get_by_id_with_owner(id)
-        if not item:
+        """Get item by id as a response model (cached path: see get_json_by_id)."""
+        if not use_cache:
+            item = await self.item_repo.get_by_id_with_owner(id)
+            return _item_to_response(item) if item else None
+        body = await self.get_json_by_id(id)
+        return ItemWithOwnerResponse.model_validate_json(body) if body else None
+
+    async def get_json_by_id(self, id: int) -> bytes | None:
+        """
+        Item detail as response-ready JSON bytes. Uses Redis cache to reduce DB load (performance).
+        L1 holds the bytes, so a hit is a dict lookup; an L2 hit in binary mode is the stored
+        body as-is. Misses are serialized once, no model built.
+        Concurrent misses on a hot item are coalesced into one DB query (stampede protection).
+        """
+        body = _item_l1.get(id)
+        if body is not None:
+            ITEM_CACHE_REQUESTS.labels(tier="l1", result="hit").inc()
+            return body
+        ITEM_CACHE_REQUESTS.labels(tier="l1", result="miss").inc()
+
+        loaded: bytes | None = None
+
+        async def load() -> Any:
+            nonlocal loaded
+            item = await self.item_repo.get_by_id_with_owner(id)
+            if not item:
+                return None
+            loaded = dumps(_item_to_dict(item, _owner_email(item)))
+            return _to_l2(loaded)
+
+        data = await cache_get_or_load(
+            _l2_key(id), load, CACHE_TTL, stale_ttl_seconds=CACHE_STALE_TTL, codec=_l2_codec
+        )
+        # Only a cached body is a hit; a load, and an unknown id (nothing cached or loaded), are misses
+        ITEM_CACHE_REQUESTS.labels(tier="l2", result="hit" if data and loaded is None else "miss").inc()
+        if not data:
             return None
-        resp = _item_to_response(item)
-        if use_cache:
-            await cache_set(CACHE_PREFIX + str(id), resp.model_dump(mode="json"), CACHE_TTL)
-        return resp
+        body = loaded or _from_l2(data)
+        _item_l1.set(id, body)
+        return body
+
+    async def get_many_json_by_ids(self, ids: list[int]) -> list[bytes]:
+        """
+        Batch get in request order (unknown ids skipped), each item as JSON bytes. L1, then one
+        Redis MGET for the rest, then one DB query for remaining misses, backfilled with one
+        pipelined SETEX.
+        """
+        found: dict[int, bytes] = {}
+        for id in ids:
+            body = _item_l1.get(id)
+            if body is not None:
+                found[id] = body
+        l1_hits = len(found)
+        ITEM_CACHE_REQUESTS.labels(tier="l1", result="hit").inc(l1_hits)
+        ITEM_CACHE_REQUESTS.labels(tier="l1", result="miss").inc(len(ids) - l1_hits)
+
+        missing = [id for id in ids if id not in found]
+        cached = await cache_get_many([_l2_key(id) for id in missing], codec=_l2_codec)
+        for id, data in zip(missing, cached):
+            if data:
+                found[id] = _from_l2(data)
+                _item_l1.set(id, found[id])
+        l2_hits = len(found) - l1_hits
+        ITEM_CACHE_REQUESTS.labels(tier="l2", result="hit").inc(l2_hits)
+        ITEM_CACHE_REQUESTS.labels(tier="l2", result="miss").inc(len(missing) - l2_hits)
 
-    async def list_items(self, skip: int = 0, limit: int = 20) -> list[ItemWithOwnerResponse]:
-        """Paginated list with owner (eager loading in repo)."""
+        missing = [id for id in missing if id not in found]
+        if missing:
+            backfill = {}
+            for item in await self.item_repo.get_many_by_ids_with_owner(missing):
+                body = dumps(_item_to_dict(item, _owner_email(item)))
+                found[item.id] = body
+                _item_l1.set(item.id, body)
+                backfill[_l2_key(item.id)] = _to_l2(body)
+            await cache_set_many(backfill, CACHE_TTL, stale_ttl_seconds=CACHE_STALE_TTL, codec=_l2_codec)
+        return [found[id] for id in ids if id in found]
+
+    async def list_items(self, skip: int = 0, limit: int = 20) -> list[dict[str, Any]]:
+        """Paginated list with owner (eager loading in repo), as ItemWithOwnerResponse-shaped dicts."""
         items = await self.item_repo.get_many_with_owner(skip=skip, limit=limit)
-        return [_item_to_response(i) for i in items]
+        return [_item_to_dict(i, _owner_email(i)) for i in items]
+
+    async def list_items_page(self, after_id: int | None = None, limit: int = 20) -> dict[str, Any]:
+        """
+        Keyset-paginated list: same cost for every page. Fetches limit+1 to detect the last page.
+        Returns an ItemPage-shaped dict.
+        """
+        items = await self.item_repo.get_many_with_owner(limit=limit + 1, after_id=after_id or 0)
+        has_more = len(items) > limit
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].id) if has_more else None
+        return {"items": [_item_to_dict(i, _owner_email(i)) for i in items], "next_cursor": next_cursor}
 
     async def update(self, id: int, data: ItemUpdate) -> ItemWithOwnerResponse | None:
-        """Update item, invalidate cache, re-index in queue."""
+        """Update item, invalidate cache, re-index via the outbox."""
         item = await self.item_repo.get_by_id_with_owner(id)
         if not item:
             return None
@@ -100,17 +306,38 @@ class ItemService:
             item.price_cents = data.price_cents
         await self.item_repo.session.flush()
         await self.item_repo.session.refresh(item)
-        await cache_delete(CACHE_PREFIX + str(id))
-        index_item_task.delay(_item_to_doc(item))
+        await _invalidate_item_caches(self.item_repo.session, [id])
+        await self.outbox_repo.add_many(SEARCH_ITEM_TOPIC, [id])
         return _item_to_response(item)
 
     async def delete(self, id: int) -> bool:
-        """Delete item, invalidate cache, remove from search index."""
-        item = await self.item_repo.get_by_id(id)
-        if not item:
-            return False
-        await self.item_repo.delete(item)
-        await cache_delete(CACHE_PREFIX + str(id))
-        from app.search.elasticsearch_client import remove_item_from_index
-        await remove_item_from_index(id)
-        return True
+        """Delete item, invalidate cache; the outbox relay removes it from the search index."""
+        return bool(await self.bulk_delete([id]))
+
+    async def bulk_delete(self, ids: list[int], owner_id: int | None = None) -> list[int]:
+        """
+        Delete by ids (only owner_id's items when given): one DELETE ... RETURNING, one pipelined
+        cache invalidation, one outbox INSERT (the relay turns it into _bulk delete actions).
+        Returns deleted ids.
+        """
+        deleted = await self.item_repo.delete_many(list(dict.fromkeys(ids)), owner_id=owner_id)
+        await _invalidate_item_caches(self.item_repo.session, deleted)
+        await self.outbox_repo.add_many(SEARCH_ITEM_TOPIC, deleted)
+        return deleted
+
+    async def delete_owner_items(self, owner_id: int) -> int:
+        """
+        Delete every item of one owner in chunks of bulk_max_items (each chunk: one DELETE ...
+        RETURNING and one pipelined cache invalidation), then one outbox event that the relay
+        turns into a single delete_by_query. Returns the number of deleted items.
+        """
+        total = 0
+        while True:
+            deleted = await self.item_repo.delete_by_owner(owner_id, limit=settings.bulk_max_items)
+            await _invalidate_item_caches(self.item_repo.session, deleted)
+            total += len(deleted)
+            if len(deleted) < settings.bulk_max_items:
+                break
+        if total:
+            await self.outbox_repo.add_many(SEARCH_OWNER_DELETED_TOPIC, [owner_id])
+        return total
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Regression benchmark for the API hot paths: list (20 and 100 items), get by id (cold and warm cache), create,
+search, login.
+Runs the app in-process (ASGITransport) on a throwaway SQLite DB (or --database-url, e.g. a local
+Postgres) with Redis and Elasticsearch replaced by in-memory fakes (benchmarks/fakes.py), so the
+numbers cover routing, validation, services, caches and the DB, not network hops.
+Writes req/s, CPU per request and p50/p95/p99 per scenario to --output (JSON) and compares against
+--baseline. Exits non-zero if any scenario's req/s drops or p95/CPU grows by more than --tolerance.
+  python benchmarks/api_suite.py
+  python benchmarks/api_suite.py --requests 2000 --concurrency 16 --only list get_warm
+  python benchmarks/api_suite.py --update-baseline   # after an intended change, on the CI machine
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from common import app_client, percentile
+from fakes import install_fakes
+from httpx import AsyncClient, Response
+from sqlalchemy import insert, select
+
+from app.core import principal_cache
+from app.core.security import create_access_token, hash_password
+from app.db.models import Item, User
+from app.search.search_cache import clear_local_search_cache
+from app.services.item_service import clear_local_item_cache
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_BASELINE = HERE / "baseline.json"
+DEFAULT_OUTPUT = HERE / "results" / "api_suite.json"
+
+EMAIL = "bench@example.com"
+PASSWORD = "password123"
+WORDS = ["laptop", "phone", "camera", "desk", "chair", "monitor", "keyboard", "speaker"]
+HOT_IDS = 10  # get_warm cycles over this many items
+
+# Login is bounded by bcrypt, not the API; fewer requests keep the suite quick
+REQUEST_SCALE = {"login": 0.05}
+
+Call = Callable[[AsyncClient, int], Awaitable[Response]]
+
+
+def _item_row(i: int, owner_id: int) -> dict:
+    word = WORDS[i % len(WORDS)]
+    return {"title": f"{word.title()} {i}", "description": f"bench {word}", "price_cents": 100 + i, "owner_id": owner_id}
+
+
+async def _seed(maker, n_items: int) -> tuple[int, list[dict]]:
+    """One user with a real password hash plus n_items items. Returns (user id, search documents)."""
+    async with maker() as s:
+        user = User(email=EMAIL, hashed_password=hash_password(PASSWORD), full_name="Bench")
+        s.add(user)
+        await s.flush()
+        rows = [_item_row(i, user.id) for i in range(n_items)]
+        for start in range(0, len(rows), 5000):
+            await s.execute(insert(Item), rows[start : start + 5000])
+        await s.commit()
+        items = (await s.execute(select(Item.id, Item.title, Item.description, Item.price_cents))).all()
+    docs = [
+        {"id": id, "title": title, "description": description, "price_cents": price, "owner_id": user.id}
+        for id, title, description, price in items
+    ]
+    return user.id, docs
+
+
+def _scenarios(item_ids: list[int], user_id: int) -> dict[str, Call]:
+    headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+    hot = item_ids[:HOT_IDS]
+
+    def list_items(client, i):
+        return client.get("/api/v1/items", params={"limit": 20})
+
+    def list_100(client, i):
+        return client.get("/api/v1/items", params={"limit": 100})
+
+    def get_cold(client, i):
+        # Every request asks for an item no earlier request has loaded (caches flushed before the run)
+        return client.get(f"/api/v1/items/{item_ids[i % len(item_ids)]}")
+
+    def get_warm(client, i):
+        return client.get(f"/api/v1/items/{hot[i % len(hot)]}")
+
+    def create(client, i):
+        return client.post("/api/v1/items", headers=headers, json=_item_row(i, user_id))
+
+    def search(client, i):
+        # Distinct (q, skip) per request: measures the engine path, not just search cache hits
+        word = WORDS[i % len(WORDS)]
+        return client.get("/api/v1/search/items", params={"q": word, "skip": i // len(WORDS), "limit": 20})
+
+    def login(client, i):
+        return client.post("/api/v1/users/login", json={"email": EMAIL, "password": PASSWORD})
+
+    return {
+        "list": list_items,
+        "list_100": list_100,
+        "get_cold": get_cold,
+        "get_warm": get_warm,
+        "create": create,
+        "search": search,
+        "login": login,
+    }
+
+
+async def _run_scenario(client: AsyncClient, call: Call, n_requests: int, concurrency: int) -> dict:
+    """n_requests calls spread over concurrency clients; latency per request, throughput over wall time."""
+    latencies: list[float] = []
+    errors: dict[int, int] = {}
+    next_index = iter(range(n_requests))
+
+    async def worker() -> None:
+        for i in next_index:
+            start = time.perf_counter()
+            r = await call(client, i)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if r.status_code >= 400:
+                errors[r.status_code] = errors.get(r.status_code, 0) + 1
+
+    start, cpu_start = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+    return {
+        "requests": n_requests,
+        "rps": round(n_requests / elapsed, 1),
+        # Process CPU per request (server and in-process client together; compare runs, not absolutes)
+        "cpu_ms": round(cpu * 1000 / n_requests, 3),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "errors": {str(code): count for code, count in sorted(errors.items())},
+    }
+
+
+def _reset_caches(redis) -> None:
+    clear_local_item_cache()
+    clear_local_search_cache()
+    principal_cache.clear()
+    redis.flushall()
+
+
+async def run(
+    names: list[str], n_requests: int, concurrency: int, n_items: int, database_url: str | None
+) -> dict[str, dict]:
+    results = {}
+    async with app_client(database_url) as (client, maker):
+        user_id, docs = await _seed(maker, max(n_items, n_requests))
+        with install_fakes(docs) as (redis, _):
+            scenarios = _scenarios([doc["id"] for doc in docs], user_id)
+            for _ in range(20):  # warm-up: imports, first-request paths, connection pool
+                await scenarios["list"](client, 0)
+            for name in names:
+                _reset_caches(redis)
+                if name == "get_warm":
+                    for i in range(HOT_IDS):
+                        await scenarios[name](client, i)
+                count = max(1, int(n_requests * REQUEST_SCALE.get(name, 1.0)))
+                results[name] = await _run_scenario(client, scenarios[name], count, concurrency)
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Regressions vs. baseline: req/s below (1 - tolerance)x, or p95 / CPU per request above (1 + tolerance)x."""
+    failures = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            failures.append(f"{name}: {current['rps']:.1f} req/s vs baseline {base['rps']:.1f}")
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            failures.append(f"{name}: p95 {current['p95_ms']:.2f} ms vs baseline {base['p95_ms']:.2f} ms")
+        if "cpu_ms" in base and current["cpu_ms"] > base["cpu_ms"] * (1 + tolerance):
+            failures.append(f"{name}: CPU {current['cpu_ms']:.2f} ms/req vs baseline {base['cpu_ms']:.2f} ms/req")
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser(description="API hot path throughput and latency vs. a stored baseline")
+    ap.add_argument("--only", nargs="+", choices=list(_scenarios([0], 0)), help="Run a subset of scenarios")
+    ap.add_argument("--requests", type=int, default=1000, help="Requests per scenario (login runs 5%%)")
+    ap.add_argument("--concurrency", type=int, default=8, help="Concurrent in-process clients")
+    ap.add_argument("--items", type=int, default=1000, help="Items seeded before the run")
+    ap.add_argument("--database-url", help="Async SQLAlchemy URL (default: throwaway SQLite)")
+    ap.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    ap.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    ap.add_argument("--tolerance", type=float, default=0.3, help="Allowed relative regression (0.3 = 30%%)")
+    ap.add_argument("--update-baseline", action="store_true", help="Write this run's results as the baseline")
+    args = ap.parse_args()
+
+    names = args.only or list(_scenarios([0], 0))
+    results = asyncio.run(run(names, args.requests, args.concurrency, args.items, args.database_url))
+    for name, r in results.items():
+        print(
+            f"{name:>9}: {r['rps']:8.1f} req/s  cpu={r['cpu_ms']:6.2f} ms/req  p50={r['p50_ms']:7.2f} ms  "
+            f"p95={r['p95_ms']:7.2f} ms  p99={r['p99_ms']:7.2f} ms  errors={r['errors'] or 0}"
+        )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": "sqlite" if args.database_url is None else args.database_url.split(":", 1)[0],
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "items": args.items,
+        },
+        "scenarios": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"results written to {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline updated: {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+    failures = compare(results, json.loads(args.baseline.read_text())["scenarios"], args.tolerance)
+    if any(r["errors"] for r in results.values()):
+        failures.append("requests failed: " + ", ".join(f"{n}={r['errors']}" for n, r in results.items() if r["errors"]))
+    if failures:
+        print(f"FAIL: regression beyond {args.tolerance:.0%} of baseline")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"OK: within {args.tolerance:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
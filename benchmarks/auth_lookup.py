@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Regression benchmark: auth cost must not grow with the number of items a user owns.
+Seeds a throwaway SQLite DB with one user per size, then times get_current_user_id.
+Exits non-zero if the largest owner is more than --max-ratio slower than the empty one.
+  python benchmarks/auth_lookup.py
+  python benchmarks/auth_lookup.py --sizes 0 1000 100000 --iterations 500
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.dependencies import get_current_user_id
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.models import Item, User
+
+
+async def _seed_owner(session: AsyncSession, n_items: int) -> int:
+    user = User(email=f"owner{n_items}@example.com", hashed_password="x", full_name="Owner")
+    session.add(user)
+    await session.flush()
+    rows = [{"title": f"Item {i}", "price_cents": i, "owner_id": user.id} for i in range(n_items)]
+    for start in range(0, len(rows), 5000):
+        await session.execute(insert(Item), rows[start:start + 5000])
+    await session.commit()
+    return user.id
+
+
+async def _time_auth(session: AsyncSession, user_id: int, iterations: int) -> float:
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token(user_id))
+    await get_current_user_id(session, creds)  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await get_current_user_id(session, creds)
+    return (time.perf_counter() - start) / iterations
+
+
+async def run(sizes: list[int], iterations: int) -> dict[int, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        results = {}
+        async with maker() as session:
+            owners = {n: await _seed_owner(session, n) for n in sizes}
+            for n, user_id in owners.items():
+                results[n] = await _time_auth(session, user_id, iterations)
+        await engine.dispose()
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Auth lookup cost vs. number of owned items")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[0, 1_000, 20_000])
+    ap.add_argument("--iterations", type=int, default=200)
+    ap.add_argument("--max-ratio", type=float, default=2.0, help="Fail if largest/smallest latency exceeds this")
+    args = ap.parse_args()
+
+    sizes = sorted(set(args.sizes))
+    results = asyncio.run(run(sizes, args.iterations))
+    for n in sizes:
+        print(f"items={n:>8}  auth={results[n] * 1e6:9.1f} us/op")
+    ratio = results[sizes[-1]] / results[sizes[0]]
+    print(f"ratio largest/smallest: {ratio:.2f} (max {args.max_ratio})")
+    if ratio > args.max_ratio:
+        print("FAIL: auth cost grows with owned items")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
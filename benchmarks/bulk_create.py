@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: items/second through POST /items/bulk vs. one POST /items per item.
+In-process app on SQLite. Indexing is recorded in the outbox table inside the write
+transaction (no broker call), so the numbers measure the API + DB write path; the outbox
+rows each path leaves for the relay are reported too.
+  python benchmarks/bulk_create.py
+  python benchmarks/bulk_create.py --items 20000 --batch 2000 --single-items 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from common import app_client
+
+from sqlalchemy import func, select
+
+from app.core.security import create_access_token
+from app.db.models import OutboxEvent, User
+
+
+def _item(i: int, owner_id: int) -> dict:
+    return {"title": f"Bench item {i}", "description": "bulk benchmark", "price_cents": i, "owner_id": owner_id}
+
+
+async def run(n_items: int, batch: int, n_single: int) -> dict:
+    async with app_client() as (client, maker):
+
+        async def outbox_rows() -> int:
+            async with maker() as s:
+                return await s.scalar(select(func.count()).select_from(OutboxEvent))
+
+        async with maker() as s:
+            user = User(email="bulk@example.com", hashed_password="x", full_name="Bulk")
+            s.add(user)
+            await s.commit()
+        headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+        start = time.perf_counter()
+        for i in range(n_single):
+            r = await client.post("/api/v1/items", headers=headers, json=_item(i, user.id))
+            r.raise_for_status()
+        single_s = time.perf_counter() - start
+        single_rows = await outbox_rows()
+
+        start = time.perf_counter()
+        for offset in range(0, n_items, batch):
+            rows = [_item(i, user.id) for i in range(offset, min(offset + batch, n_items))]
+            r = await client.post("/api/v1/items/bulk", headers=headers, json={"items": rows})
+            r.raise_for_status()
+        bulk_s = time.perf_counter() - start
+        bulk_rows = await outbox_rows() - single_rows
+
+    return {
+        "single": (n_single / single_s, single_rows),
+        "bulk": (n_items / bulk_s, bulk_rows),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bulk vs single item create throughput")
+    ap.add_argument("--items", type=int, default=10_000, help="Items created through the bulk endpoint")
+    ap.add_argument("--batch", type=int, default=1_000, help="Items per bulk request")
+    ap.add_argument("--single-items", type=int, default=300, help="Items created one request at a time")
+    args = ap.parse_args()
+
+    result = asyncio.run(run(args.items, args.batch, args.single_items))
+    for path, (rate, rows) in result.items():
+        print(f"{path:>6}: {rate:9.0f} items/s  outbox rows={rows}")
+    print(f"speedup: {result['bulk'][0] / result['single'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
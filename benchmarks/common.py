@@ -0,0 +1,54 @@
+"""
+Shared benchmark harness: run the app in-process (ASGITransport) on a throwaway SQLite DB.
+"""
+
+import sys
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.db.session import get_db
+from app.main import app
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of samples (pct in 0..100)."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+@asynccontextmanager
+async def app_client(database_url: str | None = None) -> AsyncIterator[tuple[AsyncClient, async_sessionmaker]]:
+    """
+    Yield (client, session maker) for the app wired to a fresh database.
+    Requests get their own committing session, like get_db in production.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(database_url or f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def override_get_db():
+            async with maker() as session:
+                try:
+                    yield session
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                yield client, maker
+        finally:
+            app.dependency_overrides.clear()
+            await engine.dispose()
@@ -0,0 +1,174 @@
+"""
+In-memory stand-ins for Redis and Elasticsearch, so benchmarks measure the API, not the network.
+Only the calls the app makes are implemented. install_fakes() swaps them in for the duration of a run.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from app.cache import redis_client
+from app.core.circuit_breaker import reset_breakers
+from app.search import elasticsearch_client as es_client
+from app.search.engines import reset_search_engine
+
+
+class FakeRedis:
+    """Dict with per-key expiry; enough of redis.asyncio.Redis for the cache, locks and generation."""
+
+    def __init__(self):
+        self._data: dict[str, tuple[str | bytes, float | None]] = {}
+        self.published = 0
+
+    def _live(self, key: str) -> str | bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def _put(self, key: str, value: Any, ttl_seconds: float | None) -> None:
+        expires = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        self._data[key] = (value if isinstance(value, bytes) else str(value), expires)
+
+    async def get(self, key: str) -> str | bytes | None:
+        return self._live(key)
+
+    async def mget(self, keys: list[str]) -> list[str | bytes | None]:
+        return [self._live(key) for key in keys]
+
+    async def execute_command(self, command: str, *args: Any, **options: Any) -> Any:
+        # Raw GET/MGET (NEVER_DECODE): values are returned as stored, bytes included
+        if command == "GET":
+            return await self.get(*args)
+        if command == "MGET":
+            return await self.mget(list(args))
+        raise NotImplementedError(command)
+
+    async def set(self, key: str, value: Any, nx: bool = False, px: int | None = None) -> bool:
+        if nx and self._live(key) is not None:
+            return False
+        self._put(key, value, px / 1000 if px is not None else None)
+        return True
+
+    async def setex(self, key: str, ttl_seconds: int, value: Any) -> bool:
+        self._put(key, value, ttl_seconds)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key: str) -> int:
+        value = int(self._live(key) or 0) + 1
+        self._put(key, value, None)
+        return value
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published += 1
+        return 0
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        # Only script in use: compare-and-delete lock release
+        if self._live(key) == token:
+            return await self.delete(key)
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    def flushall(self) -> None:
+        self._data.clear()
+
+
+class FakePipeline:
+    """Queues calls and runs them on execute(), like a non-transactional redis pipeline."""
+
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._calls: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._calls.clear()
+
+    def __getattr__(self, name: str):
+        def queue(*args):
+            self._calls.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        calls, self._calls = self._calls, []
+        return [await getattr(self._redis, name)(*args) for name, args in calls]
+
+
+class FakeElasticsearch:
+    """Term match over title/description; supports the search call made by search_items_raw."""
+
+    def __init__(self, docs: list[dict[str, Any]] | None = None):
+        self.docs: dict[int, dict[str, Any]] = {doc["id"]: doc for doc in docs or []}
+
+    async def index(self, index: str, id: str, document: dict[str, Any]) -> dict:
+        self.docs[int(id)] = document
+        return {"result": "created"}
+
+    async def delete(self, index: str, id: str, ignore: Any = None) -> dict:
+        self.docs.pop(int(id), None)
+        return {"result": "deleted"}
+
+    async def search(
+        self,
+        index: str,
+        query: dict,
+        from_: int = 0,
+        size: int = 10,
+        track_total_hits: int | bool = True,
+        aggs: dict | None = None,
+        **kwargs,
+    ) -> dict:
+        terms = query["multi_match"]["query"].lower().split()
+        matches = [
+            doc
+            for doc in self.docs.values()
+            if any(t in f"{doc.get('title', '')} {doc.get('description') or ''}".lower() for t in terms)
+        ]
+        body: dict[str, Any] = {
+            "hits": {
+                "total": {"value": len(matches), "relation": "eq"},
+                "hits": [{"_source": doc} for doc in matches[from_ : from_ + size]],
+            }
+        }
+        if aggs:
+            body["aggregations"] = {"price": {"buckets": []}, "owners": {"buckets": []}}
+        return body
+
+
+@contextmanager
+def install_fakes(es_docs: list[dict[str, Any]] | None = None) -> Iterator[tuple[FakeRedis, FakeElasticsearch]]:
+    """Point the app's Redis and Elasticsearch clients at fresh fakes; restore the real getters on exit."""
+    redis, es = FakeRedis(), FakeElasticsearch(es_docs)
+    real_get_redis, real_get_es = redis_client.get_redis, es_client.get_elasticsearch
+
+    async def get_fake_redis():
+        return redis
+
+    async def get_fake_es():
+        return es
+
+    redis_client.get_redis = get_fake_redis
+    es_client.get_elasticsearch = get_fake_es
+    reset_breakers()
+    reset_search_engine()
+    try:
+        yield redis, es
+    finally:
+        redis_client.get_redis = real_get_redis
+        es_client.get_elasticsearch = real_get_es
+        reset_breakers()
+        reset_search_engine()
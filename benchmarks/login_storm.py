@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Load benchmark: /health latency must stay flat while logins saturate the bcrypt pool.
+Runs the app in-process (ASGITransport) on a throwaway SQLite DB. Measures /health latency
+idle, then again while --concurrency clients hammer POST /users/login.
+Exits non-zero if p99 under the storm exceeds --max-p99-ms.
+  python benchmarks/login_storm.py
+  python benchmarks/login_storm.py --concurrency 64 --duration 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from common import app_client, percentile
+from httpx import AsyncClient
+
+from app.core.security import hash_password
+from app.db.models import User
+
+EMAIL = "storm@example.com"
+PASSWORD = "password123"
+
+
+async def _probe_health(client: AsyncClient, duration: float, interval: float) -> list[float]:
+    """
+    Sample /health latency (ms) for duration seconds on a fixed schedule.
+    Latency is measured from the scheduled send time, so time the event loop spends
+    blocked before the probe even starts is counted (no coordinated omission).
+    """
+    samples = []
+    scheduled = time.perf_counter()
+    deadline = scheduled + duration
+    while scheduled < deadline:
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        r = await client.get("/api/v1/health")
+        r.raise_for_status()
+        samples.append((time.perf_counter() - scheduled) * 1000)
+        scheduled += interval
+    return samples
+
+
+async def _login_loop(client: AsyncClient, stop: asyncio.Event, counts: dict[int, int]) -> None:
+    while not stop.is_set():
+        r = await client.post("/api/v1/users/login", json={"email": EMAIL, "password": PASSWORD})
+        counts[r.status_code] = counts.get(r.status_code, 0) + 1
+
+
+async def run(concurrency: int, duration: float, interval: float) -> dict:
+    async with app_client() as (client, maker):
+        async with maker() as s:
+            s.add(User(email=EMAIL, hashed_password=hash_password(PASSWORD), full_name="Storm"))
+            await s.commit()
+        idle = await _probe_health(client, duration / 2, interval)
+        stop = asyncio.Event()
+        counts: dict[int, int] = {}
+        workers = [asyncio.create_task(_login_loop(client, stop, counts)) for _ in range(concurrency)]
+        await asyncio.sleep(0.5)  # let the pool saturate
+        storm = await _probe_health(client, duration, interval)
+        stop.set()
+        await asyncio.gather(*workers)
+    return {"idle": idle, "storm": storm, "logins": counts}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="/health latency during a login storm")
+    ap.add_argument("--concurrency", type=int, default=32, help="Concurrent login clients")
+    ap.add_argument("--duration", type=float, default=5.0, help="Seconds to probe under load")
+    ap.add_argument("--interval", type=float, default=0.01, help="Seconds between /health probes")
+    ap.add_argument("--max-p99-ms", type=float, default=50.0)
+    args = ap.parse_args()
+
+    result = asyncio.run(run(args.concurrency, args.duration, args.interval))
+    for phase in ("idle", "storm"):
+        samples = result[phase]
+        print(
+            f"{phase:>5}: n={len(samples):5d}  p50={statistics.median(samples):7.2f} ms  "
+            f"p99={percentile(samples, 99):7.2f} ms  max={max(samples):7.2f} ms"
+        )
+    print(f"logins by status: {result['logins']}")
+    p99 = percentile(result["storm"], 99)
+    if p99 > args.max_p99_ms:
+        print(f"FAIL: /health p99 {p99:.2f} ms under login storm exceeds {args.max_p99_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: server-side CPU per request for read endpoints.
+Calls the ASGI app directly (no HTTP client in the measurement) on a throwaway SQLite DB with
+Redis/Elasticsearch fakes, and reports the best of --repeats rounds of process CPU per request.
+Use it to compare serialization and caching changes (run before and after on the same machine).
+The L2-hit scenario drops the in-process item cache before each request, so it measures a Redis
+hit; compare the item L2 formats with ITEM_CACHE_BINARY=false.
+  python benchmarks/response_cpu.py
+  python benchmarks/response_cpu.py --requests 1000 --repeats 7
+"""
+
+import argparse
+import asyncio
+import time
+
+from api_suite import _seed
+from common import app_client
+from fakes import install_fakes
+
+from app.main import app
+from app.services.item_service import clear_local_item_cache
+
+BATCH_IDS = b"ids=" + ",".join(map(str, range(1, 21))).encode()
+
+# (label, path, query string, run before every request)
+ENDPOINTS = [
+    ("GET /items?limit=100", "/api/v1/items", b"limit=100", None),
+    ("GET /items?after=&limit=100", "/api/v1/items", b"after=&limit=100", None),
+    ("GET /items/{id} (L1 hit)", "/api/v1/items/1", b"", None),
+    ("GET /items/{id} (L2 hit)", "/api/v1/items/1", b"", clear_local_item_cache),
+    ("GET /items/batch (20 ids)", "/api/v1/items/batch", BATCH_IDS, None),
+    ("GET /items/batch (20 L2 hits)", "/api/v1/items/batch", BATCH_IDS, clear_local_item_cache),
+]
+
+
+async def _call(path: str, query_string: bytes) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string,
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    status = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(scope, receive, send)
+    if status != [200]:
+        raise RuntimeError(f"{path}?{query_string.decode()} returned {status}")
+
+
+async def run(n_requests: int, repeats: int, n_items: int) -> dict[str, float]:
+    results = {}
+    async with app_client() as (client, maker):
+        _, docs = await _seed(maker, n_items)
+        with install_fakes(docs):
+            for label, path, query_string, before in ENDPOINTS:
+                for _ in range(50):  # warm-up (and fills the item caches)
+                    await _call(path, query_string)
+                best = float("inf")
+                for _ in range(repeats):
+                    start = time.process_time()
+                    for _ in range(n_requests):
+                        if before:
+                            before()
+                        await _call(path, query_string)
+                    best = min(best, (time.process_time() - start) / n_requests)
+                results[label] = best
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Server-side CPU per request for read endpoints")
+    ap.add_argument("--requests", type=int, default=300, help="Requests per round")
+    ap.add_argument("--repeats", type=int, default=5, help="Rounds per endpoint (best is reported)")
+    ap.add_argument("--items", type=int, default=1000, help="Items seeded before the run")
+    args = ap.parse_args()
+
+    results = asyncio.run(run(args.requests, args.repeats, args.items))
+    for label, seconds in results.items():
+        print(f"{label:>30}: {seconds * 1000:7.3f} ms CPU/request")
+
+
+if __name__ == "__main__":
+    main()
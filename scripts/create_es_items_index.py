@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Create the Elasticsearch 'items' index with raw HTTP (no Python ES client).
+Like scripts/reindex_from_db.py, it creates a versioned index (items_<timestamp>) behind the
+'items' alias, so a later reindex_from_db.py run can swap the alias.
 Use this when the index keeps returning 503 no_shard_available even after --reset-index:
   python scripts/create_es_items_index.py
 
@@ -18,10 +20,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import httpx
 from app.config import get_settings
+from app.search.reindex import versioned_index_name
 
 ITEMS_INDEX = "items"
 
 BODY = {
+    "aliases": {ITEMS_INDEX: {}},
     "settings": {
         "index": {
             "number_of_replicas": 0
@@ -30,7 +34,11 @@ BODY = {
     "mappings": {
         "properties": {
             "id": {"type": "integer"},
-            "title": {"type": "text", "analyzer": "standard"},
+            "title": {
+                "type": "text",
+                "analyzer": "standard",
+                "fields": {"suggest": {"type": "search_as_you_type"}},
+            },
             "description": {"type": "text", "analyzer": "standard"},
             "price_cents": {"type": "integer"},
             "owner_id": {"type": "integer"},
@@ -43,21 +51,21 @@ BODY = {
 def main():
     settings = get_settings()
     base = settings.elasticsearch_url.rstrip("/")
-    url = f"{base}/{ITEMS_INDEX}"
+    index = versioned_index_name()
 
     with httpx.Client(timeout=30.0) as client:
-        # Check if exists
-        r = client.head(url)
+        # Check if exists (index or alias)
+        r = client.head(f"{base}/{ITEMS_INDEX}")
         if r.status_code == 200:
             print(f"Index '{ITEMS_INDEX}' already exists. Delete it first if you want to recreate:")
-            print(f"  curl -X DELETE '{base}/{ITEMS_INDEX}'")
+            print("  python scripts/reindex_elasticsearch.py --reset-index")
             return
-        r = client.put(url, json=BODY)
+        r = client.put(f"{base}/{index}", json=BODY)
         if r.status_code not in (200, 201):
             print(f"Failed to create index: {r.status_code}")
             print(r.text[:500])
             sys.exit(1)
-    print(f"Created index '{ITEMS_INDEX}' with number_of_replicas=0.")
+    print(f"Created index '{index}' (alias '{ITEMS_INDEX}') with number_of_replicas=0.")
     print("Run: python scripts/reindex_elasticsearch.py   (no --reset-index)")
 
 
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Outbox relay: publish committed item changes from the outbox_events table to the search
+index (ES _bulk by default, or batched Celery tasks). Run one or more next to the API:
+  python scripts/outbox_relay.py
+  python scripts/outbox_relay.py --target celery --batch-size 1000
+  python scripts/outbox_relay.py --retry-dead-letters   # re-queue parked events, then exit
+
+Reads DATABASE_URL, ELASTICSEARCH_URL, CELERY_BROKER_URL and OUTBOX_* from .env.
+"""
+
+import argparse
+import logging
+import signal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import get_settings
+from app.queue.outbox_relay import (
+    delete_owner_in_elasticsearch,
+    delete_owner_via_celery,
+    publish_to_celery,
+    publish_to_elasticsearch,
+    retry_dead_letters,
+    run,
+)
+from app.search.reindex import sync_engine
+
+
+def main():
+    settings = get_settings()
+    ap = argparse.ArgumentParser(description="Publish outbox events to the search index")
+    ap.add_argument("--target", choices=["elasticsearch", "celery"], default=settings.outbox_relay_target)
+    ap.add_argument("--batch-size", type=int, default=settings.outbox_batch_size, help="Events per poll")
+    ap.add_argument(
+        "--poll-interval", type=float, default=settings.outbox_poll_interval_seconds, help="Seconds between idle polls"
+    )
+    ap.add_argument(
+        "--retry-dead-letters", action="store_true", help="Make events parked after OUTBOX_MAX_ATTEMPTS live again"
+    )
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.retry_dead_letters:
+        print(f"Re-queued {retry_dead_letters(sync_engine())} dead-lettered events.")
+        return
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    if args.target == "celery":
+        publish, publish_owner = publish_to_celery, delete_owner_via_celery
+    else:
+        publish, publish_owner = publish_to_elasticsearch, delete_owner_in_elasticsearch
+    print(f"Outbox relay -> {args.target} (batch {args.batch_size}, poll {args.poll_interval}s)")
+    run(
+        sync_engine(),
+        publish,
+        args.batch_size,
+        args.poll_interval,
+        should_stop=lambda: stopping,
+        publish_owner=publish_owner,
+    )
+
+
+if __name__ == "__main__":
+    main()
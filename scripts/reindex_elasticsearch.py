@@ -3,6 +3,8 @@
 Reindex all existing items from DB into Elasticsearch via Celery.
 Use this after fixing the worker or when the index was empty; no new data is created.
 Requires: API running (to fetch items). Celery worker must be running to process the queue.
+For large catalogs prefer scripts/reindex_from_db.py (streams from PostgreSQL, bounded
+memory, zero-downtime alias swap); this script holds every item in memory.
 
 If you get 503 / no_shard_available from Elasticsearch, delete the broken index and reindex:
   python scripts/reindex_elasticsearch.py --reset-index
@@ -18,7 +20,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import httpx
-from app.queue.tasks import index_item_task
+from app.config import get_settings
+from app.queue.tasks import index_items_task
 
 API_BASE = "http://localhost:8000/api/v1"
 PAGE_SIZE = 100  # API max_page_size
@@ -28,11 +31,16 @@ def delete_items_index():
     """Delete the items index so Celery will recreate it with number_of_replicas=0 (single-node safe)."""
     from app.search.elasticsearch_client import ITEMS_INDEX, _sync_es_client
     es = _sync_es_client()
-    if es.indices.exists(index=ITEMS_INDEX):
-        es.indices.delete(index=ITEMS_INDEX)
-        print(f"Deleted index '{ITEMS_INDEX}'. Celery will recreate it when processing the first task.")
+    # After reindex_from_db.py, 'items' is an alias (which cannot be deleted): delete the indices behind it
+    if es.indices.exists_alias(name=ITEMS_INDEX):
+        indices = list(es.indices.get_alias(name=ITEMS_INDEX).body)
+    elif es.indices.exists(index=ITEMS_INDEX):
+        indices = [ITEMS_INDEX]
     else:
         print(f"Index '{ITEMS_INDEX}' does not exist (already deleted or never created).")
+        return
+    es.indices.delete(index=",".join(indices))
+    print(f"Deleted {', '.join(indices)}. Celery will recreate '{ITEMS_INDEX}' when processing the first task.")
 
 
 def main():
@@ -66,8 +74,8 @@ def main():
         print("No items in DB. Run seed_data.py first or create items via the UI.")
         return
 
-    for it in items:
-        doc = {
+    docs = [
+        {
             "id": it["id"],
             "title": it["title"],
             "description": it.get("description") or "",
@@ -75,7 +83,12 @@ def main():
             "owner_id": it["owner_id"],
             "created_at": it.get("created_at"),  # keep as-is (string from API)
         }
-        index_item_task.delay(doc)
+        for it in items
+    ]
+    # One _bulk task per index_batch_size docs, like the outbox relay's Celery target
+    size = get_settings().index_batch_size
+    for start in range(0, len(docs), size):
+        index_items_task.delay(docs[start:start + size])
 
     print(f"Enqueued {len(items)} items for Elasticsearch reindex. Ensure Celery worker is running.")
     print("Wait a few seconds, then try Search in the UI or: curl -s 'http://localhost:9200/items/_count?pretty'")
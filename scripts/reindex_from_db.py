@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Zero-downtime full reindex: stream items from PostgreSQL into a new versioned
+Elasticsearch index, then atomically swap the 'items' alias to it.
+No API or Celery worker needed; memory stays bounded regardless of catalog size.
+  python scripts/reindex_from_db.py
+  python scripts/reindex_from_db.py --batch-size 5000 --chunk-size 2000 --delete-old
+
+Reads DATABASE_URL and ELASTICSEARCH_URL from .env (psycopg2 is used, like Alembic).
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.search.reindex import ReindexStats, reindex
+
+
+def print_progress(stats: ReindexStats) -> None:
+    print(f"  {stats.indexed:>10,} indexed  {stats.failed:>6,} failed  {stats.docs_per_second:>9,.0f} docs/s")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Stream DB -> new versioned ES index -> swap alias")
+    ap.add_argument("--batch-size", type=int, default=2_000, help="Rows per server-side cursor fetch")
+    ap.add_argument("--chunk-size", type=int, default=1_000, help="Documents per _bulk request")
+    ap.add_argument("--delete-old", action="store_true", help="Delete indices previously behind the alias")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    print("Reindexing items from PostgreSQL...")
+    stats = reindex(
+        batch_size=args.batch_size,
+        chunk_size=args.chunk_size,
+        delete_old=args.delete_old,
+        progress=print_progress,
+    )
+    print(
+        f"Done: index '{stats.index}' now behind alias 'items'. "
+        f"{stats.indexed:,} indexed, {stats.failed:,} failed in {stats.seconds:.1f}s "
+        f"({stats.docs_per_second:,.0f} docs/s)."
+    )
+    if stats.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
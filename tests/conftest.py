@@ -16,6 +16,14 @@ from app.main import app
 from app.db.session import get_db
 from app.db.models import User, Item
 from app.core.security import hash_password, create_access_token
+from app.core import principal_cache
+from app.core.circuit_breaker import reset_breakers
+from app.core.readiness import clear_readiness_cache
+from app.core.resources import resources
+from app.services.item_service import clear_local_item_cache
+from app.search.engines import reset_search_engine
+from app.search.generation import clear_local_generation
+from app.search.search_cache import clear_local_search_cache
 
 
 # Use in-memory SQLite for speed in unit tests (or same PostgreSQL for integration)
@@ -29,6 +37,19 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_local_caches():
+    """In-process caches outlive a test; SQLite ids are reused, so start every test cold."""
+    principal_cache.clear()
+    clear_local_item_cache()
+    clear_local_generation()
+    clear_local_search_cache()
+    reset_search_engine()
+    reset_breakers()
+    clear_readiness_cache()
+    yield
+
+
 @pytest_asyncio.fixture
 async def engine():
     engine = create_async_engine(
@@ -56,6 +77,8 @@ async def client(session: AsyncSession):
         yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    # ASGITransport skips the lifespan (pool warm-up); the test DB session is already open
+    resources.ready = True
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
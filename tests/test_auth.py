@@ -0,0 +1,55 @@
+"""
+Auth dependency tests - token resolution stays cheap regardless of user data size.
+"""
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import event
+
+from app.core import principal_cache
+from app.core.dependencies import get_current_user_id
+from app.core.security import create_access_token
+from app.db.models import Item
+
+
+@pytest.mark.asyncio
+async def test_auth_lookup_does_not_load_items(engine, session, test_user):
+    """get_current_user_id issues one users-only query, even when the user owns items."""
+    session.add_all([Item(title=f"Item {i}", owner_id=test_user.id) for i in range(50)])
+    await session.flush()
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token(test_user.id))
+        assert await get_current_user_id(session, creds) == test_user.id
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 1
+    assert "items" not in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_auth_uses_principal_cache(engine, session, test_user):
+    """Second request with the same token skips the DB; evicting the user forces a lookup."""
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token(test_user.id))
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    await get_current_user_id(session, creds)
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        assert await get_current_user_id(session, creds) == test_user.id
+        assert statements == []
+        principal_cache.handle_invalidation_message(str(test_user.id))
+        assert await get_current_user_id(session, creds) == test_user.id
+        assert len(statements) == 1
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
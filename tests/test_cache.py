@@ -0,0 +1,244 @@
+"""
+Cache layer tests - stampede protection and the item L1 tier work even when Redis is unreachable.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from app.cache import redis_client
+from app.db.models import Item
+from app.db.repositories import ItemRepository, UserRepository
+from app.services import item_service
+
+
+@pytest.fixture
+def redis_down(monkeypatch):
+    async def _unavailable():
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(redis_client, "get_redis", _unavailable)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once(redis_down):
+    """Concurrent misses for one key in a worker share a single loader call."""
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"id": 1}
+
+    results = await asyncio.gather(
+        *(redis_client.cache_get_or_load("item:1", loader, 60) for _ in range(20))
+    )
+    assert calls == 1
+    assert all(r == {"id": 1} for r in results)
+
+
+@pytest.mark.asyncio
+async def test_loader_error_propagates_and_clears_inflight(redis_down):
+    """A failed load is not cached; the next caller retries."""
+
+    async def failing():
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        await redis_client.cache_get_or_load("item:2", failing, 60)
+
+    async def ok():
+        return {"id": 2}
+
+    assert await redis_client.cache_get_or_load("item:2", ok, 60) == {"id": 2}
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_serves_stale_value(redis_down, monkeypatch):
+    """The caller refreshing a stale entry gets the cached value, not the loader's error."""
+
+    async def stale_entry(key):
+        return json.dumps({"v": {"id": 3}, "t": 0.0, "d": 0.01})
+
+    async def failing():
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(redis_client, "cache_get", stale_entry)
+    assert await redis_client.cache_get_or_load("item:3", failing, 60) == {"id": 3}
+
+
+def test_early_refresh_probability_grows_near_expiry():
+    """XFetch never refreshes far from expiry and always refreshes past it."""
+    far = {"v": 1, "t": 1_000.0, "d": 0.01}
+    assert not any(redis_client._should_refresh_early(far, 0.0, 1.0) for _ in range(100))
+    assert all(redis_client._should_refresh_early(far, 1_000.0, 1.0) for _ in range(100))
+
+
+@pytest.mark.asyncio
+async def test_item_l1_serves_repeat_reads_without_db(redis_down, engine, session, test_user):
+    """Second read of an item comes from L1 (no SQL); a pub/sub invalidation evicts it."""
+    item = Item(title="Hot", owner_id=test_user.id)
+    session.add(item)
+    await session.flush()
+    svc = item_service.ItemService(ItemRepository(session), UserRepository(session))
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    first = await svc.get_json_by_id(item.id)
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        assert await svc.get_json_by_id(item.id) is first  # L1 holds the serialized response
+        assert statements == []
+        item_service.handle_item_invalidation_message(str(item.id))
+        assert (await svc.get_by_id(item.id)).id == item.id
+        assert statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.mark.asyncio
+async def test_item_caches_are_evicted_again_after_commit(redis_down, monkeypatch, tmp_path):
+    """A read that caches the old row before commit is evicted once get_db commits; rollback skips it."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from app.db import session as db_session
+    from app.db.base import Base
+    from app.db.models import User
+    from app.schemas.item import ItemUpdate
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/commit.db")  # this test commits
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as setup:
+        item = Item(title="Old", owner=User(email="o@example.com", hashed_password="x", full_name="O"))
+        setup.add(item)
+        await setup.commit()
+    monkeypatch.setattr(db_session, "async_session_maker", maker)
+
+    request = db_session.get_db()
+    request_session = await request.__anext__()
+    svc = item_service.ItemService(ItemRepository(request_session), UserRepository(request_session))
+    await svc.update(item.id, ItemUpdate(title="New"))
+    item_service._item_l1.set(item.id, b"stale")  # a concurrent reader, before the commit
+    with pytest.raises(StopAsyncIteration):
+        await request.__anext__()
+    assert item_service._item_l1.get(item.id) is None
+
+    request = db_session.get_db()
+    request_session = await request.__anext__()
+    db_session.run_after_commit(request_session, pytest.fail)
+    with pytest.raises(RuntimeError):
+        await request.athrow(RuntimeError("handler failed"))
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_unknown_item_counts_as_l2_miss(redis_down, session):
+    """A lookup that finds nothing (404) must not raise the reported L2 hit ratio."""
+    from prometheus_client import REGISTRY
+
+    def l2(result):
+        return REGISTRY.get_sample_value("item_cache_requests_total", {"tier": "l2", "result": result}) or 0
+
+    hits, misses = l2("hit"), l2("miss")
+    svc = item_service.ItemService(ItemRepository(session), UserRepository(session))
+    assert await svc.get_json_by_id(999999) is None
+    assert (l2("hit"), l2("miss")) == (hits, misses + 1)
+
+def test_binary_entries_round_trip_and_reject_other_schemas():
+    """Binary entries return the stored bytes (compressed or not); another schema or format is a miss."""
+    body = b'{"id":1,"title":"' + b"x" * 500 + b'"}'
+    plain = redis_client.BinaryCodec(schema=1)
+    packed = redis_client.BinaryCodec(schema=1, compress_min_bytes=256)
+    for codec in (plain, packed):
+        entry = codec.decode(codec.encode(body, 1_000.0, 0.5))
+        assert entry == {"v": body, "t": 1_000.0, "d": 0.5}
+    assert len(packed.encode(body, 0.0, 0.0)) < len(body)
+    assert redis_client.BinaryCodec(schema=2).decode(plain.encode(body, 0.0, 0.0)) is None
+    assert plain.decode(b'{"v": 1, "t": 0}') is None
+
+
+@pytest.mark.asyncio
+async def test_item_l2_hit_returns_stored_response_bytes(redis_down, monkeypatch, engine, session, test_user):
+    """In binary mode Redis holds the response body: an L2 hit returns it unchanged without SQL."""
+    store: dict[str, bytes] = {}
+
+    async def fake_get_bytes(key):
+        return store.get(key)
+
+    async def fake_set(key, value, ttl_seconds=300):
+        store[key] = value
+        return True
+
+    monkeypatch.setattr(redis_client, "cache_get_bytes", fake_get_bytes)
+    monkeypatch.setattr(redis_client, "cache_set", fake_set)
+    item = Item(title="Warm", owner_id=test_user.id)
+    session.add(item)
+    await session.flush()
+    svc = item_service.ItemService(ItemRepository(session), UserRepository(session))
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    body = await svc.get_json_by_id(item.id)
+    assert store[item_service.BODY_CACHE_PREFIX + str(item.id)].endswith(body)
+    item_service.clear_local_item_cache()
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        assert await svc.get_json_by_id(item.id) == body
+        assert statements == []
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.mark.asyncio
+async def test_search_cache_hits_l1_and_follows_generation(monkeypatch):
+    """Repeat (normalized) queries skip ES; a new index generation misses; errors are not cached."""
+    from app.search import search_cache
+
+    generation = 1
+    es_calls = []
+
+    async def fake_generation():
+        return generation
+
+    laptop = {"results": [{"id": 1, "title": "Laptop"}], "total": 1, "total_relation": "eq"}
+
+    async def fake_search(query, skip, limit, facets=False):
+        es_calls.append(query)
+        return laptop
+
+    async def no_l2_get(key):
+        return None
+
+    async def no_l2_set(key, value, ttl):
+        return False
+
+    engine = SimpleNamespace(name="elasticsearch", cacheable=True, search=fake_search)
+    monkeypatch.setattr(search_cache, "current_generation", fake_generation)
+    monkeypatch.setattr(search_cache, "get_search_engine", lambda: engine)
+    monkeypatch.setattr(search_cache, "cache_get", no_l2_get)
+    monkeypatch.setattr(search_cache, "cache_set", no_l2_set)
+
+    assert await search_cache.search_items_cached("Laptop", 0, 20) == laptop
+    assert await search_cache.search_items_cached("  laptop ", 0, 20) == laptop
+    assert len(es_calls) == 1
+
+    generation = 2
+    await search_cache.search_items_cached("laptop", 0, 20)
+    assert len(es_calls) == 2
+
+    async def es_down(query, skip, limit, facets=False):
+        raise ConnectionError("es down")
+
+    engine.search = es_down
+    assert (await search_cache.search_items_cached("phone", 0, 20))["results"] == []
+    engine.search = fake_search
+    assert (await search_cache.search_items_cached("phone", 0, 20))["results"] != []
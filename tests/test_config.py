@@ -0,0 +1,20 @@
+"""
+Settings tests - per-worker connection budgets.
+"""
+
+from app.config import Settings
+
+
+def test_pool_share_splits_budgets_and_keeps_zero_off():
+    """Each worker gets at least one connection of a budget, and none of a zero budget."""
+    settings = Settings(web_concurrency=4)
+    assert settings.pool_share(10) == 2
+    assert settings.pool_share(3) == 1
+    assert settings.pool_share(0) == 0
+
+
+def test_max_workers_is_capped_by_the_smallest_nonzero_budget():
+    """DB_MAX_OVERFLOW=0 turns overflow off; it must not cap the server at one worker."""
+    assert Settings(db_pool_size=10, db_max_overflow=20).max_workers() == 10
+    assert Settings(db_pool_size=10, db_max_overflow=0).max_workers() == 10
+    assert Settings(db_pool_size=6, elasticsearch_max_connections=4).max_workers() == 4
@@ -21,3 +21,133 @@ async def test_ready(client: AsyncClient):
     response = await client.get("/api/v1/health/ready")
     assert response.status_code == 200
     assert response.json()["status"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_ready_reports_open_circuit_and_redis_fails_fast(client: AsyncClient, monkeypatch):
+    """After N Redis failures cache calls stop touching Redis; readiness shows the open circuit."""
+    from app.cache import redis_client
+
+    attempts = []
+
+    async def redis_down():
+        attempts.append(1)
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(redis_client, "get_redis", redis_down)
+    threshold = redis_client.REDIS_BREAKER.failure_threshold
+    for _ in range(threshold + 10):
+        assert await redis_client.cache_get("item:1") is None
+    assert len(attempts) == threshold
+
+    data = (await client.get("/api/v1/health/ready")).json()
+    assert data["status"] == "ready"
+    assert data["degraded"] is True
+    assert data["circuits"]["redis"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_route_templates_and_dependency_timing(client: AsyncClient):
+    """Requests are labeled by route template; repository calls show up as dependency timings."""
+    from prometheus_client import REGISTRY
+
+    def sample(name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    route = {"method": "GET", "route": "/api/v1/items/{item_id}", "status": "404"}
+    db_call = {"dependency": "postgres", "operation": "get_by_id_with_owner"}
+    requests_before = sample("http_requests_total", **route)
+    db_before = sample("dependency_call_duration_seconds_count", **db_call)
+
+    assert (await client.get("/api/v1/items/999999")).status_code == 404
+
+    assert sample("http_requests_total", **route) == requests_before + 1
+    assert sample("dependency_call_duration_seconds_count", **db_call) > db_before
+    assert sample("http_requests_in_progress", method="GET") == 0
+    metrics = (await client.get("/metrics/")).text
+    assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/api/v1/items/{item_id}"}' in metrics
+
+
+@pytest.mark.asyncio
+async def test_ready_only_between_warm_up_and_shutdown(client: AsyncClient, monkeypatch):
+    """Readiness waits for every pool to be warmed (failures included) and drops before pools close."""
+    from app.api.v1.endpoints import health
+    from app.core.resources import ResourceRegistry
+
+    events = []
+    registry = ResourceRegistry()
+
+    def resource(name, fail=False):
+        async def warm_up():
+            events.append(f"warm {name}")
+            if fail:
+                raise ConnectionError(f"{name} down")
+
+        async def close():
+            events.append(f"close {name} ready={registry.ready}")
+
+        registry.register(name, warm_up, close)
+
+    resource("postgres")
+    resource("elasticsearch", fail=True)
+    monkeypatch.setattr(health, "resources", registry)
+
+    response = await client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    assert response.json()["resources"] == {"postgres": "cold", "elasticsearch": "cold"}
+
+    await registry.start(timeout=1.0)
+    data = (await client.get("/api/v1/health/ready")).json()
+    assert data["status"] == "ready"
+    assert data["resources"] == {"postgres": "warm", "elasticsearch": "failed"}
+
+    await registry.stop()
+    assert (await client.get("/api/v1/health/ready")).status_code == 503
+    assert events[2:] == ["close elasticsearch ready=False", "close postgres ready=False"]
+
+
+@pytest.mark.asyncio
+async def test_ready_pings_dependencies_concurrently_and_caches_the_result(client: AsyncClient, monkeypatch):
+    """Required dependency down -> 503; optional one down -> degraded; one round of pings per cache period."""
+    import asyncio
+
+    from prometheus_client import REGISTRY
+
+    from app.core import readiness
+
+    calls = []
+
+    def ping(name, delay=0.05, error=None):
+        async def check():
+            calls.append(name)
+            await asyncio.sleep(delay)
+            if error:
+                raise error
+
+        return check
+
+    monkeypatch.setattr(readiness, "_checks", {})
+    monkeypatch.setattr(readiness.settings, "readiness_check_timeout_seconds", 0.2)
+    readiness.register_check("postgres", ping("postgres"))
+    readiness.register_check("redis", ping("redis", error=ConnectionError("refused")))
+    readiness.register_check("elasticsearch", ping("elasticsearch", delay=5))
+
+    start = asyncio.get_running_loop().time()
+    responses = await asyncio.gather(*(client.get("/api/v1/health/ready") for _ in range(5)))
+    assert asyncio.get_running_loop().time() - start < 1  # concurrent, slow ES cut off by the timeout
+    assert calls == ["postgres", "redis", "elasticsearch"]  # five probes, one round
+    data = responses[0].json()
+    assert responses[0].status_code == 200
+    assert data["status"] == "ready" and data["degraded"] is True
+    assert data["checks"]["postgres"]["ok"] is True
+    assert data["checks"]["redis"]["error"] == "refused"
+    assert "timed out" in data["checks"]["elasticsearch"]["error"]
+    assert REGISTRY.get_sample_value("readiness_check_up", {"dependency": "redis"}) == 0
+    assert REGISTRY.get_sample_value("readiness_check_latency_seconds", {"dependency": "elasticsearch"}) >= 0.2
+
+    readiness.register_check("postgres", ping("postgres", error=ConnectionError("pool exhausted")))
+    assert (await client.get("/api/v1/health/ready")).status_code == 200  # still cached
+    readiness.clear_readiness_cache()
+    response = await client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
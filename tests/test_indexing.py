@@ -0,0 +1,160 @@
+"""
+Search indexing pipeline tests - _bulk failures, reindex streaming and the outbox relay (no Elasticsearch needed).
+"""
+
+import pytest
+
+from app.search import elasticsearch_client as es_client
+
+
+def test_versioned_actions_use_external_gte():
+    """Outbox versions become external_gte versions; unversioned actions stay plain."""
+    action = es_client.index_action({"id": 1, "title": "t"}, version=42)
+    assert (action["version"], action["version_type"]) == (42, "external_gte")
+    assert es_client.delete_action(1, version=43)["version"] == 43
+    assert "version" not in es_client.index_action({"id": 1, "title": "t"})
+
+
+def test_bulk_sync_returns_only_failed_actions(monkeypatch):
+    """Failures are matched by _id even when results come back out of order; missing deletes are fine."""
+
+    def fake_streaming_bulk(es, actions, **kwargs):
+        yield False, {"delete": {"_id": "4", "status": 404}}
+        yield False, {"index": {"_id": "2", "status": 400, "error": "mapper_parsing_exception"}}
+        yield True, {"index": {"_id": "1", "status": 201}}
+
+    monkeypatch.setattr(es_client, "_sync_es_client", lambda: None)
+    monkeypatch.setattr(es_client.helpers, "streaming_bulk", fake_streaming_bulk)
+    actions = [es_client.index_action({"id": i, "title": "t"}) for i in (1, 2)]
+    actions.append({"_op_type": "delete", "_index": es_client.ITEMS_INDEX, "_id": "4"})
+    assert es_client.bulk_sync(actions) == [actions[1]]
+
+
+def test_reindex_streams_item_docs_from_db(tmp_path):
+    """stream_item_docs yields ES documents from a server-side cursor in id order."""
+    from sqlalchemy import create_engine, insert
+
+    from app.db.base import Base
+    from app.db.models import Item, User
+    from app.search.reindex import stream_item_docs
+
+    engine = create_engine(f"sqlite:///{tmp_path}/reindex.db")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": 1, "email": "o@example.com", "hashed_password": "x", "full_name": "O"}])
+        conn.execute(insert(Item), [{"title": f"T{i}", "owner_id": 1, "price_cents": i} for i in range(5)])
+
+    docs = list(stream_item_docs(engine, batch_size=2))
+    assert [d["title"] for d in docs] == [f"T{i}" for i in range(5)]
+    assert docs[0]["description"] == "" and docs[0]["owner_id"] == 1
+    engine.dispose()
+
+
+def test_outbox_relay_publishes_current_rows_and_keeps_failures(tmp_path):
+    """Events collapse per item; vanished rows become deletes; unpublished events stay for the next poll."""
+    from sqlalchemy import create_engine, insert, select
+
+    from app.db.base import Base
+    from app.db.models import Item, OutboxEvent, User
+    from app.db.models.outbox import SEARCH_ITEM_TOPIC
+    from app.queue.outbox_relay import relay_batch
+
+    engine = create_engine(f"sqlite:///{tmp_path}/outbox.db")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": 1, "email": "o@example.com", "hashed_password": "x", "full_name": "O"}])
+        conn.execute(insert(Item), [{"id": i, "title": f"T{i}", "owner_id": 1} for i in (1, 2)])
+        conn.execute(insert(OutboxEvent), [{"topic": SEARCH_ITEM_TOPIC, "entity_id": i} for i in (1, 2, 1, 3)])
+
+    published = []
+
+    def publish(docs, deleted_ids, versions):
+        published.append(([d["id"] for d in docs], deleted_ids, versions))
+        return {2}  # item 2 could not be published
+
+    assert relay_batch(engine, publish, batch_size=100) == 3
+    assert published == [([1, 2], [3], {1: 3, 2: 2, 3: 4})]  # newest event id per item
+    with engine.connect() as conn:
+        assert conn.execute(select(OutboxEvent.entity_id, OutboxEvent.attempts)).all() == [(2, 1)]
+
+    assert relay_batch(engine, lambda docs, deleted, versions: set(), batch_size=100) == 1
+    assert relay_batch(engine, publish, batch_size=100) == 0
+    engine.dispose()
+
+
+def test_outbox_relay_parks_rejected_events_but_not_unreachable_targets(tmp_path):
+    """Rejections count attempts up to a dead letter; a target that is down counts nothing."""
+    from sqlalchemy import create_engine, insert, select
+
+    from app.db.base import Base
+    from app.db.models import OutboxEvent
+    from app.db.models.outbox import SEARCH_ITEM_TOPIC
+    from app.queue.outbox_relay import relay_batch, retry_dead_letters
+
+    engine = create_engine(f"sqlite:///{tmp_path}/outbox.db")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(OutboxEvent), [{"topic": SEARCH_ITEM_TOPIC, "entity_id": 7}])
+
+    def unreachable(docs, deleted_ids, versions):
+        raise ConnectionError("es down")
+
+    def reject(docs, deleted_ids, versions):
+        return set(deleted_ids)
+
+    def attempts():
+        with engine.connect() as conn:
+            return conn.execute(select(OutboxEvent.attempts)).scalar_one()
+
+    with pytest.raises(ConnectionError):
+        relay_batch(engine, unreachable, batch_size=10, max_attempts=2)
+    assert attempts() == 0
+    relay_batch(engine, reject, batch_size=10, max_attempts=2)
+    relay_batch(engine, reject, batch_size=10, max_attempts=2)
+    assert attempts() == 2
+    assert relay_batch(engine, lambda docs, deleted, versions: set(), batch_size=10, max_attempts=2) == 0  # parked
+
+    assert retry_dead_letters(engine) == 0  # below the configured outbox_max_attempts
+    with engine.begin() as conn:
+        conn.execute(OutboxEvent.__table__.update().values(attempts=100))
+    assert retry_dead_letters(engine) == 1
+    assert relay_batch(engine, lambda docs, deleted, versions: set(), batch_size=10, max_attempts=2) == 1
+    engine.dispose()
+
+
+def test_owner_deletion_waits_for_older_item_events_and_spares_current_rows(tmp_path):
+    """An owner event is published after older item events, once per owner, keeping rows that still exist."""
+    from sqlalchemy import create_engine, insert, select
+
+    from app.db.base import Base
+    from app.db.models import Item, OutboxEvent, User
+    from app.db.models.outbox import SEARCH_ITEM_TOPIC, SEARCH_OWNER_DELETED_TOPIC
+    from app.queue.outbox_relay import relay_batch, relay_owner_deletions
+
+    engine = create_engine(f"sqlite:///{tmp_path}/outbox.db")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": 1, "email": "o@example.com", "hashed_password": "x", "full_name": "O"}])
+        conn.execute(insert(Item), [{"id": 5, "title": "Created after the delete", "owner_id": 1}])
+        conn.execute(
+            insert(OutboxEvent),
+            [
+                {"topic": SEARCH_ITEM_TOPIC, "entity_id": 4},
+                {"topic": SEARCH_OWNER_DELETED_TOPIC, "entity_id": 1},
+                {"topic": SEARCH_OWNER_DELETED_TOPIC, "entity_id": 1},
+                {"topic": SEARCH_ITEM_TOPIC, "entity_id": 5},
+            ],
+        )
+
+    deletions = []
+
+    def publish_owner(owner_id, keep_ids):
+        deletions.append((owner_id, keep_ids))
+
+    assert relay_owner_deletions(engine, publish_owner, batch_size=10) == 0  # item 4 is still pending
+    relay_batch(engine, lambda docs, deleted, versions: set(), batch_size=1)
+    assert relay_owner_deletions(engine, publish_owner, batch_size=10) == 2
+    assert deletions == [(1, [5])]
+    with engine.connect() as conn:
+        assert conn.execute(select(OutboxEvent.entity_id)).scalars().all() == [5]
+    engine.dispose()
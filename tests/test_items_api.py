@@ -44,3 +44,201 @@ async def test_create_item_with_auth(client: AsyncClient, auth_headers: dict, te
     assert data["title"] == "Test Item"
     assert data["price_cents"] == 999
     assert "id" in data
+
+
+@pytest.mark.asyncio
+async def test_list_items_cursor_mode(client: AsyncClient, session, test_user):
+    """GET /api/v1/items?after= walks all items with next_cursor; last page has no cursor."""
+    from app.db.models import Item
+
+    session.add_all(
+        [Item(title=f"Item {i}", price_cents=i, owner_id=test_user.id) for i in range(5)]
+    )
+    await session.flush()
+
+    seen = []
+    after = ""
+    while True:
+        response = await client.get("/api/v1/items", params={"after": after, "limit": 2})
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(i["id"] for i in page["items"])
+        if page["next_cursor"] is None:
+            break
+        after = page["next_cursor"]
+    assert len(seen) == 5
+    assert seen == sorted(seen)
+
+
+@pytest.mark.asyncio
+async def test_list_items_invalid_cursor(client: AsyncClient):
+    """Malformed cursor returns 400 instead of 500."""
+    response = await client.get("/api/v1/items", params={"after": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_item_by_id(client: AsyncClient, session, test_user):
+    """GET /api/v1/items/{id} returns the item with owner email; unknown id is 404."""
+    from app.db.models import Item
+
+    item = Item(title="Cached", price_cents=5, owner_id=test_user.id)
+    session.add(item)
+    await session.flush()
+
+    response = await client.get(f"/api/v1/items/{item.id}")
+    assert response.status_code == 200
+    assert response.json()["owner_email"] == test_user.email
+    assert (await client.get("/api/v1/items/999999")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_items_batch(client: AsyncClient, session, test_user):
+    """GET /api/v1/items/batch returns found items in request order, skipping unknown ids."""
+    from app.db.models import Item
+
+    items = [Item(title=f"Batch {i}", owner_id=test_user.id) for i in range(3)]
+    session.add_all(items)
+    await session.flush()
+    ids = [items[2].id, 999999, items[0].id, items[2].id]
+
+    response = await client.get("/api/v1/items/batch", params={"ids": ",".join(map(str, ids))})
+    assert response.status_code == 200
+    assert [i["id"] for i in response.json()] == [items[2].id, items[0].id]
+    assert (await client.get("/api/v1/items/batch", params={"ids": "1,x"})).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_and_update_items(client: AsyncClient, auth_headers: dict, test_user, session):
+    """POST/PUT /api/v1/items/bulk write many items and record indexing in the outbox (same transaction)."""
+    from sqlalchemy import select
+
+    from app.db.models import Item, OutboxEvent, User
+
+    async def outbox_ids():
+        return list((await session.scalars(select(OutboxEvent.entity_id).order_by(OutboxEvent.id))).all())
+
+    response = await client.post(
+        "/api/v1/items/bulk",
+        headers=auth_headers,
+        json={"items": [{"title": f"Bulk {i}", "price_cents": i, "owner_id": test_user.id} for i in (2, 0, 1)]},
+    )
+    assert response.status_code == 201
+    created = response.json()
+    # response[i] is request item i
+    assert [(i["title"], i["price_cents"]) for i in created] == [("Bulk 2", 2), ("Bulk 0", 0), ("Bulk 1", 1)]
+    assert [i["id"] for i in created] == sorted(i["id"] for i in created)
+    assert all(i["owner_email"] == test_user.email for i in created)
+    assert await outbox_ids() == [i["id"] for i in created]
+
+    other = User(email="other@example.com", hashed_password="x", full_name="Other")
+    session.add(other)
+    await session.flush()
+    foreign = Item(title="Not mine", price_cents=7, owner_id=other.id)
+    session.add(foreign)
+    await session.flush()
+
+    response = await client.put(
+        "/api/v1/items/bulk",
+        headers=auth_headers,
+        json={
+            "items": [
+                {"id": created[0]["id"], "price_cents": 42},
+                {"id": 999999, "title": "nope"},
+                {"id": foreign.id, "price_cents": 0},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    assert [(i["id"], i["price_cents"]) for i in response.json()] == [(created[0]["id"], 42)]
+    assert (await outbox_ids())[-1] == created[0]["id"]
+    await session.refresh(foreign)
+    assert foreign.price_cents == 7
+
+    response = await client.post(
+        "/api/v1/items/bulk",
+        headers=auth_headers,
+        json={"items": [{"title": "Orphan", "owner_id": 999999}]},
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_by_ids_and_owner(
+    client: AsyncClient, auth_headers: dict, session, test_user, monkeypatch
+):
+    """Bulk delete by ids queues per-item index deletes; by owner it is chunked, one outbox event. Both only
+    touch the caller's items unless the caller is an admin."""
+    from sqlalchemy import select
+
+    from app.config import get_settings
+    from app.db.models import Item, OutboxEvent, User
+    from app.db.models.outbox import SEARCH_ITEM_TOPIC, SEARCH_OWNER_DELETED_TOPIC
+
+    settings = get_settings()
+    other = User(email="other@example.com", hashed_password="x", full_name="Other")
+    session.add(other)
+    await session.flush()
+    items = [Item(title=f"Del {i}", owner_id=test_user.id if i < 3 else other.id) for i in range(8)]
+    session.add_all(items)
+    await session.flush()
+    ids = [item.id for item in items]
+
+    response = await client.post(
+        "/api/v1/items/bulk/delete", headers=auth_headers, json={"ids": [ids[0], ids[1], 999999]}
+    )
+    assert response.status_code == 200 and response.json() == {"deleted": 2}
+
+    response = await client.post("/api/v1/items/bulk/delete", headers=auth_headers, json={"ids": ids[3:5]})
+    assert response.status_code == 200 and response.json() == {"deleted": 0}
+    response = await client.post("/api/v1/items/bulk/delete", headers=auth_headers, json={"owner_id": other.id})
+    assert response.status_code == 403
+
+    monkeypatch.setattr(settings, "admin_user_ids", [test_user.id])
+    monkeypatch.setattr(settings, "bulk_max_items", 2)  # 5 items -> 3 chunks
+    response = await client.post("/api/v1/items/bulk/delete", headers=auth_headers, json={"owner_id": other.id})
+    assert response.json() == {"deleted": 5}
+
+    remaining = (await session.scalars(select(Item.id).where(Item.id.in_(ids)))).all()
+    assert remaining == [ids[2]]
+    queued = (await session.execute(select(OutboxEvent.topic, OutboxEvent.entity_id))).all()
+    assert sorted(queued) == sorted(
+        [(SEARCH_ITEM_TOPIC, ids[0]), (SEARCH_ITEM_TOPIC, ids[1]), (SEARCH_OWNER_DELETED_TOPIC, other.id)]
+    )
+
+    monkeypatch.setattr(settings, "admin_user_ids", [])
+    response = await client.post("/api/v1/items/bulk/delete", headers=auth_headers, json={"owner_id": test_user.id})
+    assert response.json() == {"deleted": 1}
+
+    bad = await client.post("/api/v1/items/bulk/delete", headers=auth_headers, json={"ids": [1], "owner_id": 1})
+    assert bad.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_fast_path_bodies_match_response_model(client: AsyncClient, auth_headers: dict, test_user):
+    """List, detail (cold and cached) and batch skip response_model but serialize exactly like it."""
+    from datetime import datetime, timezone
+
+    from app.core.responses import dumps
+    from app.schemas.item import ItemWithOwnerResponse
+
+    created = await client.post(
+        "/api/v1/items",
+        headers=auth_headers,
+        json={"title": "Fast", "description": None, "price_cents": 5, "owner_id": test_user.id},
+    )
+    item_id = created.json()["id"]
+    bodies = [
+        (await client.get("/api/v1/items", params={"limit": 100})).json()[-1],
+        (await client.get("/api/v1/items", params={"after": ""})).json()["items"][-1],
+        (await client.get(f"/api/v1/items/{item_id}")).json(),
+        (await client.get(f"/api/v1/items/{item_id}")).json(),
+        (await client.get("/api/v1/items/batch", params={"ids": str(item_id)})).json()[0],
+    ]
+    expected = ItemWithOwnerResponse.model_validate(bodies[0]).model_dump(mode="json")
+    assert bodies == [expected] * len(bodies)
+    assert expected["owner_email"] == test_user.email
+
+    aware = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    model = ItemWithOwnerResponse(id=1, title="t", owner_id=1, created_at=aware, updated_at=aware)
+    assert dumps(model.model_dump()) == model.model_dump_json().encode()
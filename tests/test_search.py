@@ -0,0 +1,155 @@
+"""
+Search API tests - Elasticsearch replaced by an in-memory fake.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from app.search import elasticsearch_client as es_client, search_cache
+from app.search.engines import ElasticsearchEngine, FailoverEngine
+
+
+class FakePitES:
+    """Serves sorted docs through PIT + search_after; counts open PITs."""
+
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+        self.open_pits: set[str] = set()
+
+    async def open_point_in_time(self, index, keep_alive):
+        pit_id = f"pit-{len(self.open_pits)}"
+        self.open_pits.add(pit_id)
+        return {"id": pit_id}
+
+    async def search(self, pit, sort, size, search_after=None, **kwargs):
+        start = search_after[1] + 1 if search_after else 0
+        hits = [
+            {"_source": doc, "sort": [1.0, position]}
+            for position, doc in enumerate(self.docs)
+        ][start : start + size]
+        return {"pit_id": pit["id"], "hits": {"hits": hits}}
+
+    async def close_point_in_time(self, id):
+        self.open_pits.discard(id)
+
+
+@pytest.mark.asyncio
+async def test_search_cursor_mode_walks_all_pages(client: AsyncClient, monkeypatch):
+    """after= walks a PIT snapshot to the end, then closes it."""
+    fake = FakePitES([{"id": i, "title": f"laptop {i}"} for i in range(5)])
+
+    async def fake_get_es():
+        return fake
+
+    monkeypatch.setattr(es_client, "get_elasticsearch", fake_get_es)
+    seen, after = [], ""
+    while after is not None:
+        response = await client.get("/api/v1/search/items", params={"q": "laptop", "after": after, "limit": 2})
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(hit["id"] for hit in data["results"])
+        after = data["next_cursor"]
+    assert seen == [0, 1, 2, 3, 4]
+    assert fake.open_pits == set()
+
+    bad = await client.get("/api/v1/search/items", params={"q": "laptop", "after": "garbage"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_returns_total_and_facets_from_one_request(client: AsyncClient, monkeypatch):
+    """total comes from hits.total (bounded by track_total_hits); facets ride on the same request."""
+    requests = []
+
+    class FakeES:
+        async def search(self, **kwargs):
+            requests.append(kwargs)
+            return {
+                "hits": {
+                    "total": {"value": 10_000, "relation": "gte"},
+                    "hits": [{"_source": {"id": 1, "title": "laptop"}}],
+                },
+                "aggregations": {
+                    "price": {"buckets": [{"key": 0.0, "doc_count": 7}, {"key": 1000.0, "doc_count": 3}]},
+                    "owners": {"buckets": [{"key": 42, "doc_count": 9}]},
+                },
+            }
+
+    async def fake_get_es():
+        return FakeES()
+
+    async def no_generation():
+        return None
+
+    monkeypatch.setattr(es_client, "get_elasticsearch", fake_get_es)
+    monkeypatch.setattr(search_cache, "current_generation", no_generation)
+    response = await client.get("/api/v1/search/items", params={"q": "laptop", "limit": 1, "facets": "true"})
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["total"], data["total_relation"], data["count"]) == (10_000, "gte", 1)
+    assert data["facets"] == {
+        "price": [{"from": 0, "count": 7}, {"from": 1000, "count": 3}],
+        "owners": [{"owner_id": 42, "count": 9}],
+    }
+    assert len(requests) == 1
+    assert requests[0]["track_total_hits"] == es_client.settings.search_track_total_hits
+
+
+@pytest.mark.asyncio
+async def test_suggest_uses_prefix_subfield_and_source_filtering(client: AsyncClient, monkeypatch):
+    requests = []
+
+    class FakeES:
+        async def search(self, **kwargs):
+            requests.append(kwargs)
+            return {"hits": {"hits": [{"_source": {"id": 3, "title": "Laptop stand"}}]}}
+
+    async def fake_get_es():
+        return FakeES()
+
+    monkeypatch.setattr(es_client, "get_elasticsearch", fake_get_es)
+    response = await client.get("/api/v1/search/suggest", params={"q": "lap"})
+    assert response.status_code == 200
+    assert response.json()["suggestions"] == [{"id": 3, "title": "Laptop stand"}]
+    query = requests[0]["query"]["multi_match"]
+    assert query["type"] == "bool_prefix" and "fuzziness" not in query
+    assert all(field.startswith("title.suggest") for field in query["fields"])
+    assert requests[0]["source"] == ["id", "title"]
+    mapping = es_client._items_index_mappings()["properties"]["title"]
+    assert mapping["fields"]["suggest"]["type"] == "search_as_you_type"
+
+
+@pytest.mark.asyncio
+async def test_search_fails_over_to_postgres_and_stops_calling_dead_es(monkeypatch):
+    """ES failures trip its breaker; while open, PostgreSQL answers without touching ES."""
+    es_attempts = []
+
+    class DeadES:
+        async def search(self, **kwargs):
+            es_attempts.append(kwargs)
+            raise ConnectionError("es down")
+
+    async def fake_get_es():
+        return DeadES()
+
+    class Postgres:
+        name, cacheable = "postgres", False
+
+        async def search(self, query, skip=0, limit=20, facets=False):
+            return {"results": [{"id": 1}], "total": 1, "total_relation": "eq"}
+
+    monkeypatch.setattr(es_client, "get_elasticsearch", fake_get_es)
+    breaker = es_client.ELASTICSEARCH_BREAKER
+    monkeypatch.setattr(breaker, "failure_threshold", 2)
+    failover = FailoverEngine(ElasticsearchEngine(), Postgres())
+
+    for _ in range(4):
+        result = await failover.search("laptop")
+        assert result["degraded"] is True and result["results"] == [{"id": 1}]
+    assert len(es_attempts) == 2
+    assert breaker.state == "open"
+
+    monkeypatch.setattr(breaker, "reset_seconds", 0)  # next call is the half-open probe
+    await failover.search("laptop")
+    monkeypatch.setattr(breaker, "reset_seconds", 60)
+    assert len(es_attempts) == 3 and breaker.state == "open"  # failed probe re-opens